@@ -0,0 +1,340 @@
+"""
+Benchmark suite of the configuration loading pipeline.
+
+Every combination of provider (file, secret, storage) and format (env, json, yaml) loads generated payloads of the
+requested sizes and key counts. Each stage is timed separately:
+  - fetch:        ConfigProvider.get_config()
+  - parse:        the format's parser (python-dotenv, or the selected JSON/YAML parser backend)
+  - nest:         DefaultEnvConfigProcessor.process() (env only)
+  - validate:     pydantic validation of the parsed tree
+  - load:         the loader's load(), with an empty parsed-config cache
+  - load_cached:  the loader's load() when the payload was parsed before
+
+The file provider reads from a temporary directory. The secret and storage providers are the real provider classes
+served by in-memory Secret Manager and GCS clients, so their rows measure the library's own overhead, not the
+network. Payloads above Secret Manager's 64 KiB limit are skipped for secrets, as are size and key count pairs
+that cannot be generated (e.g. 100k keys in 1 KB). python-dotenv's parsing time grows with keys x bytes (about 4 s
+for 8,000 keys in 860 KB), so env cases whose estimated parse time exceeds --max-case-seconds are skipped too.
+
+Results can be written as JSON (--output) and compared with the results of another run (--compare), e.g. between
+two releases.
+
+Usage:
+    python benchmarks/bench_config_loading.py
+    python benchmarks/bench_config_loading.py --full --output results.json
+    python benchmarks/bench_config_loading.py --sizes 1KB 1MB --keys 10 10000 --compare results.json
+"""
+
+import argparse
+import datetime
+import io
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import yaml
+from dotenv import dotenv_values
+from pydantic import TypeAdapter
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from config_loaders import (  # noqa: E402
+    ClientPool,
+    ConfigLoader,
+    ConfigProvider,
+    DefaultEnvConfigProcessor,
+    EnvConfigLoader,
+    FileConfigProvider,
+    GcpSecretConfigProvider,
+    GcpStorageConfigProvider,
+    JsonConfigLoader,
+    ParsedConfigCache,
+    ParserBackendRegistry,
+    YamlConfigLoader,
+)
+
+PROVIDERS = ("file", "secret", "storage")
+FORMATS = ("env", "json", "yaml")
+QUICK_SIZES = ("1KB", "64KB", "1MB")
+QUICK_KEYS = (10, 1_000)
+FULL_SIZES = ("1KB", "64KB", "1MB", "10MB", "50MB")
+FULL_KEYS = (10, 1_000, 10_000, 100_000)
+SECRET_MAX_BYTES = 64 * 1024
+KEYS_PER_SECTION = 100
+PROJECT_ID = "benchmark-project"
+# Measured python-dotenv parse time per key and byte of payload, used to skip env cases that would take hours
+DOTENV_SECONDS_PER_KEY_BYTE = 6.5e-10
+
+_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "B": 1}
+_VALIDATOR = TypeAdapter(dict[str, dict[str, str]])
+
+
+def parse_size(size: str) -> int:
+    for unit, factor in _UNITS.items():
+        if size.upper().endswith(unit):
+            return int(float(size[: -len(unit)]) * factor)
+    return int(size)
+
+
+def generate_config(keys: int, value_length: int) -> dict[str, dict[str, str]]:
+    """
+    Return `keys` string values of `value_length` characters, grouped in sections of KEYS_PER_SECTION keys. Values
+    start with a letter, so the env processor keeps them as strings.
+    """
+    config: dict[str, dict[str, str]] = {}
+    for i in range(keys):
+        value = f"v{i}-"
+        config.setdefault(f"section_{i // KEYS_PER_SECTION}", {})[f"key_{i}"] = value + "x" * max(0, value_length - len(value))
+    return config
+
+
+def render(config: dict[str, dict[str, str]], fmt: str) -> str:
+    if fmt == "json":
+        return json.dumps(config)
+    if fmt == "yaml":
+        return yaml.dump(config, Dumper=yaml.CSafeDumper if hasattr(yaml, "CSafeDumper") else yaml.SafeDumper, width=1 << 30)
+    return "".join(
+        f"{section.upper()}__{key.upper()}={value}\n" for section, values in config.items() for key, value in values.items()
+    )
+
+
+def generate_payload(fmt: str, keys: int, target_bytes: int) -> tuple[str, dict[str, dict[str, str]]] | None:
+    """
+    Render a payload of about `target_bytes` holding `keys` values.
+
+    :return: The payload and the configuration it encodes, or None if `keys` do not fit in twice the target size.
+    """
+    minimal = render(generate_config(keys, 0), fmt)
+    if len(minimal) > 2 * target_bytes:
+        return None
+    value_length = max(0, (target_bytes - len(minimal)) // keys)
+    config = generate_config(keys, value_length)
+    return render(config, fmt), config
+
+
+class InMemoryBucket:
+    """
+    Stand-in of a GCS bucket handle serving one payload per blob name.
+    """
+
+    def __init__(self, blobs: dict[str, str]):
+        self.blobs = blobs
+
+    def blob(self, blob_name: str) -> SimpleNamespace:
+        return SimpleNamespace(name=blob_name, download_as_text=lambda: self.blobs[blob_name])
+
+    def get_blob(self, blob_name: str) -> SimpleNamespace:
+        return SimpleNamespace(name=blob_name, generation=1, etag="etag")
+
+
+class InMemorySecretManager:
+    """
+    Stand-in of a Secret Manager client serving one payload per secret name.
+    """
+
+    def __init__(self, secrets: dict[str, bytes]):
+        self.secrets = secrets
+
+    def secret_version_path(self, project: str, secret: str, version: str) -> str:
+        return f"projects/{project}/secrets/{secret}/versions/{version}"
+
+    def access_secret_version(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(payload=SimpleNamespace(data=self.secrets[name.split("/")[3]]))
+
+
+def make_provider(provider: str, fmt: str, payload: str, directory: Path) -> ConfigProvider:
+    name = f"config.{fmt}"
+    if provider == "file":
+        path = directory / name
+        path.write_text(payload)
+        return FileConfigProvider(str(path))
+    if provider == "secret":
+        client_pool = ClientPool("benchmark-secret-clients")
+        client_pool.get((PROJECT_ID, None), lambda: InMemorySecretManager({name: payload.encode("utf-8")}))
+        return GcpSecretConfigProvider(name, PROJECT_ID, client_pool=client_pool)
+    bucket_pool = ClientPool("benchmark-buckets")
+    bucket_pool.get((PROJECT_ID, None, "benchmark-bucket"), lambda: InMemoryBucket({name: payload}))
+    return GcpStorageConfigProvider("benchmark-bucket", name, PROJECT_ID, bucket_pool=bucket_pool)
+
+
+def make_loader(fmt: str, provider: ConfigProvider, cache: ParsedConfigCache) -> ConfigLoader:
+    if fmt == "env":
+        return EnvConfigLoader(provider, DefaultEnvConfigProcessor(), parsed_config_cache=cache)
+    if fmt == "json":
+        return JsonConfigLoader(provider, parsed_config_cache=cache)
+    return YamlConfigLoader(provider, parsed_config_cache=cache)
+
+
+def stages(fmt: str, provider: ConfigProvider, payload: str) -> dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]]:
+    """
+    Return the timed callable of every stage, with the setup to run before each call (not timed).
+    """
+    cache = ParsedConfigCache(max_entries=1)
+    loader = make_loader(fmt, provider, cache)
+    processor = DefaultEnvConfigProcessor()
+    if fmt == "env":
+        flat = dotenv_values(stream=io.StringIO(payload))
+        parsed = processor.process(flat)
+        parse: Callable[[], Any] = lambda: dotenv_values(stream=io.StringIO(payload))  # noqa: E731
+    else:
+        backend = ParserBackendRegistry.get(fmt)
+        parsed = backend.parse(payload)
+        parse = lambda: backend.parse(payload)  # noqa: E731
+
+    timed = {
+        "fetch": (provider.get_config, None),
+        "parse": (parse, None),
+        "nest": (lambda: processor.process(flat), None),
+        "validate": (lambda: _VALIDATOR.validate_python(parsed), None),
+        "load": (loader.load, cache.clear),
+        "load_cached": (loader.load, None),
+    }
+    if fmt != "env":
+        del timed["nest"]
+    return timed
+
+
+def measure(func: Callable[[], Any], setup: Callable[[], Any] | None, min_time: float, max_iterations: int) -> dict[str, Any]:
+    """
+    Call `func` until `min_time` seconds were spent in it (at least 3 and at most `max_iterations` times).
+    """
+    samples: list[float] = []
+    while len(samples) < 3 or (sum(samples) < min_time and len(samples) < max_iterations):
+        if setup is not None:
+            setup()
+        started_at = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started_at)
+    return {
+        "iterations": len(samples),
+        "min_ms": min(samples) * 1e3,
+        "median_ms": statistics.median(samples) * 1e3,
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "max_ms": max(samples) * 1e3,
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in args.formats:
+            for size in args.sizes:
+                for keys in args.keys:
+                    case = {"format": fmt, "size": size, "keys": keys}
+                    generated = generate_payload(fmt, keys, parse_size(size))
+                    if generated is None:
+                        skipped.append({**case, "reason": f"{keys} keys do not fit in {size}"})
+                        continue
+                    payload, config = generated
+                    estimate = keys * len(payload) * DOTENV_SECONDS_PER_KEY_BYTE
+                    if fmt == "env" and estimate > args.max_case_seconds:
+                        skipped.append({**case, "reason": f"python-dotenv would take about {estimate:.0f}s per parse"})
+                        continue
+                    for provider_name in args.providers:
+                        if provider_name == "secret" and len(payload.encode("utf-8")) > SECRET_MAX_BYTES:
+                            skipped.append({**case, "provider": provider_name, "reason": "exceeds the 64 KiB secret limit"})
+                            continue
+                        provider = make_provider(provider_name, fmt, payload, Path(directory))
+                        timed = stages(fmt, provider, payload)
+                        assert make_loader(fmt, provider, ParsedConfigCache()).load() == config
+                        row = {"provider": provider_name, **case, "payload_bytes": len(payload.encode("utf-8")), "stages": {}}
+                        for stage, (func, setup) in timed.items():
+                            row["stages"][stage] = measure(func, setup, args.min_time, args.max_iterations)
+                        print_row(row)
+                        results.append(row)
+    return {"meta": metadata(args), "results": results, "skipped": skipped}
+
+
+def metadata(args: argparse.Namespace) -> dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "json_parser": ParserBackendRegistry.get("json").name,
+        "yaml_parser": ParserBackendRegistry.get("yaml").name,
+        "min_time": args.min_time,
+        "max_iterations": args.max_iterations,
+        "max_case_seconds": args.max_case_seconds,
+    }
+
+
+def row_key(row: dict[str, Any]) -> tuple:
+    return (row["provider"], row["format"], row["size"], row["keys"])
+
+
+def print_row(row: dict[str, Any]) -> None:
+    if not getattr(print_row, "header_printed", False):
+        print(f"{'provider':<8} {'format':<6} {'size':>6} {'keys':>7} {'bytes':>10}  median ms per stage")
+        print_row.header_printed = True  # type: ignore[attr-defined]
+    timings = "  ".join(f"{stage}={timing['median_ms']:.3f}" for stage, timing in row["stages"].items())
+    print(
+        f"{row['provider']:<8} {row['format']:<6} {row['size']:>6} {row['keys']:>7} {row['payload_bytes']:>10}  {timings}",
+        flush=True,
+    )
+
+
+def compare(report: dict[str, Any], baseline_path: str) -> None:
+    """
+    Print the ratio of the median of every stage to the one of the same case in the baseline report.
+    """
+    baseline = {row_key(row): row for row in json.loads(Path(baseline_path).read_text())["results"]}
+    print(f"\nCompared with {baseline_path} (new / baseline median, < 1 is faster)")
+    for row in report["results"]:
+        old = baseline.get(row_key(row))
+        if old is None:
+            continue
+        ratios = []
+        for stage, timing in row["stages"].items():
+            old_timing = old["stages"].get(stage)
+            if old_timing and old_timing["median_ms"] > 0:
+                ratios.append(f"{stage}={timing['median_ms'] / old_timing['median_ms']:.2f}")
+        print(f"{row['provider']:<8} {row['format']:<6} {row['size']:>6} {row['keys']:>7}  {'  '.join(ratios)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", nargs="+", choices=PROVIDERS, default=list(PROVIDERS))
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--sizes", nargs="+", help=f"Payload sizes, e.g. 1KB 10MB. Default: {' '.join(QUICK_SIZES)}")
+    parser.add_argument("--keys", nargs="+", type=int, help=f"Key counts. Default: {' '.join(map(str, QUICK_KEYS))}")
+    parser.add_argument(
+        "--full", action="store_true", help=f"Sizes {' '.join(FULL_SIZES)} and keys {' '.join(map(str, FULL_KEYS))}"
+    )
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds spent measuring each stage")
+    parser.add_argument("--max-iterations", type=int, default=1_000)
+    parser.add_argument("--max-case-seconds", type=float, default=10.0, help="Skip env cases parsing slower than this")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+    args.sizes = args.sizes or list(FULL_SIZES if args.full else QUICK_SIZES)
+    args.keys = args.keys or list(FULL_KEYS if args.full else QUICK_KEYS)
+    if math.prod(map(len, (args.providers, args.formats, args.sizes, args.keys))) == 0:
+        parser.error("Nothing to run.")
+
+    report = run(args)
+    for skip in report["skipped"]:
+        print(f"skipped {skip}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of DefaultEnvConfigProcessor.process against the former two-pass implementation.
+
+Usage:
+    python benchmarks/bench_env_config_processor.py --keys 10000 --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from config_loaders import DefaultEnvConfigProcessor  # noqa: E402
+
+
+def legacy_process(flat_dict: dict[str, Any], logger: logging.Logger) -> dict[str, Any]:
+    """
+    The two-pass implementation DefaultEnvConfigProcessor used before: nest every key, then try `json.loads`
+    on every leaf, logging per key.
+    """
+    nested: dict[str, Any] = {}
+    for key, value in flat_dict.items():
+        keys = key.lower().split("__")
+        current_level = nested
+        for part in keys[:-1]:
+            if part not in current_level or not isinstance(current_level[part], dict):
+                current_level[part] = {}
+            current_level = current_level[part]
+        current_level[keys[-1]] = value
+        logger.debug(f"Nesting key: {key}")
+
+    def parse_json_fields(node: dict[str, Any]) -> None:
+        for key, value in node.items():
+            if isinstance(value, dict):
+                parse_json_fields(value)
+            else:
+                try:
+                    node[key] = json.loads(value)
+                    logger.info(f"Parsed JSON field for key: {key}")
+                except (json.JSONDecodeError, TypeError):
+                    logger.debug(f"Skipping non-JSON field for key: {key}")
+
+    parse_json_fields(nested)
+    return nested
+
+
+def generate_env(key_count: int) -> dict[str, Any]:
+    """
+    Generate a flat environment mixing plain strings, numbers, booleans and JSON objects across nested sections.
+    """
+    values = ["airflow", "11", "true", '{"first_name": "Ricardo"}', "postgresql+psycopg2://airflow@postgres/airflow", "-3"]
+    return {f"SECTION_{index % 50}__GROUP_{index % 7}__KEY_{index}": values[index % len(values)] for index in range(key_count)}
+
+
+def measure(process: Callable[[dict[str, Any]], dict[str, Any]], flat_dict: dict[str, Any], repeat: int) -> float:
+    """
+    Return the best keys/second over `repeat` runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        process(dict(flat_dict))
+        best = min(best, time.perf_counter() - started_at)
+    return len(flat_dict) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--log-level", default="WARNING", help="Logging level active during the benchmark.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, stream=sys.stderr)
+    legacy_logger = logging.getLogger("LegacyEnvConfigProcessor")
+    processor = DefaultEnvConfigProcessor()
+
+    print(f"{'keys':>8} {'before (keys/s)':>18} {'after (keys/s)':>18} {'speedup':>8}")
+    for key_count in args.keys:
+        flat_dict = generate_env(key_count)
+        assert processor.process(dict(flat_dict)) == legacy_process(dict(flat_dict), legacy_logger)
+
+        before = measure(lambda env: legacy_process(env, legacy_logger), flat_dict, args.repeat)
+        after = measure(processor.process, flat_dict, args.repeat)
+        print(f"{key_count:>8} {before:>18,.0f} {after:>18,.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark of the per-request overhead of inject_typed_request against its former implementation, which inspected
+the decorated function's signature and looked up `from_dict` / `to_dict` on every request.
+
+The second table compares the default binding with `raw_body=True` on ChatRequest events padded with fields the
+model ignores, as real chat events are, at several payload sizes, with the peak Python memory allocated while
+binding one request.
+
+Each request is a fresh Flask Request built from a prepared WSGI environ, so body parsing is not cached between
+iterations; the "request only" row measures that shared cost.
+
+Usage:
+    python benchmarks/bench_inject_typed_request.py --number 20000
+"""
+
+import argparse
+import functools
+import inspect
+import io
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from flask import Request
+from werkzeug.test import EnvironBuilder
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from decorators import inject_typed_request  # noqa: E402
+from schemas import ChatRequest, GreetingRequest, GreetingResponse  # noqa: E402
+
+
+def legacy_inject_typed_request():
+    """
+    The implementation inject_typed_request had before the binder was compiled at decoration time.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            sig = inspect.signature(func)
+            parameters = list(sig.parameters.values())
+            if not parameters:
+                raise TypeError(f"Function {func.__name__} has no parameters.")
+            first_param = parameters[0]
+            annotated_type = first_param.annotation
+            if annotated_type is inspect._empty:
+                raise TypeError(f"Function {func.__name__}'s first parameter is not annotated with a type.")
+            if not args:
+                raise ValueError("No arguments provided at runtime (expected a Flask Request).")
+            flask_request = args[0]
+            if not isinstance(flask_request, Request):
+                raise TypeError(f"Expected the first argument to be a Flask Request, but got {type(flask_request)}")
+            json_data = flask_request.get_json(silent=True) or {}
+            query_data = dict(flask_request.args)
+            header_data: dict[str, Any] = {}
+            merged_data = {**json_data, **query_data, **header_data}
+            if not hasattr(annotated_type, "from_dict"):
+                raise AttributeError(f"Type '{annotated_type.__name__}' does not have a 'from_dict' method.")
+            typed_obj = annotated_type.from_dict(merged_data)
+            result = func(typed_obj, *args[1:], **kwargs)
+            if hasattr(result, "to_dict") and callable(result.to_dict):
+                return result.to_dict()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def say_hello(req: GreetingRequest) -> GreetingResponse:
+    return GreetingResponse(message=f"Hello, {req.first_name} {req.last_name}")
+
+
+def chat(req: ChatRequest) -> str:
+    return req.message.sender.displayName
+
+
+def chat_event(size_kb: int) -> dict[str, Any]:
+    """
+    Return a chat event of about `size_kb` KB, most of it made of annotations the model does not declare.
+    """
+    annotation = {"type": "USER_MENTION", "startIndex": 0, "length": 4, "userMention": {"user": {"name": "users/1"}}}
+    count = max(1, size_kb * 1024 // len(json.dumps(annotation)))
+    sender = {"displayName": "Ada", "avatarUrl": "https://example.com/ada.png", "email": "ada@example.com"}
+    return {"type": "MESSAGE", "message": {"sender": sender, "text": "@bot hello", "annotations": [annotation] * count}}
+
+
+def request_factory(query_string: dict[str, str], payload: Any = None) -> Callable[[], Request]:
+    body = json.dumps(payload or {"first_name": "Ada", "last_name": "Lovelace"}).encode()
+    environ = EnvironBuilder(method="POST", data=body, content_type="application/json", query_string=query_string).get_environ()
+
+    def new_request() -> Request:
+        return Request({**environ, "wsgi.input": io.BytesIO(body)})
+
+    return new_request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--payload-kb", type=int, nargs="+", default=[1, 64, 1024])
+    args = parser.parse_args()
+
+    handlers = {
+        "legacy": legacy_inject_typed_request()(say_hello),
+        "compiled": inject_typed_request()(say_hello),
+    }
+
+    print(f"{'request':<14} {'implementation':<15} {'us/request':>11} {'overhead us':>12} {'speedup':>8}")
+    for label, query_string in {"body": {}, "body+query": {"last_name": "Byron"}}.items():
+        new_request = request_factory(query_string)
+
+        def request_only() -> None:
+            new_request().get_json(silent=True)
+
+        base = min(timeit.repeat(request_only, number=args.number, repeat=args.repeat)) / args.number
+        print(f"{label:<14} {'request only':<15} {base * 1e6:>11.2f}")
+        legacy_overhead = None
+        for name, handler in handlers.items():
+            expected = handlers["legacy"](new_request())
+            assert handler(new_request()) == expected
+            seconds = min(timeit.repeat(lambda: handler(new_request()), number=args.number, repeat=args.repeat)) / args.number
+            overhead = seconds - base
+            legacy_overhead = legacy_overhead or overhead
+            print(f"{label:<14} {name:<15} {seconds * 1e6:>11.2f} {overhead * 1e6:>12.2f} {legacy_overhead / overhead:>7.2f}x")
+
+    chat_handlers = {"get_json": inject_typed_request()(chat), "raw_body": inject_typed_request(raw_body=True)(chat)}
+    print(f"\n{'ChatRequest':<14} {'binding':<15} {'us/request':>11} {'speedup':>8} {'peak MB':>8}")
+    for size_kb in args.payload_kb:
+        new_request = request_factory({}, chat_event(size_kb))
+        number = max(1, args.number // size_kb)
+        baseline = None
+        for name, handler in chat_handlers.items():
+            request = new_request()
+            tracemalloc.start()
+            assert handler(request) == "Ada"
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            seconds = min(timeit.repeat(lambda: handler(new_request()), number=number, repeat=args.repeat)) / number
+            baseline = baseline or seconds
+            print(f"{f'{size_kb} KB':<14} {name:<15} {seconds * 1e6:>11.2f} {baseline / seconds:>7.2f}x {peak / 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
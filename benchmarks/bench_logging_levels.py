@@ -0,0 +1,77 @@
+"""
+Benchmark of configuration load throughput with the root logger at WARNING, INFO and DEBUG.
+
+Each load creates a loader through a ConfigLoaderFactoryRegistry and loads one of the repository's config files,
+which is how settings decorators and `main_v2.py` load configuration. Log records are formatted and written to
+os.devnull, so the cost of every emitted record is measured without flooding the terminal. The "env 1000 keys"
+row processes a flat environment of 1,000 keys, where DEBUG emits one record per key.
+
+Usage:
+    python benchmarks/bench_logging_levels.py --number 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from config_loaders import (  # noqa: E402
+    ConfigLoaderFactory,
+    ConfigLoaderFactoryRegistry,
+    DefaultEnvConfigProcessor,
+    EnvConfigLoaderArgs,
+    JsonConfigLoaderArgs,
+    YamlConfigLoaderArgs,
+)
+
+LEVELS = {"WARNING": logging.WARNING, "INFO": logging.INFO, "DEBUG": logging.DEBUG}
+
+
+def workloads() -> dict[str, Callable[[], object]]:
+    registry = ConfigLoaderFactoryRegistry()
+    for args_type in (JsonConfigLoaderArgs, YamlConfigLoaderArgs, EnvConfigLoaderArgs):
+        registry.register(args_type, ConfigLoaderFactory.get_loader)
+
+    json_args = JsonConfigLoaderArgs(file_path=str(ROOT / "config.json"))
+    yaml_args = YamlConfigLoaderArgs(file_path=str(ROOT / "config.yaml"))
+    env_args = EnvConfigLoaderArgs(file_path=str(ROOT / ".env.local"))
+    processor = DefaultEnvConfigProcessor()
+    flat_env = {f"SECTION_{i % 10}__KEY_{i}": str(i) if i % 2 else f"value-{i}" for i in range(1000)}
+    return {
+        "json file": lambda: registry.get_loader(json_args).load(),
+        "yaml file": lambda: registry.get_loader(yaml_args).load(),
+        "env file": lambda: registry.get_loader(env_args).load(),
+        "env 1000 keys": lambda: processor.process(flat_env),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    logging.basicConfig(stream=devnull, format="%(asctime)s - %(levelname)s - %(message)s")
+    root = logging.getLogger()
+
+    print(f"{'workload':<15} {'level':<8} {'loads/s':>10} {'vs WARNING':>11}")
+    for name, workload in workloads().items():
+        number = max(1, args.number // 20) if name.startswith("env 1000") else args.number
+        baseline = None
+        for level_name, level in LEVELS.items():
+            root.setLevel(level)
+            seconds = min(timeit.repeat(workload, number=number, repeat=args.repeat)) / number
+            baseline = baseline or seconds
+            print(f"{name:<15} {level_name:<8} {1 / seconds:>10.0f} {baseline / seconds:>10.2f}x")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of the JSON and YAML parser backends over the repository's config*.json / config*.yaml files scaled up
+to multi-megabyte payloads.
+
+Usage:
+    python benchmarks/bench_parser_backends.py --sizes-mb 0.01 1 5 --repeat 5
+"""
+
+import argparse
+import gc
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from config_loaders import ParserBackendRegistry  # noqa: E402
+
+
+class _NoAliasDumper(yaml.SafeDumper):
+    """
+    Writes repeated sections out in full instead of as anchors and aliases, so the payload really grows.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def scale(configs: list[dict[str, Any]], dump, target_bytes: int) -> str:
+    """
+    Repeat the given configurations under numbered top-level sections until the payload reaches `target_bytes`.
+    """
+    unit = {f"section_{index}": config for index, config in enumerate(configs)}
+    unit_size = len(dump(unit))
+    copies = max(1, target_bytes // unit_size)
+    return dump({f"copy_{copy}": unit for copy in range(copies)})
+
+
+def measure(parse, payload: str, repeat: int) -> float:
+    """
+    Return the best throughput in MB/s over `repeat` runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started_at = time.perf_counter()
+        parse(payload)
+        best = min(best, time.perf_counter() - started_at)
+    return len(payload.encode("utf-8")) / best / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[0.01, 1, 5])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sources = {
+        "json": ([json.loads(Path(path).read_text()) for path in sorted(glob.glob(str(ROOT / "config*.json")))], json.dumps),
+        "yaml": (
+            [yaml.safe_load(Path(path).read_text()) for path in sorted(glob.glob(str(ROOT / "config*.yaml")))],
+            lambda data: yaml.dump(data, Dumper=_NoAliasDumper, sort_keys=False),
+        ),
+    }
+
+    print(f"{'format':<6} {'size':>9} {'backend':<10} {'MB/s':>9} {'vs reference':>13}")
+    for format, (configs, dump) in sources.items():
+        names = ParserBackendRegistry.available(format)
+        for size_mb in args.sizes_mb:
+            payload = scale(configs, dump, int(size_mb * 1_000_000))
+            results = {name: measure(ParserBackendRegistry.get(format, name).parse, payload, args.repeat) for name in names}
+            reference = results[names[-1]]
+            for name, throughput in results.items():
+                size = f"{len(payload) / 1_000_000:.2f}MB"
+                print(f"{format:<6} {size:>9} {name:<10} {throughput:>9.1f} {throughput / reference:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
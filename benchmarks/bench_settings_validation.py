@@ -0,0 +1,59 @@
+"""
+Benchmark of the ways Settings can be built from the repository's config.json.
+
+From the parsed dict (what the YAML/env loaders and snapshots return):
+  - kwargs:              Settings(**config)                    (the former Settings.load)
+  - model_validate:      Settings.model_validate(config)       (ConfigSettings.load)
+
+From the raw JSON payload:
+  - json.loads+validate: Settings.model_validate(json.loads(raw))
+  - model_validate_json: Settings.model_validate_json(raw)     (ConfigSettings.load with a JSON loader)
+
+Usage:
+    python benchmarks/bench_settings_validation.py --number 20000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from schemas import Settings  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = (ROOT / "config.json").read_text()
+    config = json.loads(raw)
+    groups = {
+        "parsed dict": {
+            "kwargs": lambda: Settings(**config),
+            "model_validate": lambda: Settings.model_validate(config),
+        },
+        "raw JSON": {
+            "json.loads+validate": lambda: Settings.model_validate(json.loads(raw)),
+            "model_validate_json": lambda: Settings.model_validate_json(raw),
+        },
+    }
+
+    expected = Settings(**config)
+    print(f"{'input':<12} {'path':<20} {'us/load':>9} {'speedup':>8}")
+    for group, paths in groups.items():
+        baseline = None
+        for name, build in paths.items():
+            assert build() == expected
+            seconds = min(timeit.repeat(build, number=args.number, repeat=args.repeat)) / args.number
+            baseline = baseline or seconds
+            print(f"{group:<12} {name:<20} {seconds * 1e6:>9.2f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
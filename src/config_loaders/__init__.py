@@ -1,12 +1,26 @@
+from .async_config_loader import AsyncConfigLoader
+from .async_env_config_loader import AsyncEnvConfigLoader
+from .async_json_config_loader import AsyncJsonConfigLoader
+from .async_yaml_config_loader import AsyncYamlConfigLoader
+from .concurrent_config_loading import ConfigLoadResult, load_concurrently
 from .config_loader import ConfigLoader
 from .config_loader_args import *
 from .config_loader_factory import ConfigLoaderFactory
 from .config_loader_factory_registry import ConfigLoaderFactoryRegistry
+from .config_merger import MergedConfig, deep_merge
 from .config_providers import *
+from .config_settings import ConfigSettings
+from .config_snapshot_store import ConfigSnapshot, ConfigSnapshotStore
 from .decorators import *
 from .env_config_loader import EnvConfigLoader
 from .env_config_processors import *
+from .instrumentation import *
 from .json_config_loader import JsonConfigLoader
+from .layered_config_loader import LayeredConfigLoader
+from .lazy_settings import LazySettings
+from .parsed_config_cache import ConfigLoaderMetrics, ParsedConfigCache
+from .parser_backends import *
+from .snapshot_config_loader import SnapshotConfigLoader
 from .yaml_config_loader import YamlConfigLoader
 
 __all__ = [
@@ -16,8 +30,26 @@ __all__ = [
     "JsonConfigLoader",
     "YamlConfigLoader",
     "EnvConfigLoader",
+    "LayeredConfigLoader",
+    "MergedConfig",
+    "deep_merge",
+    "AsyncConfigLoader",
+    "AsyncJsonConfigLoader",
+    "AsyncYamlConfigLoader",
+    "AsyncEnvConfigLoader",
+    "ConfigLoadResult",
+    "load_concurrently",
+    "ConfigLoaderMetrics",
+    "ParsedConfigCache",
+    "ConfigSettings",
+    "LazySettings",
+    "ConfigSnapshot",
+    "ConfigSnapshotStore",
+    "SnapshotConfigLoader",
 ]
 __all__.extend(config_providers.__all__)
 __all__.extend(env_config_processors.__all__)
+__all__.extend(instrumentation.__all__)
+__all__.extend(parser_backends.__all__)
 __all__.extend(config_loader_args.__all__)
 __all__.extend(decorators.__all__)
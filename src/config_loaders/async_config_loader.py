@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class AsyncConfigLoader(ABC):
+    """
+    Abstract base class for asynchronous configuration loaders.
+    All asynchronous configuration loaders must implement the `aload` coroutine to provide
+    configuration data as a dictionary without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def aload(self) -> dict[str, Any]:
+        """
+        Load configuration data and return it as a dictionary.
+
+        :return: Configuration data as a dictionary.
+        :raises Exception: Subclasses should raise exceptions for errors encountered while loading configuration.
+        """
+        pass
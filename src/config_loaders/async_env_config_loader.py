@@ -0,0 +1,42 @@
+from typing import Any
+
+from .async_config_loader import AsyncConfigLoader
+from .config_providers import AsyncConfigProvider
+from .env_config_loader import EnvConfigLoader
+from .env_config_processors import EnvConfigProcessor
+from .instrumentation import ConfigInstrumentation
+from .parsed_config_cache import ParsedConfigCache
+
+
+class AsyncEnvConfigLoader(EnvConfigLoader, AsyncConfigLoader):
+    """
+    Loads and processes environment variables provided by an AsyncConfigProvider using an EnvConfigProcessor.
+    """
+
+    def __init__(
+        self,
+        config_provider: AsyncConfigProvider,
+        env_processor: EnvConfigProcessor,
+        parsed_config_cache: ParsedConfigCache | None = None,
+    ):
+        """
+        Initialize the asynchronous EnvLoader with an asynchronous configuration provider and environment processor.
+        :param config_provider: Instance of AsyncConfigProvider to fetch environment configuration content.
+        :param env_processor: Instance of EnvConfigProcessor to process environment variables.
+        :param parsed_config_cache: Cache of parsed payloads. Defaults to the process-wide cache.
+        """
+        super().__init__(
+            config_provider=config_provider,  # type: ignore[arg-type]
+            env_processor=env_processor,
+            parsed_config_cache=parsed_config_cache,
+        )
+        self.async_config_provider = config_provider
+
+    async def aload(self) -> dict[str, Any]:
+        """
+        Fetch the environment payload without blocking the event loop, then process it.
+
+        :return: Processed environment variables as a nested dictionary.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider):
+            return self.load_content(await ConfigInstrumentation.afetch(self.async_config_provider))
@@ -0,0 +1,42 @@
+from typing import Any
+
+from .async_config_loader import AsyncConfigLoader
+from .config_providers import AsyncConfigProvider
+from .instrumentation import ConfigInstrumentation
+from .json_config_loader import JsonConfigLoader
+from .parsed_config_cache import ParsedConfigCache
+from .parser_backends import ParserBackend
+
+
+class AsyncJsonConfigLoader(JsonConfigLoader, AsyncConfigLoader):
+    """
+    Loads configuration from a JSON source provided by an AsyncConfigProvider.
+    """
+
+    def __init__(
+        self,
+        config_provider: AsyncConfigProvider,
+        parsed_config_cache: ParsedConfigCache | None = None,
+        parser_backend: ParserBackend | str | None = None,
+    ):
+        """
+        Initialize the asynchronous JSON loader with an asynchronous configuration provider.
+        :param config_provider: Instance of AsyncConfigProvider to fetch configuration content.
+        :param parsed_config_cache: Cache of parsed payloads. Defaults to the process-wide cache.
+        :param parser_backend: Parser backend, or the name of a registered one. Defaults to the global selection.
+        """
+        super().__init__(
+            config_provider=config_provider,  # type: ignore[arg-type]
+            parsed_config_cache=parsed_config_cache,
+            parser_backend=parser_backend,
+        )
+        self.async_config_provider = config_provider
+
+    async def aload(self) -> dict[str, Any]:
+        """
+        Fetch the JSON configuration without blocking the event loop, then parse it.
+
+        :return: Parsed configuration as a dictionary.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider):
+            return self.load_content(await ConfigInstrumentation.afetch(self.async_config_provider))
@@ -0,0 +1,177 @@
+import logging
+import math
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from .config_loader import ConfigLoader
+from .config_loader_args import ConfigLoaderArgs
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConfigLoadResult:
+    """
+    Outcome of loading a single configuration source with `load_concurrently`.
+    """
+
+    config_loader_args: ConfigLoaderArgs
+    config: dict[str, Any] | None = None
+    error: BaseException | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> dict[str, Any]:
+        """
+        Return the loaded configuration, or raise the error that prevented loading it.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.config  # type: ignore[return-value]
+
+
+def load_concurrently(
+    get_loader: Callable[[ConfigLoaderArgs], ConfigLoader],
+    config_loader_args_list: Sequence[ConfigLoaderArgs],
+    max_workers: int = 8,
+    timeout: float | None = None,
+    deadline: float | None = None,
+) -> list[ConfigLoadResult]:
+    """
+    Load several configuration sources concurrently, at most `max_workers` at a time.
+
+    A startup loading N remote configurations takes roughly as long as the slowest one instead of the sum.
+    Errors are captured per source and never abort the other loads.
+
+    Each source is loaded on a daemon thread of its own, which is never joined, so a load that never returns cannot
+    block the interpreter from exiting. A source that times out is reported right away, but its thread keeps its slot
+    until it actually returns: no more than `max_workers` loads ever hit the sources at the same time, and queued
+    sources that cannot start before the deadline are reported as timed out.
+
+    :param get_loader: Callable creating a loader for the given arguments (e.g. `ConfigLoaderFactory.get_loader`).
+    :param config_loader_args_list: Sources to load.
+    :param max_workers: Maximum number of sources loaded at the same time.
+    :param timeout: Maximum number of seconds a single source may take once started. A source exceeding it
+                    is reported with a TimeoutError; its thread is abandoned, not interrupted.
+    :param deadline: Maximum number of seconds the whole call may take. Sources still running or waiting for a
+                     slot when it expires are reported with a TimeoutError. Defaults to `timeout` times the number
+                     of waves of `max_workers` sources, and to no deadline without a timeout.
+    :return: One result per source, in the order of `config_loader_args_list`.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer.")
+
+    results = [ConfigLoadResult(config_loader_args=config_loader_args) for config_loader_args in config_loader_args_list]
+    if not results:
+        return results
+
+    if deadline is None and timeout is not None:
+        deadline = timeout * math.ceil(len(results) / max_workers)
+    return _ConcurrentLoad(get_loader, results, max_workers, timeout, deadline).run()
+
+
+class _ConcurrentLoad:
+    """
+    Runs the loads of one `load_concurrently` call and collects their results from the calling thread.
+    """
+
+    def __init__(
+        self,
+        get_loader: Callable[[ConfigLoaderArgs], ConfigLoader],
+        results: list[ConfigLoadResult],
+        max_workers: int,
+        timeout: float | None,
+        deadline: float | None,
+    ):
+        self.get_loader = get_loader
+        self.results = results
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+        self.deadline_at = None if deadline is None else time.monotonic() + deadline
+        self.queued = deque(range(len(results)))
+        # Start time of every source that is running and not reported as timed out yet
+        self.running: dict[int, float] = {}
+        # Sources reported as timed out whose thread is still running, and still holds its slot
+        self.abandoned: set[int] = set()
+        self.completed: queue.SimpleQueue[tuple[int, dict[str, Any] | None, BaseException | None]] = queue.SimpleQueue()
+
+    def run(self) -> list[ConfigLoadResult]:
+        while self.queued or self.running:
+            self._start_queued()
+            self._receive(self._next_wait())
+            self._expire()
+        return self.results
+
+    def _start_queued(self) -> None:
+        while self.queued and len(self.running) + len(self.abandoned) < self.max_workers:
+            index = self.queued.popleft()
+            self.running[index] = time.monotonic()
+            threading.Thread(target=self._load, args=(index,), name="config-loader", daemon=True).start()
+
+    def _load(self, index: int) -> None:
+        try:
+            config = self.get_loader(self.results[index].config_loader_args).load()
+        except BaseException as e:
+            self.completed.put((index, None, e))
+        else:
+            self.completed.put((index, config, None))
+
+    def _next_wait(self) -> float | None:
+        """
+        Return how long to wait for the next completion before a running source or the whole call times out.
+        """
+        deadlines = [started_at + self.timeout for started_at in self.running.values()] if self.timeout is not None else []
+        if self.deadline_at is not None:
+            deadlines.append(self.deadline_at)
+        return max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+    def _receive(self, wait: float | None) -> None:
+        try:
+            index, config, error = self.completed.get(timeout=wait)
+        except queue.Empty:
+            return
+        started_at = self.running.pop(index, None)
+        if started_at is None:
+            # The source was already reported as timed out, its slot is free again
+            self.abandoned.discard(index)
+            return
+
+        result = self.results[index]
+        result.elapsed_seconds = time.monotonic() - started_at
+        if error is None:
+            result.config = config
+        elif isinstance(error, Exception):
+            result.error = error
+            logger.error("Failed to load configuration for %s: %s", result.config_loader_args, error)
+        else:
+            raise error
+
+    def _expire(self) -> None:
+        """
+        Report every running source that exceeded the timeout, and every source once the deadline passed, as
+        timed out and stop waiting for them.
+        """
+        now = time.monotonic()
+        past_deadline = self.deadline_at is not None and now >= self.deadline_at
+        for index, started_at in list(self.running.items()):
+            if past_deadline or (self.timeout is not None and now - started_at >= self.timeout):
+                del self.running[index]
+                self.abandoned.add(index)
+                self._time_out(index, now - started_at, f"Loading configuration timed out after {now - started_at:.3g}s")
+        if past_deadline:
+            while self.queued:
+                self._time_out(self.queued.popleft(), 0.0, f"Loading configuration did not start within {self.deadline}s")
+
+    def _time_out(self, index: int, elapsed_seconds: float, message: str) -> None:
+        result = self.results[index]
+        result.elapsed_seconds = elapsed_seconds
+        result.error = TimeoutError(f"{message}: {result.config_loader_args}")
+        logger.error("%s", result.error)
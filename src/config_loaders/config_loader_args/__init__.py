@@ -3,6 +3,7 @@ from .env_config_loader_args import EnvConfigLoaderArgs
 from .gcp_secret_config_loader_args import *
 from .gcp_storage_config_loader_args import *
 from .json_config_loader_args import JsonConfigLoaderArgs
+from .layered_config_loader_args import LayeredConfigLoaderArgs
 from .yaml_config_loader_args import YamlConfigLoaderArgs
 
 __all__ = [
@@ -14,6 +15,7 @@ __all__ = [
     "GcpStorageJsonConfigLoaderArgs",
     "GcpStorageYamlConfigLoaderArgs",
     "JsonConfigLoaderArgs",
+    "LayeredConfigLoaderArgs",
     "YamlConfigLoaderArgs",
     "EnvConfigLoaderArgs",
 ]
@@ -2,4 +2,11 @@ from abc import ABC
 
 
 class ConfigLoaderArgs(ABC):
-    pass
+    """
+    Base class of the parameter objects describing a configuration source.
+
+    Subclasses are frozen, slotted dataclasses: instances are immutable value objects with structural
+    equality and hashing, so they can be used as cache keys and carry no per-instance `__dict__`.
+    """
+
+    __slots__ = ()
@@ -1,7 +1,10 @@
+from dataclasses import dataclass
+
 from ..config_loader_args import ConfigLoaderArgs
 
 
+@dataclass(frozen=True, slots=True)
 class GcpSecretJsonConfigLoaderArgs(ConfigLoaderArgs):
-    def __init__(self, secret_name: str, project_id: str):
-        self.secret_name = secret_name
-        self.project_id = project_id
+    secret_name: str
+    project_id: str
+    parser_backend: str | None = None
@@ -1,8 +1,11 @@
+from dataclasses import dataclass
+
 from ..config_loader_args import ConfigLoaderArgs
 
 
+@dataclass(frozen=True, slots=True)
 class GcpStorageJsonConfigLoaderArgs(ConfigLoaderArgs):
-    def __init__(self, bucket_name: str, blob_name: str, project_id: str):
-        self.bucket_name = bucket_name
-        self.blob_name = blob_name
-        self.project_id = project_id
+    bucket_name: str
+    blob_name: str
+    project_id: str
+    parser_backend: str | None = None
@@ -1,6 +1,9 @@
+from dataclasses import dataclass
+
 from .config_loader_args import ConfigLoaderArgs
 
 
+@dataclass(frozen=True, slots=True)
 class JsonConfigLoaderArgs(ConfigLoaderArgs):
-    def __init__(self, file_path: str):
-        self.file_path = file_path
+    file_path: str
+    parser_backend: str | None = None
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .config_loader_args import ConfigLoaderArgs
+
+
+@dataclass(frozen=True, slots=True)
+class LayeredConfigLoaderArgs(ConfigLoaderArgs):
+    layers: Sequence[ConfigLoaderArgs]
+    max_workers: int = 8
+    timeout: float | None = None
+
+    def __post_init__(self):
+        # Layers are stored as a tuple so the arguments stay immutable and hashable
+        object.__setattr__(self, "layers", tuple(self.layers))
@@ -1,4 +1,5 @@
-from typing import overload
+import threading
+from typing import Any, Callable, Dict, Hashable, Sequence, overload
 
 from config_loaders.config_loader_args import (
     ConfigLoaderArgs,
@@ -10,107 +11,302 @@ from config_loaders.config_loader_args import (
     GcpStorageJsonConfigLoaderArgs,
     GcpStorageYamlConfigLoaderArgs,
     JsonConfigLoaderArgs,
+    LayeredConfigLoaderArgs,
     YamlConfigLoaderArgs,
 )
 
+from .async_config_loader import AsyncConfigLoader
+from .async_env_config_loader import AsyncEnvConfigLoader
+from .async_json_config_loader import AsyncJsonConfigLoader
+from .async_yaml_config_loader import AsyncYamlConfigLoader
+from .concurrent_config_loading import ConfigLoadResult, load_concurrently
 from .config_loader import ConfigLoader
-from .config_providers import FileConfigProvider, GcpSecretConfigProvider, GcpStorageConfigProvider
+from .config_providers import (
+    AsyncCachingConfigProvider,
+    AsyncFileConfigProvider,
+    AsyncGcpSecretConfigProvider,
+    AsyncGcpStorageConfigProvider,
+    CachingConfigProvider,
+    ConfigPayloadCache,
+    ConfigProvider,
+    FileConfigProvider,
+    GcpSecretConfigProvider,
+    GcpStorageConfigProvider,
+)
+from .config_snapshot_store import ConfigSnapshotStore
 from .env_config_loader import EnvConfigLoader
 from .env_config_processors import DefaultEnvConfigProcessor
 from .json_config_loader import JsonConfigLoader
+from .layered_config_loader import LayeredConfigLoader
+from .snapshot_config_loader import SnapshotConfigLoader
+from .type_dispatch_table import TypeDispatchTable
 from .yaml_config_loader import YamlConfigLoader
 
 
+def _with_payload_cache(config_provider: ConfigProvider, caching_type: type = CachingConfigProvider) -> ConfigProvider:
+    payload_cache = ConfigLoaderFactory._payload_cache
+    return config_provider if payload_cache is None else caching_type(config_provider, payload_cache)
+
+
+def _gcp_secret_provider(config_loader_args: Any) -> ConfigProvider:
+    return _with_payload_cache(
+        GcpSecretConfigProvider(secret_name=config_loader_args.secret_name, project_id=config_loader_args.project_id)
+    )
+
+
+def _gcp_storage_provider(config_loader_args: Any) -> ConfigProvider:
+    return _with_payload_cache(
+        GcpStorageConfigProvider(
+            bucket_name=config_loader_args.bucket_name,
+            blob_name=config_loader_args.blob_name,
+            project_id=config_loader_args.project_id,
+        )
+    )
+
+
+def _file_provider(config_loader_args: Any) -> FileConfigProvider:
+    return FileConfigProvider(file_path=config_loader_args.file_path)
+
+
+def _async_gcp_secret_provider(config_loader_args: Any) -> ConfigProvider:
+    return _with_payload_cache(
+        AsyncGcpSecretConfigProvider(secret_name=config_loader_args.secret_name, project_id=config_loader_args.project_id),
+        AsyncCachingConfigProvider,
+    )
+
+
+def _async_gcp_storage_provider(config_loader_args: Any) -> ConfigProvider:
+    return _with_payload_cache(
+        AsyncGcpStorageConfigProvider(
+            bucket_name=config_loader_args.bucket_name,
+            blob_name=config_loader_args.blob_name,
+            project_id=config_loader_args.project_id,
+        ),
+        AsyncCachingConfigProvider,
+    )
+
+
+def _async_file_provider(config_loader_args: Any) -> AsyncFileConfigProvider:
+    return AsyncFileConfigProvider(file_path=config_loader_args.file_path)
+
+
+def _env_loader(create_provider: Callable[[Any], Any], loader_type: type = EnvConfigLoader) -> Callable[[Any], Any]:
+    return lambda config_loader_args: loader_type(
+        config_provider=create_provider(config_loader_args), env_processor=DefaultEnvConfigProcessor()
+    )
+
+
+def _parsing_loader(create_provider: Callable[[Any], Any], loader_type: type) -> Callable[[Any], Any]:
+    return lambda config_loader_args: loader_type(
+        config_provider=create_provider(config_loader_args), parser_backend=config_loader_args.parser_backend
+    )
+
+
+def _layered_loader(config_loader_args: LayeredConfigLoaderArgs) -> LayeredConfigLoader:
+    return LayeredConfigLoader(
+        layers=config_loader_args.layers,
+        get_loader=ConfigLoaderFactory.get_loader,
+        max_workers=config_loader_args.max_workers,
+        timeout=config_loader_args.timeout,
+    )
+
+
+# Dispatch tables: argument type -> loader constructor. Subclasses of an argument type resolve through their MRO.
+_LOADERS: TypeDispatchTable[Callable[[Any], ConfigLoader]] = TypeDispatchTable()
+_LOADERS.register(GcpSecretEnvConfigLoaderArgs, _env_loader(_gcp_secret_provider))
+_LOADERS.register(GcpSecretJsonConfigLoaderArgs, _parsing_loader(_gcp_secret_provider, JsonConfigLoader))
+_LOADERS.register(GcpSecretYamlConfigLoaderArgs, _parsing_loader(_gcp_secret_provider, YamlConfigLoader))
+_LOADERS.register(GcpStorageEnvConfigLoaderArgs, _env_loader(_gcp_storage_provider))
+_LOADERS.register(GcpStorageJsonConfigLoaderArgs, _parsing_loader(_gcp_storage_provider, JsonConfigLoader))
+_LOADERS.register(GcpStorageYamlConfigLoaderArgs, _parsing_loader(_gcp_storage_provider, YamlConfigLoader))
+_LOADERS.register(EnvConfigLoaderArgs, _env_loader(_file_provider))
+_LOADERS.register(JsonConfigLoaderArgs, _parsing_loader(_file_provider, JsonConfigLoader))
+_LOADERS.register(YamlConfigLoaderArgs, _parsing_loader(_file_provider, YamlConfigLoader))
+_LOADERS.register(LayeredConfigLoaderArgs, _layered_loader)
+
+# Sources served from on-disk snapshots once `ConfigLoaderFactory.set_snapshot_store` enabled them
+_SNAPSHOT_ARGS = (
+    GcpSecretEnvConfigLoaderArgs,
+    GcpSecretJsonConfigLoaderArgs,
+    GcpSecretYamlConfigLoaderArgs,
+    GcpStorageEnvConfigLoaderArgs,
+    GcpStorageJsonConfigLoaderArgs,
+    GcpStorageYamlConfigLoaderArgs,
+)
+
+_ASYNC_LOADERS: TypeDispatchTable[Callable[[Any], AsyncConfigLoader]] = TypeDispatchTable()
+_ASYNC_LOADERS.register(GcpSecretEnvConfigLoaderArgs, _env_loader(_async_gcp_secret_provider, AsyncEnvConfigLoader))
+_ASYNC_LOADERS.register(GcpSecretJsonConfigLoaderArgs, _parsing_loader(_async_gcp_secret_provider, AsyncJsonConfigLoader))
+_ASYNC_LOADERS.register(GcpSecretYamlConfigLoaderArgs, _parsing_loader(_async_gcp_secret_provider, AsyncYamlConfigLoader))
+_ASYNC_LOADERS.register(GcpStorageEnvConfigLoaderArgs, _env_loader(_async_gcp_storage_provider, AsyncEnvConfigLoader))
+_ASYNC_LOADERS.register(GcpStorageJsonConfigLoaderArgs, _parsing_loader(_async_gcp_storage_provider, AsyncJsonConfigLoader))
+_ASYNC_LOADERS.register(GcpStorageYamlConfigLoaderArgs, _parsing_loader(_async_gcp_storage_provider, AsyncYamlConfigLoader))
+_ASYNC_LOADERS.register(EnvConfigLoaderArgs, _env_loader(_async_file_provider, AsyncEnvConfigLoader))
+_ASYNC_LOADERS.register(JsonConfigLoaderArgs, _parsing_loader(_async_file_provider, AsyncJsonConfigLoader))
+_ASYNC_LOADERS.register(YamlConfigLoaderArgs, _parsing_loader(_async_file_provider, AsyncYamlConfigLoader))
+
+
 class ConfigLoaderFactory:
+    _loader_cache: Dict[Hashable, ConfigLoader] = {}
+    _loader_cache_lock = threading.Lock()
+    _snapshot_store: ConfigSnapshotStore | None = None
+    _payload_cache: ConfigPayloadCache | None = None
+
+    @overload
+    @staticmethod
+    def get_loader(
+        config_loader_args: GcpSecretEnvConfigLoaderArgs, cached: bool = False
+    ) -> EnvConfigLoader | SnapshotConfigLoader: ...
+
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpSecretEnvConfigLoaderArgs) -> EnvConfigLoader: ...
+    def get_loader(
+        config_loader_args: GcpSecretJsonConfigLoaderArgs, cached: bool = False
+    ) -> JsonConfigLoader | SnapshotConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpSecretJsonConfigLoaderArgs) -> JsonConfigLoader: ...
+    def get_loader(
+        config_loader_args: GcpSecretYamlConfigLoaderArgs, cached: bool = False
+    ) -> YamlConfigLoader | SnapshotConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpSecretYamlConfigLoaderArgs) -> YamlConfigLoader: ...
+    def get_loader(
+        config_loader_args: GcpStorageEnvConfigLoaderArgs, cached: bool = False
+    ) -> EnvConfigLoader | SnapshotConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpStorageEnvConfigLoaderArgs) -> EnvConfigLoader: ...
+    def get_loader(
+        config_loader_args: GcpStorageJsonConfigLoaderArgs, cached: bool = False
+    ) -> JsonConfigLoader | SnapshotConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpStorageJsonConfigLoaderArgs) -> JsonConfigLoader: ...
+    def get_loader(
+        config_loader_args: GcpStorageYamlConfigLoaderArgs, cached: bool = False
+    ) -> YamlConfigLoader | SnapshotConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: GcpStorageYamlConfigLoaderArgs) -> YamlConfigLoader: ...
+    def get_loader(config_loader_args: EnvConfigLoaderArgs, cached: bool = False) -> EnvConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: EnvConfigLoaderArgs) -> EnvConfigLoader: ...
+    def get_loader(config_loader_args: JsonConfigLoaderArgs, cached: bool = False) -> JsonConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: JsonConfigLoaderArgs) -> JsonConfigLoader: ...
+    def get_loader(config_loader_args: YamlConfigLoaderArgs, cached: bool = False) -> YamlConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: YamlConfigLoaderArgs) -> YamlConfigLoader: ...
+    def get_loader(config_loader_args: LayeredConfigLoaderArgs, cached: bool = False) -> LayeredConfigLoader: ...
 
     @overload
     @staticmethod
-    def get_loader(config_loader_args: ConfigLoaderArgs) -> ConfigLoader: ...
-
-    @staticmethod
-    def get_loader(config_loader_args: ConfigLoaderArgs) -> ConfigLoader:
-        if isinstance(config_loader_args, GcpSecretEnvConfigLoaderArgs):
-            config_provider = GcpSecretConfigProvider(
-                secret_name=config_loader_args.secret_name, project_id=config_loader_args.project_id
-            )
-            env_processor = DefaultEnvConfigProcessor()
-            return EnvConfigLoader(config_provider=config_provider, env_processor=env_processor)
-        elif isinstance(config_loader_args, GcpSecretJsonConfigLoaderArgs):
-            config_provider = GcpSecretConfigProvider(
-                secret_name=config_loader_args.secret_name, project_id=config_loader_args.project_id
-            )
-            return JsonConfigLoader(config_provider=config_provider)
-        elif isinstance(config_loader_args, GcpSecretYamlConfigLoaderArgs):
-            config_provider = GcpSecretConfigProvider(
-                secret_name=config_loader_args.secret_name, project_id=config_loader_args.project_id
-            )
-            return YamlConfigLoader(config_provider=config_provider)
-        elif isinstance(config_loader_args, GcpStorageEnvConfigLoaderArgs):
-            config_provider = GcpStorageConfigProvider(
-                bucket_name=config_loader_args.bucket_name,
-                blob_name=config_loader_args.blob_name,
-                project_id=config_loader_args.project_id,
-            )
-            env_processor = DefaultEnvConfigProcessor()
-            return EnvConfigLoader(config_provider=config_provider, env_processor=env_processor)
-        elif isinstance(config_loader_args, GcpStorageJsonConfigLoaderArgs):
-            config_provider = GcpStorageConfigProvider(
-                bucket_name=config_loader_args.bucket_name,
-                blob_name=config_loader_args.blob_name,
-                project_id=config_loader_args.project_id,
-            )
-            return JsonConfigLoader(config_provider=config_provider)
-        elif isinstance(config_loader_args, GcpStorageYamlConfigLoaderArgs):
-            config_provider = GcpStorageConfigProvider(
-                bucket_name=config_loader_args.bucket_name,
-                blob_name=config_loader_args.blob_name,
-                project_id=config_loader_args.project_id,
-            )
-            return YamlConfigLoader(config_provider=config_provider)
-        elif isinstance(config_loader_args, EnvConfigLoaderArgs):
-            config_provider = FileConfigProvider(file_path=config_loader_args.file_path)
-            env_processor = DefaultEnvConfigProcessor()
-            return EnvConfigLoader(config_provider=config_provider, env_processor=env_processor)
-        elif isinstance(config_loader_args, JsonConfigLoaderArgs):
-            config_provider = FileConfigProvider(file_path=config_loader_args.file_path)
-            return JsonConfigLoader(config_provider=config_provider)
-        elif isinstance(config_loader_args, YamlConfigLoaderArgs):
-            config_provider = FileConfigProvider(file_path=config_loader_args.file_path)
-            return YamlConfigLoader(config_provider=config_provider)
-        else:
+    def get_loader(config_loader_args: ConfigLoaderArgs, cached: bool = False) -> ConfigLoader: ...
+
+    @staticmethod
+    def get_loader(config_loader_args: ConfigLoaderArgs, cached: bool = False) -> ConfigLoader:
+        """
+        Create a loader for the provided arguments.
+
+        :param config_loader_args: Arguments specifying the loader type and details.
+        :param cached: Reuse the loader created earlier for equal arguments instead of building a new one.
+                       Arguments that are not hashable are never cached.
+        :return: An instance of the appropriate loader. Once snapshots are enabled, loaders of GCP sources are
+                 wrapped in a `SnapshotConfigLoader`.
+        :raises ValueError: If the argument type is not supported.
+        """
+        if cached:
+            return ConfigLoaderFactory._get_cached_loader(config_loader_args)
+
+        constructor = _LOADERS.resolve(type(config_loader_args))
+        if constructor is None:
+            raise ValueError(f"Unsupported loader arguments: {config_loader_args}")
+
+        config_loader = constructor(config_loader_args)
+        snapshot_store = ConfigLoaderFactory._snapshot_store
+        if snapshot_store is not None and isinstance(config_loader_args, _SNAPSHOT_ARGS):
+            return SnapshotConfigLoader(config_loader, snapshot_store)
+        return config_loader
+
+    @staticmethod
+    def set_snapshot_store(snapshot_store: ConfigSnapshotStore | None) -> None:
+        """
+        Serve the first load of GCP sources from on-disk snapshots kept in `snapshot_store`, revalidated in the
+        background; None disables snapshots. Cached loaders are dropped so the change applies to every subsequent load.
+        """
+        ConfigLoaderFactory._snapshot_store = snapshot_store
+        ConfigLoaderFactory.clear_loader_cache()
+
+    @staticmethod
+    def set_payload_cache(payload_cache: ConfigPayloadCache | None) -> None:
+        """
+        Serve the payloads of GCP sources, synchronous and asynchronous, from `payload_cache` (e.g.
+        `ConfigPayloadCache.default()`): loads within its TTL make no request, and later ones only download the
+        payload again when the source's version marker changed. None disables the cache. Cached loaders are
+        dropped so the change applies to every subsequent load.
+        """
+        ConfigLoaderFactory._payload_cache = payload_cache
+        ConfigLoaderFactory.clear_loader_cache()
+
+    @staticmethod
+    def _get_cached_loader(config_loader_args: ConfigLoaderArgs) -> ConfigLoader:
+        try:
+            loader = ConfigLoaderFactory._loader_cache.get(config_loader_args)
+        except TypeError:
+            # Unhashable arguments cannot be used as a cache key
+            return ConfigLoaderFactory.get_loader(config_loader_args)
+
+        if loader is None:
+            with ConfigLoaderFactory._loader_cache_lock:
+                loader = ConfigLoaderFactory._loader_cache.get(config_loader_args)
+                if loader is None:
+                    loader = ConfigLoaderFactory.get_loader(config_loader_args)
+                    ConfigLoaderFactory._loader_cache[config_loader_args] = loader
+        return loader
+
+    @staticmethod
+    def clear_loader_cache() -> None:
+        """
+        Drop every loader cached by `get_loader(..., cached=True)`.
+        """
+        with ConfigLoaderFactory._loader_cache_lock:
+            ConfigLoaderFactory._loader_cache.clear()
+
+    @staticmethod
+    def load_many(
+        config_loader_args_list: Sequence[ConfigLoaderArgs],
+        max_workers: int = 8,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> list[ConfigLoadResult]:
+        """
+        Load several configuration sources concurrently.
+
+        :param config_loader_args_list: Sources to load.
+        :param max_workers: Maximum number of sources fetched at the same time.
+        :param timeout: Maximum number of seconds a single source may take once started.
+        :param deadline: Maximum number of seconds the whole call may take, queued sources included.
+        :return: One result (configuration or error) per source, in input order.
+        """
+        return load_concurrently(
+            ConfigLoaderFactory.get_loader, config_loader_args_list, max_workers=max_workers, timeout=timeout, deadline=deadline
+        )
+
+    @staticmethod
+    def get_async_loader(config_loader_args: ConfigLoaderArgs) -> AsyncConfigLoader:
+        """
+        Create an asynchronous loader (`await loader.aload()`) for the provided arguments.
+
+        :param config_loader_args: Arguments specifying the loader type and details.
+        :return: An instance of the appropriate asynchronous loader.
+        :raises ValueError: If the argument type is not supported.
+        """
+        constructor = _ASYNC_LOADERS.resolve(type(config_loader_args))
+        if constructor is None:
             raise ValueError(f"Unsupported loader arguments: {config_loader_args}")
+        return constructor(config_loader_args)
@@ -1,8 +1,11 @@
 import logging
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Type, TypeVar
 
+from .concurrent_config_loading import ConfigLoadResult, load_concurrently
 from .config_loader import ConfigLoader
 from .config_loader_args import ConfigLoaderArgs
+from .type_dispatch_table import TypeDispatchTable
 
 T = TypeVar("T", bound="ConfigLoaderArgs")
 
@@ -18,9 +21,11 @@ class ConfigLoaderFactoryRegistry:
         """
         Initialize a ConfigLoaderFactory with an empty registry.
         """
-        self._loader_registry: Dict[Type[Any], Callable[[Any], ConfigLoader]] = {}
+        self._loader_registry: TypeDispatchTable[Callable[[Any], ConfigLoader]] = TypeDispatchTable()
+        self._loader_cache: Dict[Hashable, ConfigLoader] = {}
+        self._loader_cache_lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.info("ConfigLoaderFactory initialized with an empty registry.")
+        self.logger.debug("ConfigLoaderFactory initialized with an empty registry.")
 
     @classmethod
     def default(cls) -> "ConfigLoaderFactoryRegistry":
@@ -39,29 +44,73 @@ class ConfigLoaderFactoryRegistry:
         :param constructor: A callable that accepts `config_loader_args` and returns a ConfigLoader instance.
         """
         if config_loader_args_type in self._loader_registry:
-            self.logger.warning(f"Overwriting existing loader registration for: {config_loader_args_type}")
-        self._loader_registry[config_loader_args_type] = constructor
-        self.logger.info(f"Registered loader for config_loader_args type: {config_loader_args_type}")
+            self.logger.warning("Overwriting existing loader registration for: %s", config_loader_args_type)
+        self._loader_registry.register(config_loader_args_type, constructor)
+        with self._loader_cache_lock:
+            self._loader_cache.clear()
+        self.logger.info("Registered loader for config_loader_args type: %s", config_loader_args_type)
 
-    def get_loader(self, config_loader_args: ConfigLoaderArgs) -> ConfigLoader:
+    def get_loader(self, config_loader_args: ConfigLoaderArgs, cached: bool = False) -> ConfigLoader:
         """
         Create a loader based on the provided arguments.
 
+        Subclasses of a registered argument type use the constructor of their closest registered base class.
+
         :param config_loader_args: Arguments specifying the loader type and details.
+        :param cached: Reuse the loader created earlier for equal arguments instead of building a new one.
+                       Arguments that are not hashable are never cached.
         :return: An instance of the appropriate loader.
         :raises ValueError: If no loader is registered for the argument type.
         """
+        if cached:
+            return self._get_cached_loader(config_loader_args)
+
         config_loader_args_type = type(config_loader_args)  # Dynamically determine the type of `config_loader_args`
-        constructor = self._loader_registry.get(config_loader_args_type)
+        constructor = self._loader_registry.resolve(config_loader_args_type)
 
         if not constructor:
-            self.logger.error(f"No loader registered for argument type: {config_loader_args_type}")
+            self.logger.error("No loader registered for argument type: %s", config_loader_args_type)
             raise ValueError(f"Unsupported loader arguments: {config_loader_args_type}")
 
         try:
             loader = constructor(config_loader_args)  # Pass `config_loader_args` to the constructor
-            self.logger.info(f"Created loader: {loader.__class__.__name__} for config_loader_args: {config_loader_args}")
+            self.logger.debug("Created loader: %s for config_loader_args: %s", loader.__class__.__name__, config_loader_args)
             return loader
         except Exception:
-            self.logger.exception(f"Failed to create loader for config_loader_args: {config_loader_args}")
+            self.logger.exception("Failed to create loader for config_loader_args: %s", config_loader_args)
             raise
+
+    def _get_cached_loader(self, config_loader_args: ConfigLoaderArgs) -> ConfigLoader:
+        try:
+            loader = self._loader_cache.get(config_loader_args)
+        except TypeError:
+            # Unhashable arguments cannot be used as a cache key
+            return self.get_loader(config_loader_args)
+
+        if loader is None:
+            with self._loader_cache_lock:
+                loader = self._loader_cache.get(config_loader_args)
+                if loader is None:
+                    loader = self.get_loader(config_loader_args)
+                    self._loader_cache[config_loader_args] = loader
+        return loader
+
+    def load_many(
+        self,
+        config_loader_args_list: Sequence[ConfigLoaderArgs],
+        max_workers: int = 8,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> list[ConfigLoadResult]:
+        """
+        Load several configuration sources concurrently using the registered loaders.
+
+        :param config_loader_args_list: Sources to load.
+        :param max_workers: Maximum number of sources fetched at the same time.
+        :param timeout: Maximum number of seconds a single source may take once started.
+        :param deadline: Maximum number of seconds the whole call may take, queued sources included.
+        :return: One result (configuration or error) per source, in input order.
+        """
+        return load_concurrently(
+            self.get_loader, config_loader_args_list, max_workers=max_workers, timeout=timeout, deadline=deadline
+        )
@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+ConfigPath = tuple[str, ...]
+
+
+class _ProvenanceNode:
+    """
+    Node of a trie mirroring the points of the merged tree where a layer assigned a value.
+    """
+
+    __slots__ = ("layer", "children")
+
+    def __init__(self, layer: int | None = None):
+        self.layer = layer
+        self.children: dict[str, "_ProvenanceNode"] = {}
+
+
+@dataclass
+class MergedConfig:
+    """
+    Result of a deep merge: the merged configuration and, for each leaf, the index of the layer that supplied it.
+    """
+
+    config: dict[str, Any]
+    provenance: dict[ConfigPath, int] = field(default_factory=dict)
+
+
+def deep_merge(layers: Sequence[dict[str, Any]]) -> MergedConfig:
+    """
+    Deep-merge configuration layers; later layers override earlier ones.
+
+    Dicts are merged key by key, any other value (including lists) replaces the previous one. The merge is
+    iterative rather than recursive and never copies a subtree: the first layer is updated in place and
+    subtrees only present in later layers are linked as-is. The layers are therefore owned by the merge and
+    must not be reused by the caller; the loaders return private copies, which satisfies this.
+
+    :param layers: Parsed configurations, from lowest to highest precedence.
+    :return: The merged configuration with per-leaf provenance.
+    """
+    if not layers:
+        return MergedConfig(config={})
+
+    merged = layers[0]
+    provenance_root = _ProvenanceNode(layer=0)
+
+    for layer_index in range(1, len(layers)):
+        stack: list[tuple[dict[str, Any], dict[str, Any], _ProvenanceNode]] = [(merged, layers[layer_index], provenance_root)]
+        while stack:
+            target, overlay, provenance_node = stack.pop()
+            for key, value in overlay.items():
+                current = target.get(key)
+                child_node = provenance_node.children.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if child_node is None:
+                        child_node = provenance_node.children[key] = _ProvenanceNode()
+                    stack.append((current, value, child_node))
+                else:
+                    target[key] = value
+                    # A replaced subtree forgets where its former descendants came from
+                    provenance_node.children[key] = _ProvenanceNode(layer=layer_index)
+
+    return MergedConfig(config=merged, provenance=_flatten_provenance(merged, provenance_root))
+
+
+def _flatten_provenance(merged: dict[str, Any], provenance_root: _ProvenanceNode) -> dict[ConfigPath, int]:
+    """
+    Walk the merged tree alongside the provenance trie and resolve the layer of every leaf.
+    """
+    provenance: dict[ConfigPath, int] = {}
+    stack: list[tuple[dict[str, Any], ConfigPath, _ProvenanceNode | None, int]] = [
+        (merged, (), provenance_root, provenance_root.layer or 0)
+    ]
+    while stack:
+        node, path, provenance_node, inherited_layer = stack.pop()
+        for key, value in node.items():
+            child_node = provenance_node.children.get(key) if provenance_node is not None else None
+            layer = child_node.layer if child_node is not None and child_node.layer is not None else inherited_layer
+            child_path = path + (key,)
+            if isinstance(value, dict) and value:
+                stack.append((value, child_path, child_node, layer))
+            else:
+                provenance[child_path] = layer
+    return provenance
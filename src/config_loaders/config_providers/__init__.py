@@ -1,6 +1,34 @@
+from .async_caching_config_provider import AsyncCachingConfigProvider
+from .async_config_provider import AsyncConfigProvider
+from .async_file_config_provider import AsyncFileConfigProvider
+from .async_gcp_secret_config_provider import AsyncGcpSecretConfigProvider
+from .async_gcp_storage_config_provider import AsyncGcpStorageConfigProvider
+from .caching_config_provider import CachingConfigProvider
+from .client_pool import ClientPool, ClientPoolStats
+from .config_payload_cache import ConfigPayloadCache, ConfigPayloadCacheStats
 from .config_provider import ConfigProvider
 from .file_config_provider import FileConfigProvider
+from .file_watcher import DEFAULT_WATCH_PATTERNS, FileWatcher
 from .gcp_secret_config_provider import GcpSecretConfigProvider
 from .gcp_storage_config_provider import GcpStorageConfigProvider
+from .remote_change_poller import RemoteChangePoller
 
-__all__ = ["ConfigProvider", "FileConfigProvider", "GcpSecretConfigProvider", "GcpStorageConfigProvider"]
+__all__ = [
+    "AsyncCachingConfigProvider",
+    "AsyncConfigProvider",
+    "AsyncFileConfigProvider",
+    "AsyncGcpSecretConfigProvider",
+    "AsyncGcpStorageConfigProvider",
+    "CachingConfigProvider",
+    "ClientPool",
+    "ClientPoolStats",
+    "ConfigPayloadCache",
+    "ConfigPayloadCacheStats",
+    "ConfigProvider",
+    "FileConfigProvider",
+    "FileWatcher",
+    "DEFAULT_WATCH_PATTERNS",
+    "GcpSecretConfigProvider",
+    "GcpStorageConfigProvider",
+    "RemoteChangePoller",
+]
@@ -0,0 +1,17 @@
+import asyncio
+
+from .async_config_provider import AsyncConfigProvider
+from .caching_config_provider import CachingConfigProvider
+
+
+class AsyncCachingConfigProvider(CachingConfigProvider, AsyncConfigProvider):
+    """
+    Serves the payload of an asynchronous provider from a ConfigPayloadCache without blocking the event loop.
+    Revalidation and download use the wrapped provider's synchronous methods, in a worker thread.
+    """
+
+    async def aget_config(self) -> str | None:
+        """
+        Return the cached payload if it is still valid, otherwise fetch it from the wrapped provider in a worker thread.
+        """
+        return await asyncio.to_thread(self.get_config)
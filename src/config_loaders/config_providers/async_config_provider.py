@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncConfigProvider(ABC):
+    @abstractmethod
+    async def aget_config(self) -> str | None:
+        pass
@@ -0,0 +1,18 @@
+import asyncio
+
+from .async_config_provider import AsyncConfigProvider
+from .file_config_provider import FileConfigProvider
+
+
+class AsyncFileConfigProvider(FileConfigProvider, AsyncConfigProvider):
+    """
+    Provides configuration by reading the content of a file without blocking the event loop.
+    """
+
+    async def aget_config(self) -> str:
+        """
+        Reads the content of the file in a worker thread.
+        :return: File content as a string.
+        :raises FileNotFoundError: If the file does not exist.
+        """
+        return await asyncio.to_thread(self.get_config)
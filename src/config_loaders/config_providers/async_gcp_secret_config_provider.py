@@ -0,0 +1,53 @@
+import asyncio
+import weakref
+from typing import Dict, Hashable
+
+from google.auth.exceptions import DefaultCredentialsError
+from google.cloud.secretmanager import SecretManagerServiceAsyncClient
+
+from .async_config_provider import AsyncConfigProvider
+from .gcp_secret_config_provider import GcpSecretConfigProvider
+
+# Async gRPC channels are bound to the event loop they were created in, so clients are pooled per loop
+# and dropped together with it.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, SecretManagerServiceAsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class AsyncGcpSecretConfigProvider(GcpSecretConfigProvider, AsyncConfigProvider):
+    """
+    Provides secrets from Google Cloud Secret Manager using the asyncio gRPC client.
+    Returns the secret as a raw string.
+    """
+
+    def get_async_client(self) -> SecretManagerServiceAsyncClient:
+        """
+        Return an async Secret Manager client shared by every provider running in the current event loop.
+        """
+        clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+        key = (self.project_id, self.credentials)
+        client = clients.get(key)
+        if client is None:
+            client = SecretManagerServiceAsyncClient(credentials=self.credentials)
+            clients[key] = client
+        return client
+
+    async def aget_config(self) -> str | None:
+        """
+        Fetches the raw secret data from Google Cloud Secret Manager.
+        """
+        try:
+            client = self.get_async_client()
+            secret_path = client.secret_version_path(self.project_id, self.secret_name, "latest")
+            response = await client.access_secret_version(name=secret_path)  # type: ignore
+            self.logger.debug("Successfully fetched secret from: %s", self.secret_name)
+            return response.payload.data.decode("UTF-8")
+        except DefaultCredentialsError as e:
+            self.logger.error("Error loading credentials for project '%s': %s", self.project_id, e)
+            return None
+        except Exception:
+            self.logger.exception(
+                "An unexpected error occurred while fetching secret: %s (Project: %s)", self.secret_name, self.project_id
+            )
+            return None
@@ -0,0 +1,18 @@
+import asyncio
+
+from .async_config_provider import AsyncConfigProvider
+from .gcp_storage_config_provider import GcpStorageConfigProvider
+
+
+class AsyncGcpStorageConfigProvider(GcpStorageConfigProvider, AsyncConfigProvider):
+    """
+    Provides configuration from a file stored in Google Cloud Storage without blocking the event loop.
+    The google-cloud-storage library has no asyncio client, so the download runs in a worker thread
+    using the pooled synchronous client.
+    """
+
+    async def aget_config(self) -> str | None:
+        """
+        Fetches the raw config data from a file in a GCS bucket in a worker thread.
+        """
+        return await asyncio.to_thread(self.get_config)
@@ -0,0 +1,67 @@
+import logging
+import time
+from typing import Hashable
+
+from ..instrumentation import ConfigInstrumentation
+from .config_payload_cache import CachedPayload, ConfigPayloadCache
+from .config_provider import ConfigProvider
+
+
+class CachingConfigProvider(ConfigProvider):
+    """
+    Wraps any ConfigProvider and serves its payload from a ConfigPayloadCache.
+
+    A cached payload is returned as-is while it is younger than the cache TTL. Once expired, the wrapped
+    provider's version marker is compared with the cached one and the payload is only downloaded again
+    when the marker changed (or cannot be determined).
+    """
+
+    def __init__(self, config_provider: ConfigProvider, cache: ConfigPayloadCache | None = None):
+        """
+        Initialize the caching provider.
+        :param config_provider: The provider whose payloads are cached.
+        :param cache: Cache to store payloads in. Defaults to the process-wide cache.
+        """
+        self.config_provider = config_provider
+        self.cache = cache or ConfigPayloadCache.default()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def cache_key(self) -> Hashable:
+        return self.config_provider.cache_key
+
+    def get_version(self) -> Hashable | None:
+        return self.config_provider.get_version()
+
+    def get_config(self) -> str | None:
+        """
+        Return the cached payload if it is still valid, otherwise fetch it from the wrapped provider.
+        """
+        key = self.cache_key
+        entry = self.cache.get(key)
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            ConfigInstrumentation.event("config.payload_cache", source=key, result="hit")
+            return entry.payload
+
+        # The version is read before the payload: if the source changes in between, the stored marker is
+        # older than the payload and the next revalidation simply downloads it again.
+        version = self.config_provider.get_version()
+
+        if entry is not None and version is not None and version == entry.version:
+            self.cache.record_revalidation(entry)
+            ConfigInstrumentation.event("config.payload_cache", source=key, result="revalidated")
+            self.logger.debug("Revalidated cached configuration for: %s", key)
+            return entry.payload
+
+        self.cache.record_miss()
+        ConfigInstrumentation.event("config.payload_cache", source=key, result="miss")
+        payload = ConfigInstrumentation.fetch(self.config_provider)
+        if payload is None:
+            self.cache.invalidate(key)
+            return None
+
+        self.cache.put(key, CachedPayload(payload=payload, version=version, checked_at=time.monotonic()))
+        self.logger.info("Cached configuration for: %s (version: %s)", key, version)
+        return payload
@@ -0,0 +1,116 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable
+
+
+@dataclass(frozen=True)
+class ClientPoolStats:
+    """
+    Snapshot of the counters kept by a ClientPool.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    creation_seconds: float
+
+
+class ClientPool:
+    """
+    A process-wide pool of lazily created API clients.
+
+    Clients are created on first use for a given key and shared by every caller asking for the same key,
+    so the gRPC/HTTP channel, credential discovery and TLS handshake are paid once per process instead of
+    once per request. The pool is safe to use from multiple threads and is emptied in the child process
+    after `os.fork`, because channels inherited across a fork must not be reused.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize an empty pool.
+        :param name: Name of the pool, used for logging.
+        """
+        self.name = name
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        # The pool lock is held while a client is created, so hits are counted under a lock of their own
+        self._stats_lock = threading.Lock()
+        self._clients: Dict[Hashable, Any] = {}
+        self._pid = os.getpid()
+        self._hits = 0
+        self._misses = 0
+        self._creation_seconds = 0.0
+
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the client registered under `key`, creating it with `factory` if necessary.
+
+        :param key: Hashable identity of the client (e.g. project and credentials).
+        :param factory: Zero-argument callable that creates a new client.
+        :return: The pooled client.
+        """
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+
+        client = self._clients.get(key)
+        if client is not None:
+            with self._stats_lock:
+                self._hits += 1
+            return client
+
+        with self._lock:
+            # Double check inside the lock so concurrent first calls create a single client
+            client = self._clients.get(key)
+            if client is not None:
+                with self._stats_lock:
+                    self._hits += 1
+                return client
+
+            with self._stats_lock:
+                self._misses += 1
+            started_at = time.perf_counter()
+            client = factory()
+            elapsed = time.perf_counter() - started_at
+            with self._stats_lock:
+                self._creation_seconds += elapsed
+            self._clients[key] = client
+            self.logger.info("Created client for pool '%s' with key %s in %.4fs", self.name, key, elapsed)
+            return client
+
+    def clear(self) -> None:
+        """
+        Drop every pooled client. Clients are recreated lazily on the next `get`.
+        """
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> ClientPoolStats:
+        """
+        Return a snapshot of the pool counters.
+        """
+        with self._stats_lock:
+            return ClientPoolStats(
+                hits=self._hits, misses=self._misses, size=len(self._clients), creation_seconds=self._creation_seconds
+            )
+
+    def _reset_after_fork(self) -> None:
+        """
+        Forget clients inherited from the parent process and re-create the lock, which may have been held
+        by another thread at fork time.
+        """
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._clients = {}
+        self._pid = os.getpid()
+
+
+# Process-wide pools shared by every GcpSecretConfigProvider / GcpStorageConfigProvider instance
+secret_manager_client_pool = ClientPool("secret_manager")
+storage_client_pool = ClientPool("storage")
+storage_bucket_pool = ClientPool("storage_bucket")
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass
+class CachedPayload:
+    """
+    A configuration payload together with the version marker it was fetched at.
+    """
+
+    payload: str
+    version: Hashable | None
+    checked_at: float
+
+
+@dataclass(frozen=True)
+class ConfigPayloadCacheStats:
+    """
+    Snapshot of the counters kept by a ConfigPayloadCache.
+    """
+
+    hits: int
+    revalidations: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ConfigPayloadCache:
+    """
+    A thread-safe LRU cache of raw configuration payloads keyed by `ConfigProvider.cache_key`.
+
+    Entries younger than `ttl_seconds` are served without contacting the source. Older entries are
+    revalidated against the source's version marker and only re-downloaded when the marker changed.
+    """
+
+    _default_instance: "ConfigPayloadCache | None" = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 128):
+        """
+        Initialize an empty cache.
+        :param ttl_seconds: How long an entry is served before its version marker is checked again.
+        :param max_entries: Maximum number of payloads kept; the least recently used one is evicted first.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CachedPayload] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def default(cls) -> "ConfigPayloadCache":
+        """
+        Retrieve the process-wide cache instance, creating it if necessary.
+        """
+        with cls._default_lock:
+            if cls._default_instance is None:
+                cls._default_instance = cls()
+            return cls._default_instance
+
+    def get(self, key: Hashable) -> CachedPayload | None:
+        """
+        Return the entry stored under `key` and mark it as most recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: CachedPayload) -> None:
+        """
+        Store an entry, evicting the least recently used ones beyond `max_entries`.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Drop the entry stored under `key`, or every entry when `key` is None.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def is_fresh(self, entry: CachedPayload) -> bool:
+        """
+        Return True if the entry was checked against its source less than `ttl_seconds` ago.
+        """
+        with self._lock:
+            return time.monotonic() - entry.checked_at < self.ttl_seconds
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def record_revalidation(self, entry: CachedPayload) -> None:
+        """
+        Mark an entry whose version marker still matches its source as checked now.
+        """
+        with self._lock:
+            entry.checked_at = time.monotonic()
+            self._revalidations += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def stats(self) -> ConfigPayloadCacheStats:
+        """
+        Return a snapshot of the cache counters.
+        """
+        with self._lock:
+            return ConfigPayloadCacheStats(
+                hits=self._hits,
+                revalidations=self._revalidations,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -1,7 +1,25 @@
 from abc import ABC, abstractmethod
+from typing import Hashable
 
 
 class ConfigProvider(ABC):
     @abstractmethod
     def get_config(self) -> str | None:
         pass
+
+    @property
+    def cache_key(self) -> Hashable:
+        """
+        Identity of the configuration source, shared by every provider instance pointing at the same source.
+        Providers used with a cache should override it; the default only matches this very instance.
+        """
+        return (self.__class__.__name__, id(self))
+
+    def get_version(self) -> Hashable | None:
+        """
+        Return a cheap version marker of the configuration source (e.g. file mtime, object generation,
+        secret version) without downloading its content.
+
+        :return: A marker that changes whenever the content changes, or None when it cannot be determined.
+        """
+        return None
@@ -1,4 +1,6 @@
 import logging
+import os
+from typing import Hashable
 
 from .config_provider import ConfigProvider
 
@@ -27,8 +29,23 @@ class FileConfigProvider(ConfigProvider):
             with open(self.file_path, "r") as file:
                 return file.read()
         except FileNotFoundError as e:
-            self.logger.error(f"Error: Configuration file not found at {self.file_path}: {e}")
+            self.logger.error("Error: Configuration file not found at %s: %s", self.file_path, e)
             raise
         except Exception as e:
-            self.logger.exception(f"Unexpected error while reading file {self.file_path}: {e}")
+            self.logger.exception("Unexpected error while reading file %s: %s", self.file_path, e)
             raise
+
+    @property
+    def cache_key(self) -> Hashable:
+        return ("file", os.path.abspath(self.file_path))
+
+    def get_version(self) -> Hashable | None:
+        """
+        Returns the inode, size and modification time of the file as its version marker.
+        :return: Version marker, or None if the file cannot be stat'ed.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
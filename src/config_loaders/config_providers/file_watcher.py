@@ -0,0 +1,371 @@
+import ctypes
+import ctypes.util
+import fnmatch
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Sequence
+
+# Files the watcher reacts to when a directory, rather than a single file, is watched
+DEFAULT_WATCH_PATTERNS = ("config*.yaml", "config*.yml", "config*.json", ".env*")
+
+FileChangeCallback = Callable[[str], Any]
+
+
+def _file_version(path: str) -> Hashable | None:
+    """
+    Return the inode, size and modification time of a file, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+@dataclass
+class _Watch:
+    """
+    A watched file, or a directory whose entries matching `patterns` are watched.
+
+    `versions` holds the file versions the callbacks were last notified about, `seen` those of the last poll.
+    """
+
+    path: str
+    is_directory: bool
+    patterns: Sequence[str]
+    callbacks: list[FileChangeCallback] = field(default_factory=list)
+    versions: dict[str, Hashable | None] = field(default_factory=dict)
+    seen: dict[str, Hashable | None] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.versions = self.snapshot()
+        self.seen = dict(self.versions)
+
+    @property
+    def directory(self) -> str:
+        return self.path if self.is_directory else os.path.dirname(self.path)
+
+    def matches(self, path: str) -> bool:
+        if not self.is_directory:
+            return path == self.path
+        return os.path.dirname(path) == self.path and any(fnmatch.fnmatch(os.path.basename(path), p) for p in self.patterns)
+
+    def snapshot(self) -> dict[str, Hashable | None]:
+        if not self.is_directory:
+            return {self.path: _file_version(self.path)}
+        try:
+            paths = [os.path.join(self.path, name) for name in os.listdir(self.path)]
+        except OSError:
+            return {}
+        return {path: _file_version(path) for path in paths if self.matches(path)}
+
+    def poll(self) -> list[str]:
+        """
+        Return the watched files whose version changed since the previous poll.
+        """
+        snapshot = self.snapshot()
+        changed = [path for path in snapshot.keys() | self.seen.keys() if snapshot.get(path) != self.seen.get(path)]
+        self.seen = snapshot
+        return changed
+
+    def take_changes(self, paths: Sequence[str]) -> list[str]:
+        """
+        Return the watched files among `paths` whose version changed since the callbacks were last notified.
+
+        A watched file is checked whenever anything in its directory changed: a file replaced through a symlink
+        swap (e.g. a mounted Kubernetes ConfigMap) never produces an event under its own name.
+        """
+        if self.is_directory:
+            candidates = [path for path in paths if self.matches(path)]
+        else:
+            candidates = [self.path] if any(os.path.dirname(path) == self.directory for path in paths) else []
+
+        changed = []
+        for path in candidates:
+            version = _file_version(path)
+            if version != self.versions.get(path):
+                self.versions[path] = version
+                changed.append(path)
+        return changed
+
+
+class _Inotify:
+    """
+    Minimal ctypes binding of the Linux inotify API, reporting the directories in which something changed.
+
+    Besides paths, `read_changes` reports whether events may have been lost: the kernel queue overflowed, or a
+    directory watch ended because the directory was removed, moved away or unmounted. Ended watches are forgotten so
+    the directory can be registered again.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_MOVE_SELF = 0x00000800
+    IN_UNMOUNT = 0x00002000
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MOVE_SELF
+    # Events after which the changes of a watched directory may have been missed
+    LOST_EVENTS_MASK = IN_MOVE_SELF | IN_UNMOUNT | IN_Q_OVERFLOW | IN_IGNORED
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: dict[int, str] = {}
+
+    def add_directory(self, directory: str) -> None:
+        if directory in self._directories.values():
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._directories[wd] = directory
+
+    @property
+    def directories(self) -> set[str]:
+        return set(self._directories.values())
+
+    def read_changes(self, timeout: float) -> tuple[set[str], bool]:
+        """
+        Wait up to `timeout` seconds for events.
+
+        :return: The paths the events refer to, and whether events may have been lost.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set(), False
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set(), False
+        return self.parse_events(buffer)
+
+    def parse_events(self, buffer: bytes) -> tuple[set[str], bool]:
+        paths: set[str] = set()
+        lost_events = False
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(buffer):
+            wd, mask, _cookie, name_length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = buffer[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if mask & self.LOST_EVENTS_MASK:
+                lost_events = True
+                self._forget(wd, mask)
+            elif wd in self._directories:
+                paths.add(os.path.join(self._directories[wd], os.fsdecode(name)))
+        return paths, lost_events
+
+    def _forget(self, wd: int, mask: int) -> None:
+        directory = self._directories.pop(wd, None)
+        if directory is not None and mask & self.IN_MOVE_SELF:
+            # The watch follows the moved directory, not its former path: end it, the kernel then sends IN_IGNORED
+            self._rm_watch(self.fd, wd)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    Watches configuration files and calls back once per burst of changes.
+
+    On Linux the watched directories are observed with inotify, which also catches editors and deployment tools
+    replacing a file through a rename. Everywhere else, or when inotify is unavailable, the files are polled with
+    `os.stat`. Changes are debounced: a callback runs once the file has been quiet for `debounce_seconds`, on the
+    watcher's own daemon thread, never on the caller's.
+    """
+
+    _default_instance: "FileWatcher | None" = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, debounce_seconds: float = 0.2, poll_interval: float = 1.0, use_inotify: bool | None = None):
+        """
+        Initialize a watcher; its thread starts with the first watched path.
+        :param debounce_seconds: Quiet period after the last change before the callbacks run.
+        :param poll_interval: Seconds between two stat checks when polling.
+        :param use_inotify: Force (True) or disable (False) inotify. By default it is used when available.
+        """
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+        self._inotify: _Inotify | None = None
+        self._watches: dict[str, _Watch] = {}
+        self._pending: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def default(cls) -> "FileWatcher":
+        """
+        Retrieve the process-wide watcher, creating it if necessary.
+        """
+        with cls._default_lock:
+            if cls._default_instance is None:
+                cls._default_instance = cls()
+            return cls._default_instance
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def watch(self, path: str, callback: FileChangeCallback, patterns: Sequence[str] = DEFAULT_WATCH_PATTERNS) -> None:
+        """
+        Call `callback(changed_path)` whenever the file at `path` changes. If `path` is a directory, every entry
+        matching `patterns` is watched instead.
+        :param path: File or directory to watch. A watched file does not need to exist yet.
+        :param callback: Called on the watcher thread with the path of the changed file.
+        :param patterns: Shell-style file name patterns used for directories.
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            watch = self._watches.get(path)
+            if watch is None:
+                watch = _Watch(path=path, is_directory=os.path.isdir(path), patterns=tuple(patterns))
+                self._watches[path] = watch
+                self._start()
+                self._add_inotify_watch(watch)
+            watch.callbacks.append(callback)
+
+    def unwatch(self, path: str, callback: FileChangeCallback | None = None) -> None:
+        """
+        Stop calling `callback` (or every callback when None) for `path`.
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            watch = self._watches.get(path)
+            if watch is None:
+                return
+            if callback is not None and callback in watch.callbacks:
+                watch.callbacks.remove(callback)
+            if callback is None or not watch.callbacks:
+                del self._watches[path]
+
+    def stop(self) -> None:
+        """
+        Stop the watcher thread and release the inotify descriptor.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError, TypeError) as e:
+                self.logger.warning("inotify is unavailable, falling back to polling every %ss: %s", self.poll_interval, e)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="config-file-watcher", daemon=True)
+        self._thread.start()
+
+    def _add_inotify_watch(self, watch: _Watch) -> None:
+        if self._inotify is None:
+            return
+        try:
+            self._inotify.add_directory(watch.directory)
+        except OSError as e:
+            # The directory does not exist (yet): this watch is covered by the periodic stat check instead
+            self.logger.warning("Could not watch %s with inotify, polling it instead: %s", watch.directory, e)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            timeout = self._next_timeout()
+            if self._inotify is not None:
+                paths, lost_events = self._inotify.read_changes(timeout)
+                self._mark_pending(paths)
+                if lost_events:
+                    self._mark_pending(self._rescan())
+                elif not self._pending:
+                    # Catch watches whose directory could not be registered with inotify, and register those that
+                    # changed since, e.g. a directory created again
+                    unregistered_changes = self._poll_changes(only_unregistered=True)
+                    if unregistered_changes:
+                        self._mark_pending(unregistered_changes)
+                        self._register_watches()
+            else:
+                self._stopped.wait(timeout)
+                self._mark_pending(self._poll_changes())
+            self._fire_due()
+
+    def _rescan(self) -> set[str]:
+        """
+        Register the directory of every watch with inotify again and poll every watch, after events were lost.
+        """
+        self.logger.warning("File change events may have been lost, checking every watched file.")
+        self._register_watches()
+        return self._poll_changes()
+
+    def _register_watches(self) -> None:
+        with self._lock:
+            watches = list(self._watches.values())
+        for watch in watches:
+            # A missing directory stays covered by the periodic stat check
+            if os.path.isdir(watch.directory):
+                self._add_inotify_watch(watch)
+
+    def _next_timeout(self) -> float:
+        if not self._pending:
+            return self.poll_interval
+        return max(0.0, min(self._pending.values()) - time.monotonic())
+
+    def _poll_changes(self, only_unregistered: bool = False) -> set[str]:
+        with self._lock:
+            watches = list(self._watches.values())
+        registered = self._inotify.directories if only_unregistered and self._inotify is not None else set()
+        return {path for watch in watches if watch.directory not in registered for path in watch.poll()}
+
+    def _mark_pending(self, paths: set[str]) -> None:
+        deadline = time.monotonic() + self.debounce_seconds
+        for path in paths:
+            self._pending[path] = deadline
+
+    def _fire_due(self) -> None:
+        now = time.monotonic()
+        due = [path for path, deadline in self._pending.items() if deadline <= now]
+        if not due:
+            return
+        for path in due:
+            del self._pending[path]
+
+        with self._lock:
+            watches = list(self._watches.values())
+        for watch in watches:
+            self._notify(watch, due)
+
+    def _notify(self, watch: _Watch, due: list[str]) -> None:
+        for path in watch.take_changes(due):
+            self.logger.info("Configuration file changed: %s", path)
+            for callback in list(watch.callbacks):
+                try:
+                    callback(path)
+                except Exception as e:
+                    self.logger.exception("Error while handling the change of %s: %s", path, e)
@@ -1,8 +1,11 @@
 import logging
+from typing import Hashable
 
+from google.auth.credentials import Credentials
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud.secretmanager import SecretManagerServiceClient
 
+from .client_pool import ClientPool, secret_manager_client_pool
 from .config_provider import ConfigProvider
 
 
@@ -12,27 +15,69 @@ class GcpSecretConfigProvider(ConfigProvider):
     Returns the secret as a raw string.
     """
 
-    def __init__(self, secret_name: str, project_id: str):
+    def __init__(
+        self,
+        secret_name: str,
+        project_id: str,
+        credentials: Credentials | None = None,
+        client_pool: ClientPool = secret_manager_client_pool,
+    ):
+        """
+        Initialize the provider.
+        :param secret_name: Name of the secret in Secret Manager.
+        :param project_id: GCP project that owns the secret.
+        :param credentials: Optional explicit credentials. Application Default Credentials are used when omitted.
+        :param client_pool: Pool the Secret Manager client is taken from. Defaults to the process-wide pool.
+        """
         self.secret_name = secret_name
         self.project_id = project_id
+        self.credentials = credentials
+        self.client_pool = client_pool
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def get_client(self) -> SecretManagerServiceClient:
+        """
+        Return a pooled Secret Manager client, shared by every provider using the same credentials.
+        """
+        return self.client_pool.get(
+            (self.project_id, self.credentials), lambda: SecretManagerServiceClient(credentials=self.credentials)
+        )
+
+    @property
+    def cache_key(self) -> Hashable:
+        return ("gcp_secret", self.project_id, self.secret_name)
+
+    def get_version(self) -> Hashable | None:
+        """
+        Resolves the `latest` alias to its version name (e.g. `.../versions/7`) without accessing the payload.
+        :return: Version name, or None if it cannot be resolved.
+        """
+        try:
+            client = self.get_client()
+            secret_path = client.secret_version_path(self.project_id, self.secret_name, "latest")
+            return client.get_secret_version(name=secret_path).name  # type: ignore
+        except Exception as e:
+            self.logger.warning(
+                "Could not resolve latest version of secret: %s (Project: %s): %s", self.secret_name, self.project_id, e
+            )
+            return None
+
     def get_config(self) -> str | None:
         """
         Fetches the raw secret data from Google Cloud Secret Manager.
         """
         try:
-            client = SecretManagerServiceClient()
+            client = self.get_client()
             # secret_path = f"projects/{self.project_id}/secrets/{self.secret_name}/versions/latest"
             secret_path = client.secret_version_path(self.project_id, self.secret_name, "latest")
             response = client.access_secret_version(name=secret_path)  # type: ignore
-            self.logger.info(f"Successfully fetched secret from: {self.secret_name}")
+            self.logger.debug("Successfully fetched secret from: %s", self.secret_name)
             return response.payload.data.decode("UTF-8")
         except DefaultCredentialsError as e:
-            self.logger.error(f"Error loading credentials for project '{self.project_id}': {e}")
+            self.logger.error("Error loading credentials for project '%s': %s", self.project_id, e)
             return None
         except Exception:
             self.logger.exception(
-                f"An unexpected error occurred while fetching secret: {self.secret_name} (Project: {self.project_id})"
+                "An unexpected error occurred while fetching secret: %s (Project: %s)", self.secret_name, self.project_id
             )
             return None
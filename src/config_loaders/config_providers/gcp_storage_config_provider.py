@@ -1,8 +1,13 @@
 import logging
+from typing import Hashable
 
+from google.api_core.exceptions import NotFound
+from google.auth.credentials import Credentials
 from google.auth.exceptions import DefaultCredentialsError
+from google.cloud.storage import Bucket
 from google.cloud.storage import Client as StorageClient
 
+from .client_pool import ClientPool, storage_bucket_pool, storage_client_pool
 from .config_provider import ConfigProvider
 
 
@@ -12,36 +17,97 @@ class GcpStorageConfigProvider(ConfigProvider):
     Returns the file content as a raw string.
     """
 
-    def __init__(self, bucket_name: str, blob_name: str, project_id: str):
+    def __init__(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        project_id: str,
+        credentials: Credentials | None = None,
+        client_pool: ClientPool = storage_client_pool,
+        bucket_pool: ClientPool = storage_bucket_pool,
+    ):
+        """
+        Initialize the provider.
+        :param bucket_name: Name of the GCS bucket.
+        :param blob_name: Name of the object holding the configuration.
+        :param project_id: GCP project that owns the bucket.
+        :param credentials: Optional explicit credentials. Application Default Credentials are used when omitted.
+        :param client_pool: Pool the Storage client is taken from. Defaults to the process-wide pool.
+        :param bucket_pool: Pool the bucket handle is taken from. Defaults to the process-wide pool.
+        """
         self.bucket_name = bucket_name
         self.blob_name = blob_name
         self.project_id = project_id
+        self.credentials = credentials
+        self.client_pool = client_pool
+        self.bucket_pool = bucket_pool
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def get_config(self) -> str | None:
+    def get_client(self) -> StorageClient:
         """
-        Fetches the raw config data from a file in a GCS bucket.
+        Return a pooled Storage client, shared by every provider using the same project and credentials.
+        """
+        return self.client_pool.get(
+            (self.project_id, self.credentials), lambda: StorageClient(project=self.project_id, credentials=self.credentials)
+        )
+
+    def get_bucket(self) -> Bucket:
+        """
+        Return a pooled bucket handle. Creating the handle does not perform any request.
+        """
+        return self.bucket_pool.get(
+            (self.project_id, self.credentials, self.bucket_name), lambda: self.get_client().bucket(self.bucket_name)
+        )
+
+    @property
+    def cache_key(self) -> Hashable:
+        return ("gcp_storage", self.project_id, self.bucket_name, self.blob_name)
+
+    def get_version(self) -> Hashable | None:
+        """
+        Returns the generation and etag of the blob from a metadata-only request.
+        :return: Version marker, or None if the blob does not exist or its metadata cannot be fetched.
         """
         try:
-            client = StorageClient(project=self.project_id)
-            bucket = client.bucket(self.bucket_name)
-            blob = bucket.blob(self.blob_name)
-            if not blob.exists():
-                self.logger.error(
-                    f"Blob '{self.blob_name}' does not exist in bucket '{self.bucket_name}' within project '{self.project_id}'."
-                )
+            blob = self.get_bucket().get_blob(self.blob_name)
+            if blob is None:
                 return None
+            return (blob.generation, blob.etag)
+        except Exception as e:
+            self.logger.warning(
+                "Could not fetch metadata of gs://%s/%s (Project: %s): %s", self.bucket_name, self.blob_name, self.project_id, e
+            )
+            return None
 
+    def get_config(self) -> str | None:
+        """
+        Fetches the raw config data from a file in a GCS bucket.
+        A missing blob is detected from the 404 of the download itself, so each call costs a single request.
+        """
+        try:
+            blob = self.get_bucket().blob(self.blob_name)
             data = blob.download_as_text()
-            self.logger.info(
-                f"Successfully fetched config file from GCS: gs://{self.bucket_name}/{self.blob_name} (Project: {self.project_id})"
+            self.logger.debug(
+                "Successfully fetched config file from GCS: gs://%s/%s (Project: %s)",
+                self.bucket_name,
+                self.blob_name,
+                self.project_id,
             )
             return data
+        except NotFound:
+            self.logger.error(
+                "Blob '%s' does not exist in bucket '%s' within project '%s'.", self.blob_name, self.bucket_name, self.project_id
+            )
+            return None
         except DefaultCredentialsError as e:
-            self.logger.error(f"Error loading credentials for project '{self.project_id}': {e}")
+            self.logger.error("Error loading credentials for project '%s': %s", self.project_id, e)
             return None
         except Exception as e:
             self.logger.exception(
-                f"An unexpected error occurred while fetching config from GCS: gs://{self.bucket_name}/{self.blob_name} (Project: {self.project_id}): {e}"
+                "An unexpected error occurred while fetching config from GCS: gs://%s/%s (Project: %s): %s",
+                self.bucket_name,
+                self.blob_name,
+                self.project_id,
+                e,
             )
             return None
@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Hashable, Sequence
+
+from .config_provider import ConfigProvider
+from .gcp_storage_config_provider import GcpStorageConfigProvider
+
+ConfigChangeCallback = Callable[[ConfigProvider], Any]
+
+# Only the fields needed to compare versions are requested when listing blobs
+_LIST_BLOBS_FIELDS = "items(name,generation,etag),nextPageToken"
+
+
+class _TrackedSource:
+    """
+    A configuration source, the last version seen for it and the callbacks to run when it changes.
+    """
+
+    __slots__ = ("provider", "version", "callbacks", "first_fetched")
+
+    def __init__(self, provider: ConfigProvider):
+        self.provider = provider
+        self.version: Hashable | None = None
+        self.first_fetched = False
+        self.callbacks: list[ConfigChangeCallback] = []
+
+
+class RemoteChangePoller:
+    """
+    Periodically checks remote configuration sources for new versions and calls back only for the changed ones.
+
+    Checks use metadata only, never payloads:
+      - GCS blobs sharing a bucket and "directory" prefix are checked with a single `list_blobs` request,
+        which returns the generation and etag of every tracked blob at once.
+      - Secrets and any other provider are checked with their `get_version()` (for secrets, a
+        `get_secret_version` metadata lookup rather than an `access_secret_version` download).
+
+    The payload of a source is only downloaded again when a callback reloads it. A source whose version cannot
+    be fetched keeps its previous version, so transient errors never trigger reloads.
+    """
+
+    _default_instance: "RemoteChangePoller | None" = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, interval_seconds: float = 60.0):
+        """
+        Initialize a poller; its thread starts with the first watched source.
+        :param interval_seconds: Seconds between two checks.
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive.")
+        self.interval_seconds = interval_seconds
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._sources: dict[Hashable, _TrackedSource] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # Set to wake the thread up when a source without a first version is watched, or to stop it
+        self._wakeup = threading.Event()
+        # Set while every watched source had its first version fetched
+        self._tracked = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def default(cls) -> "RemoteChangePoller":
+        """
+        Retrieve the process-wide poller, creating it if necessary.
+        """
+        with cls._default_lock:
+            if cls._default_instance is None:
+                cls._default_instance = cls()
+            return cls._default_instance
+
+    def watch(self, provider: ConfigProvider, callback: ConfigChangeCallback) -> None:
+        """
+        Call `callback(provider)` whenever a new version of the provider's source is detected.
+
+        This call makes no request, so it is safe at import time (e.g. in a decorator). The version changes are
+        compared against is fetched by the polling thread right after, and a change published before that is
+        not reported; `wait_until_tracked` waits for it. Providers with the same `cache_key` are tracked once.
+        """
+        with self._lock:
+            source = self._sources.get(provider.cache_key)
+            if source is None:
+                source = self._sources[provider.cache_key] = _TrackedSource(provider)
+                self._tracked.clear()
+                self._wakeup.set()
+            source.callbacks.append(callback)
+            self._start()
+
+    def wait_until_tracked(self, timeout: float | None = None) -> bool:
+        """
+        Block until the first version of every watched source was fetched.
+
+        :return: False if `timeout` expired first.
+        """
+        return self._tracked.wait(timeout)
+
+    def unwatch(self, provider: ConfigProvider) -> None:
+        """
+        Stop tracking the source of `provider`.
+        """
+        with self._lock:
+            self._sources.pop(provider.cache_key, None)
+
+    def stop(self) -> None:
+        """
+        Stop the polling thread.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check_now(self) -> list[ConfigProvider]:
+        """
+        Check every tracked source once and run the callbacks of those that changed.
+
+        :return: The providers of the changed sources.
+        """
+        with self._lock:
+            sources = list(self._sources.values())
+
+        versions = self.fetch_versions([source.provider for source in sources])
+        changed = []
+        for source in sources:
+            version = versions.get(source.provider.cache_key)
+            if version is None or version == source.version:
+                continue
+            first_check, source.version = source.version is None, version
+            if not first_check:
+                changed.append(source)
+
+        for source in changed:
+            self.logger.info("Configuration source changed: %s", source.provider.cache_key)
+            for callback in list(source.callbacks):
+                try:
+                    callback(source.provider)
+                except Exception as e:
+                    self.logger.exception("Error while handling the change of %s: %s", source.provider.cache_key, e)
+        return [source.provider for source in changed]
+
+    def fetch_versions(self, providers: Sequence[ConfigProvider]) -> dict[Hashable, Hashable | None]:
+        """
+        Fetch the current version marker of every provider, batching GCS blobs per bucket prefix.
+
+        :return: Version marker per provider `cache_key`; None when it could not be fetched.
+        """
+        versions: dict[Hashable, Hashable | None] = {}
+        storage_groups: dict[Hashable, list[GcpStorageConfigProvider]] = defaultdict(list)
+        for provider in providers:
+            if isinstance(provider, GcpStorageConfigProvider):
+                storage_groups[_storage_group_key(provider)].append(provider)
+            else:
+                versions[provider.cache_key] = provider.get_version()
+
+        for group in storage_groups.values():
+            if len(group) == 1:
+                versions[group[0].cache_key] = group[0].get_version()
+            else:
+                versions.update(self._fetch_storage_versions(group))
+        return versions
+
+    def _fetch_storage_versions(self, group: list[GcpStorageConfigProvider]) -> dict[Hashable, Hashable | None]:
+        """
+        Fetch the generation and etag of several blobs under the same bucket prefix with one listing.
+        """
+        first = group[0]
+        try:
+            blobs = first.get_bucket().list_blobs(prefix=_blob_prefix(first.blob_name), delimiter="/", fields=_LIST_BLOBS_FIELDS)
+            listed = {blob.name: (blob.generation, blob.etag) for blob in blobs}
+        except Exception as e:
+            self.logger.warning("Could not list gs://%s/%s: %s", first.bucket_name, _blob_prefix(first.blob_name), e)
+            return {provider.cache_key: None for provider in group}
+        return {provider.cache_key: listed.get(provider.blob_name) for provider in group}
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="config-change-poller", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        next_check_at = time.monotonic() + self.interval_seconds
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            try:
+                self._fetch_first_versions()
+            except Exception as e:
+                self.logger.exception("Error while fetching the first versions of configuration sources: %s", e)
+            if self._wakeup.wait(max(0.0, next_check_at - time.monotonic())) or self._stopped.is_set():
+                continue
+            try:
+                self.check_now()
+            except Exception as e:
+                self.logger.exception("Error while checking configuration sources for changes: %s", e)
+            next_check_at = time.monotonic() + self.interval_seconds
+
+    def _fetch_first_versions(self) -> None:
+        """
+        Record the version of every source watched since the last pass, without running callbacks.
+        """
+        with self._lock:
+            sources = [source for source in self._sources.values() if not source.first_fetched]
+        if sources:
+            versions = self.fetch_versions([source.provider for source in sources])
+            for source in sources:
+                source.first_fetched = True
+                if source.version is None:
+                    source.version = versions.get(source.provider.cache_key)
+        with self._lock:
+            if not self._wakeup.is_set():
+                self._tracked.set()
+
+
+def _blob_prefix(blob_name: str) -> str:
+    """
+    Return the "directory" of a blob name, e.g. `configs/` for `configs/app.yaml`.
+    """
+    directory, separator, _ = blob_name.rpartition("/")
+    return directory + separator
+
+
+def _storage_group_key(provider: GcpStorageConfigProvider) -> Hashable:
+    return (provider.project_id, provider.credentials, provider.bucket_name, _blob_prefix(provider.blob_name))
@@ -0,0 +1,89 @@
+import functools
+from typing import Any, Callable, Type
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from .async_config_loader import AsyncConfigLoader
+from .async_json_config_loader import AsyncJsonConfigLoader
+from .config_loader import ConfigLoader
+from .instrumentation import ConfigInstrumentation
+from .json_config_loader import JsonConfigLoader
+from .lazy_settings import LazySettings
+
+
+class ConfigSettings(BaseModel):
+    """
+    Base class of settings models loaded from a ConfigLoader.
+
+    Validation goes through the model's compiled validator (`model_validate`) instead of spreading the config into
+    the constructor. Settings loaded by a JSON loader are validated straight from the raw payload with
+    `model_validate_json`, skipping the intermediate dict.
+
+    `load_lazy` returns a `LazySettings` view instead, which validates each top-level section on first access rather
+    than the whole model up front.
+    """
+
+    @classmethod
+    def load(cls, config_loader: ConfigLoader) -> Self:
+        """
+        Load and validate the settings.
+
+        :param config_loader: Loader of the configuration.
+        :return: The settings.
+        :raises pydantic.ValidationError: If the configuration does not match the model.
+        """
+        if isinstance(config_loader, JsonConfigLoader):
+            with ConfigInstrumentation.load_span(config_loader, config_loader.config_provider):
+                config_content = _require_content(ConfigInstrumentation.fetch(config_loader.config_provider))
+            return _validate(cls, "json", cls.model_validate_json, config_content)
+        return _validate(cls, "python", cls.model_validate, config_loader.load())
+
+    @classmethod
+    async def aload(cls, config_loader: AsyncConfigLoader) -> Self:
+        """
+        Load and validate the settings without blocking the event loop.
+
+        :param config_loader: Asynchronous loader of the configuration.
+        :return: The settings.
+        :raises pydantic.ValidationError: If the configuration does not match the model.
+        """
+        if isinstance(config_loader, AsyncJsonConfigLoader):
+            with ConfigInstrumentation.load_span(config_loader, config_loader.config_provider):
+                config_content = _require_content(await ConfigInstrumentation.afetch(config_loader.async_config_provider))
+            return _validate(cls, "json", cls.model_validate_json, config_content)
+        return _validate(cls, "python", cls.model_validate, await config_loader.aload())
+
+    @classmethod
+    def load_lazy(cls, config_loader: ConfigLoader) -> "LazySettings[Self]":
+        """
+        Load the settings as a view validating each section on first access.
+
+        :param config_loader: Loader of the configuration.
+        :return: A `LazySettings` view of the settings.
+        """
+        return _validate(cls, "lazy", functools.partial(LazySettings, cls), config_loader.load())
+
+    @classmethod
+    async def aload_lazy(cls, config_loader: AsyncConfigLoader) -> "LazySettings[Self]":
+        """
+        Load the settings without blocking the event loop, as a view validating each section on first access.
+
+        :param config_loader: Asynchronous loader of the configuration.
+        :return: A `LazySettings` view of the settings.
+        """
+        return _validate(cls, "lazy", functools.partial(LazySettings, cls), await config_loader.aload())
+
+
+def _validate(settings_type: Type[BaseModel], mode: str, validate: Callable[[Any], Any], config: Any) -> Any:
+    """
+    Build the settings from the loaded configuration in a `config.validate` span.
+    """
+    with ConfigInstrumentation.span("config.validate", settings=settings_type.__name__, mode=mode):
+        return validate(config)
+
+
+def _require_content(config_content: str | None) -> str:
+    if config_content is None or not config_content.strip():
+        raise ValueError("Configuration content is empty or invalid.")
+    return config_content
@@ -0,0 +1,178 @@
+import datetime
+import hashlib
+import hmac
+import io
+import logging
+import os
+import pickle
+import stat
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+_MAGIC = b"CFGSNAP1"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+# The only classes a snapshot may contain besides builtin containers and scalars (YAML dates and timestamps)
+_ALLOWED_CLASSES = {
+    ("datetime", "date"): datetime.date,
+    ("datetime", "datetime"): datetime.datetime,
+    ("datetime", "time"): datetime.time,
+    ("datetime", "timedelta"): datetime.timedelta,
+    ("datetime", "timezone"): datetime.timezone,
+}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Last known good state of a configuration source: the raw payload, its version marker and the parsed config.
+    """
+
+    payload: str
+    version: Hashable | None
+    config: dict[str, Any]
+    saved_at: float
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickler refusing every class but the few a parsed configuration can hold, so a tampered snapshot cannot
+    instantiate arbitrary objects.
+    """
+
+    def find_class(self, module: str, name: str) -> Any:
+        allowed = _ALLOWED_CLASSES.get((module, name))
+        if allowed is None:
+            raise pickle.UnpicklingError(f"Forbidden class in configuration snapshot: {module}.{name}")
+        return allowed
+
+
+class ConfigSnapshotStore:
+    """
+    Persists configuration snapshots on local disk so a cold start can serve configuration before reaching the
+    remote source.
+
+    Snapshots are pickled (the fastest binary form for parsed dicts) behind a header holding a checksum of the
+    body; a truncated or corrupted file is detected, discarded and reported as missing. Files are written to a
+    temporary file and renamed into place, so readers never observe a partially written snapshot.
+
+    Snapshots hold raw payloads, secrets included, so the directory must belong to the current user and be
+    inaccessible to anyone else: a directory that is not is refused rather than read or written. With a secret
+    key (per deployment, e.g. from Secret Manager) the checksum is an HMAC-SHA256, and only a holder of the key
+    can produce a snapshot that is accepted; without one it is a plain SHA-256, which only detects corruption.
+    """
+
+    def __init__(self, directory: str | None = None, secret_key: bytes | str | None = None):
+        """
+        Initialize the store.
+        :param directory: Directory holding the snapshots. Defaults to the `CONFIG_SNAPSHOT_DIR` environment
+                          variable if set, otherwise to a per-user `config-snapshots-<uid>` directory in the temp
+                          directory (`/tmp` on Cloud Functions).
+        :param secret_key: Key authenticating the snapshots. Defaults to the `CONFIG_SNAPSHOT_KEY` environment
+                           variable if set.
+        """
+        self.directory = directory or os.environ.get("CONFIG_SNAPSHOT_DIR") or _default_directory()
+        secret_key = secret_key or os.environ.get("CONFIG_SNAPSHOT_KEY")
+        self._secret_key = secret_key.encode("utf-8") if isinstance(secret_key, str) else secret_key
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def path_for(self, key: Hashable) -> str:
+        """
+        Return the file holding the snapshot of `key`.
+        """
+        return os.path.join(self.directory, hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".snapshot")
+
+    def load(self, key: Hashable) -> ConfigSnapshot | None:
+        """
+        Read the snapshot of `key`.
+
+        :return: The snapshot, or None if there is none or it is corrupted.
+        """
+        path = self.path_for(key)
+        try:
+            self._check_directory()
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning("Could not read configuration snapshot %s: %s", path, e)
+            return None
+
+        header_size = len(_MAGIC) + _DIGEST_SIZE
+        body = data[header_size:]
+        if data[: len(_MAGIC)] != _MAGIC or not hmac.compare_digest(data[len(_MAGIC) : header_size], self._digest(body)):
+            self.logger.warning("Discarding corrupted configuration snapshot %s.", path)
+            self.delete(key)
+            return None
+
+        try:
+            return ConfigSnapshot(**_SnapshotUnpickler(io.BytesIO(body)).load())
+        except Exception as e:
+            self.logger.warning("Discarding unreadable configuration snapshot %s: %s", path, e)
+            self.delete(key)
+            return None
+
+    def save(self, key: Hashable, payload: str, version: Hashable | None, config: dict[str, Any]) -> ConfigSnapshot:
+        """
+        Atomically write the snapshot of `key`.
+
+        :return: The saved snapshot.
+        :raises PermissionError: If the directory is not private to the current user.
+        """
+        snapshot = ConfigSnapshot(payload=payload, version=version, config=config, saved_at=time.time())
+        body = pickle.dumps(
+            {"payload": payload, "version": version, "config": config, "saved_at": snapshot.saved_at},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._check_directory()
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_MAGIC + self._digest(body) + body)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path_for(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return snapshot
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove the snapshot of `key`, if any.
+        """
+        try:
+            os.unlink(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def _digest(self, body: bytes) -> bytes:
+        if self._secret_key:
+            return hmac.digest(self._secret_key, body, "sha256")
+        return hashlib.sha256(body).digest()
+
+    def _check_directory(self) -> None:
+        """
+        Refuse a snapshot directory that is a symlink, is owned by another user or is accessible to other users.
+
+        :raises FileNotFoundError: If the directory does not exist.
+        :raises PermissionError: If the directory is not private to the current user.
+        """
+        info = os.lstat(self.directory)
+        if not hasattr(os, "getuid"):
+            return
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise PermissionError(
+                f"Refusing configuration snapshot directory {self.directory}: it must be a directory owned by the "
+                f"current user with mode 0700 (owner {info.st_uid}, mode {stat.filemode(info.st_mode)})."
+            )
+
+
+def _default_directory() -> str:
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return os.path.join(tempfile.gettempdir(), f"config-snapshots-{user}")
@@ -5,12 +5,16 @@ from .inject_settings_from_env_file import inject_settings_from_env_file
 from .inject_settings_from_json_file import inject_settings_from_json_file
 from .inject_settings_from_loader_args import inject_settings_from_loader_args
 from .inject_settings_from_yaml_file import inject_settings_from_yaml_file
+from .reload_on_config_change import reload_on_config_change
+from .reload_on_file_change import reload_on_file_change
 
 __all__ = [
     "inject_settings_from_env_file",
     "inject_settings_from_json_file",
     "inject_settings_from_yaml_file",
     "inject_settings_from_loader_args",
+    "reload_on_config_change",
+    "reload_on_file_change",
 ]
 __all__.extend(base_inject_settings.__all__)
 __all__.extend(gcp_secret_settings_decorators.__all__)
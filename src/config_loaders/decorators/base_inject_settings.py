@@ -1,10 +1,14 @@
 import functools
 import inspect
-from typing import Any, Callable, ParamSpec, Protocol, Type, TypeVar, get_type_hints
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, ParamSpec, Protocol, Type, TypeVar, get_args, get_origin, get_type_hints
 
 from typing_extensions import Self
 
-from config_loaders import ConfigLoader
+from config_loaders import AsyncConfigLoader, ConfigLoader
+from config_loaders.lazy_settings import LazySettings
+
+from .settings_holder import RefreshHook, SettingsHolder
 
 
 class BaseSettings(Protocol):
@@ -12,6 +16,11 @@ class BaseSettings(Protocol):
     def load(cls: Type[Self], config_loader: ConfigLoader) -> Self: ...
 
 
+class AsyncBaseSettings(BaseSettings, Protocol):
+    @classmethod
+    async def aload(cls: Type[Self], config_loader: AsyncConfigLoader) -> Self: ...
+
+
 # TypeVar for settings classes that implement BaseSettings
 TSettings = TypeVar("TSettings", bound=BaseSettings)
 
@@ -20,10 +29,19 @@ P = ParamSpec("P")
 # TypeVar for the decorated function’s return
 R = TypeVar("R")
 
+# Registers a callback that reloads the injected settings, e.g. when their source changes
+ReloadHook = Callable[[Callable[[], bool]], Any]
+
 
 def inject_settings(
     loader_func: Callable[..., TSettings],
     param_name: str = "settings",
+    async_loader_func: Callable[..., Awaitable[TSettings]] | None = None,
+    reload_on: ReloadHook | None = None,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
     **loader_args: Any,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     # ) -> Callable[[Callable[P, R]], Callable[P, R]]:
@@ -34,6 +52,25 @@ def inject_settings(
       - Loads the settings object once (via `loader_func(SettingsClass=..., **loader_args)`),
       - Injects it into `kwargs[param_name]` if not already present.
 
+    `async def` functions are supported as well: the settings are loaded with `async_loader_func` when it is
+    given, otherwise `loader_func` runs in a worker thread so the event loop is never blocked.
+
+    Loading is single-flight: concurrent first calls wait for one load instead of each fetching the source, and
+    functions decorated with the same loader, settings type and (hashable) loader arguments share one settings
+    object. A failed load is retried by calls made after `SettingsHolder.retry_after` seconds.
+
+    With a `ttl` (in seconds), expired settings keep being injected while a single background refresh loads new
+    ones; expiries are shortened by a random fraction of up to `ttl_jitter` so that many instances do not refresh
+    at the same moment, and `on_refresh(duration, error)` is called after each refresh.
+
+    When `reload_on` is given, it is called once with a `reload()` callback. Calling it (typically from a file
+    watcher thread) loads and validates the settings again and atomically swaps them in for subsequent calls;
+    if loading fails the previous settings are kept.
+
+    With `lazy=True`, a `LazySettings` view is injected instead, loaded with the settings type's `load_lazy` and
+    `aload_lazy`: each section is validated when the function first reads it, on the first load and after every
+    reload or refresh. The parameter may be annotated with the settings type or with `LazySettings[SettingsType]`.
+
     Usage:
         @inject_settings(loader_func=my_loader, param_name="my_settings", bucket="...", blob="...")
         def my_func(req, my_settings: MySettings):
@@ -43,37 +80,30 @@ def inject_settings(
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
 
-        # 1) Inspect the function signature & type hints
-        sig = inspect.signature(func)
-        hints = get_type_hints(func, include_extras=True)
-
-        # 2) Find which parameter is named 'settings' (or whichever logic you prefer)
-        settings_param = sig.parameters.get(param_name, None)
-        if settings_param is None:
-            raise TypeError(f"inject_settings could not find a parameter named 'settings' " f"in the function {func.__name__}.")
-
-        # 3) Resolve the annotation for 'settings'
-        annotated_type = hints.get(param_name, settings_param.annotation)
-        if annotated_type is inspect._empty:
-            raise TypeError(f"The 'settings' parameter in {func.__name__} is not annotated with a type.")
-
-        # 4) We'll call loader_func(SettingsClass=<the annotated_type>, **loader_args)
-        #    on the first call, then cache the result.
-        loaded_settings: TSettings | None = None
+        # 1) Resolve the settings type from the annotation of the 'settings' parameter
+        annotated_type = _resolve_settings_type(func, param_name)
+        if lazy:
+            annotated_type = _LazyLoading.of(annotated_type)
+
+        # 2) We'll call loader_func(SettingsClass=<the annotated_type>, **loader_args)
+        #    on the first call, then keep the result in a holder that reloads can swap.
+        settings_holder = _settings_holder(
+            loader_func, async_loader_func, annotated_type, loader_args, ttl=ttl, ttl_jitter=ttl_jitter, on_refresh=on_refresh
+        )
+        if reload_on is not None:
+            reload_on(settings_holder.reload)
+
+        if inspect.iscoroutinefunction(func):
+            aload = None
+            if async_loader_func is not None:
+                aload = functools.partial(async_loader_func, SettingsClass=annotated_type, **loader_args)
+            return _wrap_async(func, param_name, settings_holder, aload)  # type: ignore
 
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            nonlocal loaded_settings
-
             # If 'settings' not in kwargs, inject our loaded one.
             if param_name not in kwargs:
-                if loaded_settings is None:
-                    # Load once
-                    # 5) The loader_func must accept `SettingsClass=<...>` or similar
-                    #    Adjust if your loader_func expects a different signature
-                    loaded_settings = loader_func(SettingsClass=annotated_type, **loader_args)
-
-                kwargs[param_name] = loaded_settings
+                kwargs[param_name] = settings_holder.get()
 
             return func(*args, **kwargs)
 
@@ -82,4 +112,93 @@ def inject_settings(
     return decorator
 
 
-__all__ = ["BaseSettings", "TSettings", "inject_settings"]
+def _settings_holder(
+    loader_func: Callable[..., Any],
+    async_loader_func: Callable[..., Awaitable[Any]] | None,
+    annotated_type: Any,
+    loader_args: dict[str, Any],
+    **options: Any,
+) -> SettingsHolder[Any]:
+    """
+    Return the holder of the settings loaded by `loader_func`, shared process-wide with every function using the
+    same loaders, settings type, loader arguments and holder options. Unhashable arguments get a holder of their own.
+    """
+    load = functools.partial(loader_func, SettingsClass=annotated_type, **loader_args)
+    key = (loader_func, async_loader_func, annotated_type, tuple(sorted(loader_args.items())), tuple(sorted(options.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return SettingsHolder(load, **options)
+    return SettingsHolder.shared(key, load, **options)
+
+
+@dataclass(frozen=True)
+class _LazyLoading:
+    """
+    Stands in for a settings type as the `SettingsClass` given to the loader functions, so that their
+    `SettingsClass.load(...)` and `SettingsClass.aload(...)` calls return a `LazySettings` view.
+    """
+
+    settings_type: Any
+
+    @classmethod
+    def of(cls, annotated_type: Any) -> "_LazyLoading":
+        """
+        :raises TypeError: If the settings type cannot be loaded lazily.
+        """
+        settings_type = get_args(annotated_type)[0] if get_origin(annotated_type) is LazySettings else annotated_type
+        if not hasattr(settings_type, "load_lazy"):
+            raise TypeError(f"Settings type '{settings_type.__name__}' has no 'load_lazy' method and cannot be loaded lazily.")
+        return cls(settings_type)
+
+    def load(self, config_loader: ConfigLoader) -> LazySettings[Any]:
+        return self.settings_type.load_lazy(config_loader)
+
+    async def aload(self, config_loader: AsyncConfigLoader) -> LazySettings[Any]:
+        return await self.settings_type.aload_lazy(config_loader)
+
+
+def _resolve_settings_type(func: Callable[..., Any], param_name: str) -> Any:
+    """
+    Return the type annotated on the `param_name` parameter of `func`.
+
+    :raises TypeError: If the parameter does not exist or is not annotated.
+    """
+    # Inspect the function signature & type hints
+    sig = inspect.signature(func)
+    hints = get_type_hints(func, include_extras=True)
+
+    # Find which parameter is named 'settings' (or whichever logic you prefer)
+    settings_param = sig.parameters.get(param_name, None)
+    if settings_param is None:
+        raise TypeError(f"inject_settings could not find a parameter named 'settings' " f"in the function {func.__name__}.")
+
+    # Resolve the annotation for 'settings'
+    annotated_type = hints.get(param_name, settings_param.annotation)
+    if annotated_type is inspect._empty:
+        raise TypeError(f"The 'settings' parameter in {func.__name__} is not annotated with a type.")
+
+    return annotated_type
+
+
+def _wrap_async(
+    func: Callable[..., Awaitable[Any]],
+    param_name: str,
+    settings_holder: SettingsHolder[Any],
+    aload: Callable[[], Awaitable[Any]] | None,
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap an `async def` function so settings are loaded once without blocking the event loop.
+    """
+
+    @functools.wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if param_name not in kwargs:
+            kwargs[param_name] = await settings_holder.aget(aload)
+
+        return await func(*args, **kwargs)
+
+    return async_wrapper
+
+
+__all__ = ["AsyncBaseSettings", "BaseSettings", "RefreshHook", "ReloadHook", "SettingsHolder", "TSettings", "inject_settings"]
@@ -3,21 +3,28 @@ from typing import Type
 from config_loaders import ConfigLoaderFactory, GcpStorageJsonConfigLoaderArgs
 
 from ..base_inject_settings import TSettings, inject_settings
+from ..reload_on_config_change import reload_on_config_change_if
 
 
 def load_settings_from_gcp_storage_json(
     *, bucket_name: str, blob_name: str, project_id: str, SettingsClass: Type[TSettings]
 ) -> TSettings:
     gcp_json_config_loader = ConfigLoaderFactory.get_loader(
-        GcpStorageJsonConfigLoaderArgs(bucket_name=bucket_name, blob_name=blob_name, project_id=project_id)
+        GcpStorageJsonConfigLoaderArgs(bucket_name=bucket_name, blob_name=blob_name, project_id=project_id), cached=True
     )
     return SettingsClass.load(config_loader=gcp_json_config_loader)
 
 
-def inject_settings_from_gcp_storage_json(bucket_name: str, blob_name: str, project_id: str, param_name: str = "settings"):
+def inject_settings_from_gcp_storage_json(
+    bucket_name: str, blob_name: str, project_id: str, param_name: str = "settings", watch: bool = False, lazy: bool = False
+):
     return inject_settings(
         load_settings_from_gcp_storage_json,
         param_name=param_name,
+        lazy=lazy,
+        reload_on=reload_on_config_change_if(
+            watch, GcpStorageJsonConfigLoaderArgs(bucket_name=bucket_name, blob_name=blob_name, project_id=project_id)
+        ),
         bucket_name=bucket_name,
         blob_name=blob_name,
         project_id=project_id,
@@ -3,13 +3,21 @@ from typing import Type
 from config_loaders import ConfigLoaderFactory, EnvConfigLoaderArgs
 
 from .base_inject_settings import TSettings, inject_settings
+from .reload_on_file_change import reload_on_file_change
 
 
 def load_settings_from_env_file(*, file_path: str, SettingsClass: Type[TSettings]):
-    env_config_loader = ConfigLoaderFactory.get_loader(EnvConfigLoaderArgs(file_path=file_path))
+    env_config_loader = ConfigLoaderFactory.get_loader(EnvConfigLoaderArgs(file_path=file_path), cached=True)
 
     return SettingsClass.load(config_loader=env_config_loader)
 
 
-def inject_settings_from_env_file(file_path: str, param_name: str = "settings"):
-    return inject_settings(load_settings_from_env_file, param_name=param_name, file_path=file_path)
+def inject_settings_from_env_file(file_path: str, param_name: str = "settings", watch: bool = False, lazy: bool = False):
+    """
+    Inject settings loaded from a .env file. With `watch=True` the settings are reloaded whenever the file changes,
+    and with `lazy=True` a `LazySettings` view validating each section on first access is injected.
+    """
+    reload_on = reload_on_file_change(file_path) if watch else None
+    return inject_settings(
+        load_settings_from_env_file, param_name=param_name, reload_on=reload_on, lazy=lazy, file_path=file_path
+    )
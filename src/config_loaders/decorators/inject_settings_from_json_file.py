@@ -3,13 +3,21 @@ from typing import Type
 from config_loaders import ConfigLoaderFactory, JsonConfigLoaderArgs
 
 from .base_inject_settings import TSettings, inject_settings
+from .reload_on_file_change import reload_on_file_change
 
 
 def load_settings_from_json_file(*, file_path: str, SettingsClass: Type[TSettings]):
-    json_config_loader = ConfigLoaderFactory.get_loader(JsonConfigLoaderArgs(file_path=file_path))
+    json_config_loader = ConfigLoaderFactory.get_loader(JsonConfigLoaderArgs(file_path=file_path), cached=True)
 
     return SettingsClass.load(config_loader=json_config_loader)
 
 
-def inject_settings_from_json_file(file_path: str, param_name: str = "settings"):
-    return inject_settings(load_settings_from_json_file, param_name=param_name, file_path=file_path)
+def inject_settings_from_json_file(file_path: str, param_name: str = "settings", watch: bool = False, lazy: bool = False):
+    """
+    Inject settings loaded from a JSON file. With `watch=True` the settings are reloaded whenever the file changes,
+    and with `lazy=True` a `LazySettings` view validating each section on first access is injected.
+    """
+    reload_on = reload_on_file_change(file_path) if watch else None
+    return inject_settings(
+        load_settings_from_json_file, param_name=param_name, reload_on=reload_on, lazy=lazy, file_path=file_path
+    )
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Type, overload
+import asyncio
+from typing import Any, Callable, Type, TypeVar, overload
 
 from config_loaders import ConfigLoaderFactory
 from config_loaders.config_loader_args import (
@@ -11,73 +12,179 @@ from config_loaders.config_loader_args import (
     GcpStorageJsonConfigLoaderArgs,
     GcpStorageYamlConfigLoaderArgs,
     JsonConfigLoaderArgs,
+    LayeredConfigLoaderArgs,
     YamlConfigLoaderArgs,
 )
 
-from .base_inject_settings import TSettings, inject_settings
+from .base_inject_settings import AsyncBaseSettings, RefreshHook, TSettings, inject_settings
+from .reload_on_config_change import reload_on_config_change_if
+
+TAsyncSettings = TypeVar("TAsyncSettings", bound=AsyncBaseSettings)
 
 
 def load_settings_from_config_loader(*, config_loader_args: ConfigLoaderArgs, SettingsClass: Type[TSettings]):
-    env_config_loader = ConfigLoaderFactory.get_loader(config_loader_args=config_loader_args)
+    env_config_loader = ConfigLoaderFactory.get_loader(config_loader_args=config_loader_args, cached=True)
 
     return SettingsClass.load(config_loader=env_config_loader)
 
 
+async def aload_settings_from_config_loader(
+    *, config_loader_args: ConfigLoaderArgs, SettingsClass: Type[TAsyncSettings]
+) -> TAsyncSettings:
+    if not hasattr(SettingsClass, "aload"):
+        # Settings classes without an async API are loaded in a worker thread instead
+        return await asyncio.to_thread(
+            load_settings_from_config_loader, config_loader_args=config_loader_args, SettingsClass=SettingsClass
+        )
+
+    async_config_loader = ConfigLoaderFactory.get_async_loader(config_loader_args=config_loader_args)
+
+    return await SettingsClass.aload(config_loader=async_config_loader)
+
+
+@overload
+def inject_settings_from_loader_args(
+    config_loader_args: GcpSecretEnvConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
+
+
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpSecretEnvConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: GcpSecretJsonConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpSecretJsonConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: GcpSecretYamlConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpSecretYamlConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: GcpStorageEnvConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpStorageEnvConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: GcpStorageJsonConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpStorageJsonConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: GcpStorageYamlConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: GcpStorageYamlConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: EnvConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: EnvConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: JsonConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: JsonConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: YamlConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 @overload
 def inject_settings_from_loader_args(
-    config_loader_args: YamlConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: LayeredConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
 def inject_settings_from_loader_args(
-    config_loader_args: ConfigLoaderArgs, param_name: str = "settings"
+    config_loader_args: ConfigLoaderArgs,
+    param_name: str = "settings",
+    watch: bool = False,
+    ttl: float | None = None,
+    ttl_jitter: float = 0.1,
+    on_refresh: RefreshHook | None = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    return inject_settings(load_settings_from_config_loader, param_name=param_name, config_loader_args=config_loader_args)
+    """
+    Inject settings loaded with the loader built from `config_loader_args`. With `watch=True` the settings are
+    reloaded whenever the background poller detects a new version of their source. With a `ttl` they are refreshed
+    in the background once expired, and with `lazy=True` a `LazySettings` view validating each section on first
+    access is injected, see `inject_settings`.
+    """
+    return inject_settings(
+        load_settings_from_config_loader,
+        param_name=param_name,
+        async_loader_func=aload_settings_from_config_loader,
+        reload_on=reload_on_config_change_if(watch, config_loader_args),
+        ttl=ttl,
+        ttl_jitter=ttl_jitter,
+        on_refresh=on_refresh,
+        lazy=lazy,
+        config_loader_args=config_loader_args,
+    )
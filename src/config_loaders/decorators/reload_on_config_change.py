@@ -0,0 +1,50 @@
+from typing import Callable, Iterator
+
+from config_loaders import CachingConfigProvider, ConfigLoader, ConfigLoaderFactory, ConfigProvider, RemoteChangePoller
+from config_loaders.config_loader_args import ConfigLoaderArgs
+from config_loaders.layered_config_loader import LayeredConfigLoader
+
+from .base_inject_settings import ReloadHook
+
+
+def reload_on_config_change(config_loader_args: ConfigLoaderArgs, poller: RemoteChangePoller | None = None) -> ReloadHook:
+    """
+    Create a `reload_on` hook for `inject_settings` that reloads the settings whenever a new version of their
+    source (or of any layer of a layered source) is detected. A payload cached for the changed source is dropped
+    first, so the reload does not serve it until its TTL expires.
+    :param config_loader_args: Arguments of the loader the settings are loaded with.
+    :param poller: Poller to register with, the process-wide one by default.
+    :return: The reload hook.
+    """
+
+    def register(reload: Callable[[], bool]) -> None:
+        config_loader = ConfigLoaderFactory.get_loader(config_loader_args, cached=True)
+        for config_provider in _config_providers_of(config_loader):
+            (poller or RemoteChangePoller.default()).watch(config_provider, lambda changed: _reload_changed(changed, reload))
+
+    return register
+
+
+def reload_on_config_change_if(watch: bool, config_loader_args: ConfigLoaderArgs) -> ReloadHook | None:
+    """
+    Return the `reload_on` hook of a settings decorator taking a `watch` flag: `reload_on_config_change` when
+    `watch` is set, None otherwise.
+    """
+    return reload_on_config_change(config_loader_args) if watch else None
+
+
+def _reload_changed(config_provider: ConfigProvider, reload: Callable[[], bool]) -> bool:
+    if isinstance(config_provider, CachingConfigProvider):
+        config_provider.cache.invalidate(config_provider.cache_key)
+    return reload()
+
+
+def _config_providers_of(config_loader: ConfigLoader) -> Iterator[ConfigProvider]:
+    if isinstance(config_loader, LayeredConfigLoader):
+        for layer in config_loader.layers:
+            yield from _config_providers_of(config_loader.get_loader(layer))
+        return
+
+    config_provider = getattr(config_loader, "config_provider", None)
+    if isinstance(config_provider, ConfigProvider):
+        yield config_provider
@@ -0,0 +1,19 @@
+from typing import Callable
+
+from config_loaders import FileWatcher
+
+from .base_inject_settings import ReloadHook
+
+
+def reload_on_file_change(file_path: str, file_watcher: FileWatcher | None = None) -> ReloadHook:
+    """
+    Create a `reload_on` hook for `inject_settings` that reloads the settings whenever `file_path` changes.
+    :param file_path: Configuration file, or directory of configuration files, to watch.
+    :param file_watcher: Watcher to register with, the process-wide one by default.
+    :return: The reload hook.
+    """
+
+    def register(reload: Callable[[], bool]) -> None:
+        (file_watcher or FileWatcher.default()).watch(file_path, lambda _changed_path: reload())
+
+    return register
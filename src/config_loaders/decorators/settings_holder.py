@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, ClassVar, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Observes background refreshes: called with the refresh duration in seconds and the error, None on success
+RefreshHook = Callable[[float, Exception | None], Any]
+
+
+@dataclass
+class _Flight(Generic[T]):
+    """
+    A first load in progress: the future its callers wait on, its load sequence number, the event loop running it
+    for an asynchronous load, and the task running it there.
+    """
+
+    future: Future = field(default_factory=Future)
+    sequence: int = 0
+    loop: asyncio.AbstractEventLoop | None = None
+    task: asyncio.Task | None = None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class SettingsHolder(Generic[T]):
+    """
+    Holds the settings object injected by `inject_settings` and lets it be replaced while the process runs.
+
+    Readers always see either the previous or the new settings object, never a partially updated one: a reload
+    builds and validates a complete new object first and then swaps a single reference.
+
+    The first load is single-flight: concurrent callers, threads or coroutines of any event loop, wait for one
+    in-flight load instead of each fetching the same source. A failed load is not cached: its error is raised to the callers
+    waiting on it and to those arriving within `retry_after` seconds, after which the next caller tries again.
+
+    With a `ttl`, settings older than it are still returned immediately (stale-while-revalidate) while a single
+    background thread loads fresh ones. Each expiry is shortened by a random fraction of up to `ttl_jitter` so
+    instances started together do not refresh in lockstep. A failed refresh keeps the current settings and is
+    retried after `retry_after` seconds.
+
+    Every load (first load, refresh or reload) takes a sequence number before it starts, and its result is dropped
+    if settings from a load started later were already swapped in: a slow refresh finishing after a reload never
+    brings back older settings.
+    """
+
+    _shared: ClassVar[dict[Hashable, "SettingsHolder[Any]"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        load: Callable[[], T],
+        retry_after: float = 1.0,
+        ttl: float | None = None,
+        ttl_jitter: float = 0.1,
+        on_refresh: RefreshHook | None = None,
+    ):
+        """
+        Initialize an empty holder.
+        :param load: Callable loading and validating a new settings object.
+        :param retry_after: Seconds during which the error of a failed load is raised again instead of retrying.
+        :param ttl: Seconds after which the settings are refreshed in the background. None never refreshes them.
+        :param ttl_jitter: Largest fraction of `ttl` randomly removed from each expiry, between 0 and 1.
+        :param on_refresh: Called after each background refresh with its duration and error.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        if not 0 <= ttl_jitter <= 1:
+            raise ValueError("ttl_jitter must be between 0 and 1.")
+        self._load = load
+        self.retry_after = retry_after
+        self.ttl = ttl
+        self.ttl_jitter = ttl_jitter
+        self.on_refresh = on_refresh
+        self._value: T | None = None
+        self._expires_at = float("inf")
+        self._refresh_thread: threading.Thread | None = None
+        self._failure: tuple[Exception, float] | None = None
+        self._lock = threading.Lock()
+        # First load in progress, guarded by `_lock`
+        self._flight: _Flight[T] | None = None
+        # Sequence number of the last load started and of the one whose settings are held, guarded by `_lock`
+        self._load_sequence = 0
+        self._value_sequence = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def shared(cls, key: Hashable, load: Callable[[], T], **options: Any) -> "SettingsHolder[T]":
+        """
+        Retrieve the process-wide holder of `key`, creating it with `load` and `options` if necessary, so functions
+        injecting the same settings from the same source share one loaded object.
+        """
+        with cls._shared_lock:
+            holder = cls._shared.get(key)
+            if holder is None:
+                holder = cls._shared[key] = cls(load, **options)
+            return holder
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def get(self) -> T:
+        """
+        Return the current settings, loading them on first use.
+
+        :raises Exception: The error of the first load, if it failed less than `retry_after` seconds ago.
+        """
+        value = self._value
+        if value is not None:
+            if time.monotonic() >= self._expires_at:
+                self._start_refresh()
+            return value
+
+        flight, leader = self._join_first_load()
+        if leader:
+            self._run_first_load(flight)
+        elif flight.loop is not None and flight.loop is _running_loop():
+            # Waiting would block the event loop running the load: load on this thread instead
+            return self._complete_first_load(_Flight(sequence=self._begin_load()), self._load)
+        return flight.future.result()
+
+    async def aget(self, aload: Callable[[], Awaitable[T]] | None = None) -> T:
+        """
+        Return the current settings without blocking the event loop, loading them on first use.
+
+        :param aload: Coroutine function loading the settings. Without it, `get` runs in a worker thread.
+        :raises Exception: The error of the first load, if it failed less than `retry_after` seconds ago.
+        """
+        value = self._value
+        if value is not None:
+            if time.monotonic() >= self._expires_at:
+                self._start_refresh()
+            return value
+        if aload is None:
+            return await asyncio.to_thread(self.get)
+
+        loop = asyncio.get_running_loop()
+        flight, leader = self._join_first_load(loop)
+        if leader:
+            # Run as a task of its own, so a cancelled caller does not cancel the load the others are waiting for
+            flight.task = loop.create_task(self._arun_first_load(flight, aload))
+        return await asyncio.shield(asyncio.wrap_future(flight.future))
+
+    def _join_first_load(self, loop: asyncio.AbstractEventLoop | None = None) -> tuple["_Flight[T]", bool]:
+        """
+        Return the first load in flight, shared by synchronous and asynchronous callers of every event loop, and
+        whether the caller must run it. Already loaded settings and a recent failure are returned as a done flight.
+        """
+        with self._lock:
+            if self._flight is not None:
+                return self._flight, False
+            self._load_sequence += 1
+            flight: _Flight[T] = _Flight(sequence=self._load_sequence, loop=loop)
+            if self._value is not None:
+                flight.future.set_result(self._value)
+                return flight, False
+            failure = self._failure
+            if failure is not None and time.monotonic() - failure[1] < self.retry_after:
+                flight.future.set_exception(failure[0])
+                return flight, False
+            self._flight = flight
+            return flight, True
+
+    def _run_first_load(self, flight: "_Flight[T]") -> None:
+        try:
+            self._complete_first_load(flight, self._load)
+        except BaseException:
+            # Raised to the waiting callers through the flight
+            pass
+
+    async def _arun_first_load(self, flight: "_Flight[T]", aload: Callable[[], Awaitable[T]]) -> None:
+        try:
+            value = await aload()
+        except BaseException as e:
+            self._finish_first_load(flight, error=e)
+        else:
+            self._finish_first_load(flight, value)
+
+    def _complete_first_load(self, flight: "_Flight[T]", load: Callable[[], T]) -> T:
+        try:
+            value = load()
+        except BaseException as e:
+            self._finish_first_load(flight, error=e)
+            raise
+        return self._finish_first_load(flight, value)
+
+    def _finish_first_load(self, flight: "_Flight[T]", value: T | None = None, error: BaseException | None = None) -> T:
+        """
+        Record the outcome of a first load, end its flight and hand the settings or the error to its waiting callers.
+        """
+        with self._lock:
+            if error is None:
+                self._failure = None
+                if self._value is None:
+                    self._store(value, flight.sequence)  # type: ignore[arg-type]
+                value = self._value
+            elif isinstance(error, Exception):
+                self._failure = (error, time.monotonic())
+            if self._flight is flight:
+                self._flight = None
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(value)  # type: ignore[arg-type]
+        return value  # type: ignore[return-value]
+
+    def set(self, value: T) -> None:
+        """
+        Replace the current settings with an already loaded object.
+        """
+        with self._lock:
+            self._load_sequence += 1
+            self._store(value, self._load_sequence)
+
+    def _begin_load(self) -> int:
+        """
+        Return the sequence number of a load about to start.
+        """
+        with self._lock:
+            self._load_sequence += 1
+            return self._load_sequence
+
+    def _store_loaded(self, value: T, sequence: int) -> bool:
+        with self._lock:
+            return self._store(value, sequence)
+
+    def _store(self, value: T, sequence: int) -> bool:
+        """
+        Swap in the settings of load `sequence`, unless settings of a load started later are already held. Must be
+        called with `_lock` held.
+
+        :return: True if the settings were swapped in.
+        """
+        if sequence < self._value_sequence:
+            return False
+        self._value_sequence = sequence
+        self._value = value
+        if self.ttl is not None:
+            self._expires_at = time.monotonic() + self.ttl * (1 - random.random() * self.ttl_jitter)
+        return True
+
+    def _start_refresh(self) -> None:
+        with self._lock:
+            if self._refresh_thread is not None or time.monotonic() < self._expires_at:
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh, name="settings-refresh", daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh(self) -> None:
+        try:
+            started_at = time.perf_counter()
+            error = None
+            try:
+                sequence = self._begin_load()
+                if not self._store_loaded(self._load(), sequence):
+                    self.logger.info("Dropped refreshed settings, newer settings were loaded meanwhile.")
+            except Exception as e:
+                error = e
+                self._expires_at = time.monotonic() + self.retry_after
+                self.logger.warning("Refreshing settings failed, serving the previous settings: %s", e)
+            if self.on_refresh is not None:
+                try:
+                    self.on_refresh(time.perf_counter() - started_at, error)
+                except Exception as e:
+                    self.logger.exception("Error in the settings refresh hook: %s", e)
+        finally:
+            self._refresh_thread = None
+
+    def wait_for_refresh(self, timeout: float | None = None) -> None:
+        """
+        Block until the background refresh in progress, if any, finished.
+        """
+        refresh_thread = self._refresh_thread
+        if refresh_thread is not None:
+            refresh_thread.join(timeout)
+
+    def reload(self) -> bool:
+        """
+        Load and validate the settings again, then swap them in. Settings that were never requested are left
+        to be loaded on first use.
+
+        :return: True if new settings were swapped in. False if they were never loaded, if settings from a load
+                 started later were swapped in meanwhile, or if loading failed, in which case the previous settings
+                 are kept and the error is logged.
+        """
+        if self._value is None:
+            return False
+        sequence = self._begin_load()
+        try:
+            value = self._load()
+        except Exception as e:
+            self.logger.error("Reloading settings failed, keeping the previous settings: %s", e)
+            return False
+        if not self._store_loaded(value, sequence):
+            self.logger.info("Dropped reloaded settings, newer settings were loaded meanwhile.")
+            return False
+        self.logger.info("Settings reloaded.")
+        return True
@@ -7,6 +7,8 @@ from dotenv import dotenv_values
 from .config_loader import ConfigLoader
 from .config_providers.config_provider import ConfigProvider
 from .env_config_processors import EnvConfigProcessor
+from .instrumentation import ConfigInstrumentation
+from .parsed_config_cache import ConfigLoaderMetrics, ParsedConfigCache
 
 
 class EnvConfigLoader(ConfigLoader):
@@ -14,48 +16,78 @@ class EnvConfigLoader(ConfigLoader):
     Loads and processes environment variables provided by a ConfigProvider using an EnvConfigProcessor.
     """
 
-    def __init__(self, config_provider: ConfigProvider, env_processor: EnvConfigProcessor):
+    def __init__(
+        self,
+        config_provider: ConfigProvider,
+        env_processor: EnvConfigProcessor,
+        parsed_config_cache: ParsedConfigCache | None = None,
+    ):
         """
         Initialize the EnvLoader with a configuration provider and environment processor.
         :param config_provider: Instance of ConfigProvider to fetch environment configuration content.
         :param env_processor: Instance of EnvConfigProcessor to process environment variables.
+        :param parsed_config_cache: Cache of parsed payloads. Defaults to the process-wide cache.
         """
         self.config_provider = config_provider
         self.env_processor = env_processor
+        self.parsed_config_cache = parsed_config_cache or ParsedConfigCache.default()
+        self.metrics = ConfigLoaderMetrics()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def load(self) -> dict[str, Any]:
         """
         Load and process environment variables.
 
+        :return: Processed environment variables as a nested dictionary.
+        :raises ValueError: If the environment payload is empty or invalid.
+        :raises Exception: For any unexpected errors.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider):
+            return self.load_content(ConfigInstrumentation.fetch(self.config_provider))
+
+    def load_content(self, payload: str | None) -> dict[str, Any]:
+        """
+        Process an environment payload that was already fetched from the provider.
+
+        :param payload: Raw environment payload as returned by the provider.
         :return: Processed environment variables as a nested dictionary.
         :raises ValueError: If the environment payload is empty or invalid.
         :raises Exception: For any unexpected errors.
         """
         try:
-            env_payload = self._fetch_env_payload()
-            raw_env = self._parse_env_payload(env_payload)
-            processed_env = self._process_env(raw_env)
-            return processed_env
+            env_payload = self._validate_env_payload(payload)
+            return self.parse_content(env_payload)
         except Exception as e:
-            self.logger.exception(f"Unexpected error while loading environment variables: {e}")
+            self.logger.exception("Unexpected error while loading environment variables: %s", e)
             raise
 
-    def _fetch_env_payload(self) -> str:
+    def parse_content(self, payload: str) -> dict[str, Any]:
+        """
+        Parse and process an environment payload, reusing the cached result for a payload that was already parsed.
+
+        :param payload: Raw environment payload as a string.
+        :return: A private copy of the processed environment variables as a nested dictionary.
+        """
+        namespace = ("env", self.env_processor.__class__)
+        return self.parsed_config_cache.get_or_parse(
+            namespace, payload, lambda content: self._process_env(self._parse_env_payload(content)), self.metrics
+        )
+
+    def _validate_env_payload(self, payload: str | None) -> str:
         """
-        Fetch the environment configuration content from the provider.
+        Validate the environment configuration content fetched from the provider.
 
+        :param payload: Raw environment payload as returned by the provider.
         :return: Raw environment payload as a string.
         :raises ValueError: If the environment payload is empty or invalid.
         """
         try:
-            payload = self.config_provider.get_config()
             if payload is None or not payload.strip():
                 raise ValueError("Environment payload is empty or invalid.")
-            self.logger.info("Successfully fetched environment payload.")
+            self.logger.debug("Successfully fetched environment payload.")
             return payload
         except Exception as e:
-            self.logger.error(f"Error fetching environment payload: {e}")
+            self.logger.error("Error fetching environment payload: %s", e)
             raise
 
     def _parse_env_payload(self, payload: str) -> dict[str, Any]:
@@ -68,10 +100,10 @@ class EnvConfigLoader(ConfigLoader):
         try:
             stream = io.StringIO(payload)  # Convert string to a stream
             env_vars = dotenv_values(stream=stream)
-            self.logger.info("Successfully parsed environment payload.")
+            self.logger.debug("Successfully parsed environment payload.")
             return env_vars
         except Exception as e:
-            self.logger.error(f"Error parsing environment payload: {e}")
+            self.logger.error("Error parsing environment payload: %s", e)
             raise
 
     def _process_env(self, raw_env: dict[str, Any]) -> dict[str, Any]:
@@ -82,9 +114,10 @@ class EnvConfigLoader(ConfigLoader):
         :return: Nested dictionary of processed environment variables.
         """
         try:
-            processed_env = self.env_processor.process(raw_env)
-            self.logger.info("Successfully processed environment variables.")
+            with ConfigInstrumentation.span("config.process", processor=self.env_processor.__class__.__name__, keys=len(raw_env)):
+                processed_env = self.env_processor.process(raw_env)
+            self.logger.debug("Successfully processed environment variables.")
             return processed_env
         except Exception as e:
-            self.logger.error(f"Error processing environment variables: {e}")
+            self.logger.error("Error processing environment variables: %s", e)
             raise
@@ -4,6 +4,10 @@ from typing import Any
 
 from .env_config_processor import EnvConfigProcessor
 
+# First characters a JSON document can start with (`NaN`/`Infinity` are accepted by `json.loads` too).
+# Values starting with anything else are plain strings and are never handed to the JSON decoder.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
 
 class DefaultEnvConfigProcessor(EnvConfigProcessor):
     """
@@ -16,50 +20,73 @@ class DefaultEnvConfigProcessor(EnvConfigProcessor):
     def process(self, flat_dict: dict[str, str | Any]) -> dict[str, Any]:
         """
         Process a flat dictionary into a nested dictionary with JSON fields parsed.
+
+        Keys are nested on double underscores and values are JSON-decoded in a single pass over the input.
         :param flat_dict: Flat dictionary to process.
         :return: Fully processed nested dictionary.
         """
         try:
-            nested_env = self._nest_dict(flat_dict)
-            self._parse_json_fields(nested_env)
-            self.logger.info("Successfully processed environment variables.")
+            nested_env = self._nest_and_parse(flat_dict)
+            self.logger.debug("Successfully processed environment variables.")
             return nested_env
         except Exception as e:
-            self.logger.error(f"Error processing environment variables: {e}")
+            self.logger.error("Error processing environment variables: %s", e)
             raise
 
-    def _parse_json_fields(self, nested_env: dict[str, str | dict[str, Any]]) -> None:
+    def _nest_and_parse(self, flat_dict: dict[str, str | Any]) -> dict[str, Any]:
         """
-        Recursively parse JSON strings in a nested dictionary.
+        Transform a flat dictionary with double underscores into nested dictionaries, decoding JSON leaves.
 
-        :param nested_env: Nested dictionary to process.
-        """
-        for key, value in nested_env.items():
-            if isinstance(value, dict):
-                self._parse_json_fields(value)
-            else:
-                try:
-                    nested_env[key] = json.loads(value)
-                    self.logger.info(f"Parsed JSON field for key: {key}")
-                except (json.JSONDecodeError, TypeError):
-                    self.logger.debug(f"Skipping non-JSON field for key: {key}")
-
-    def _nest_dict(self, flat_dict: dict[str, str | Any]) -> dict[str, Any]:
-        """
-        Transform a flat dictionary with double underscores into nested dictionaries.
+        A key only descends into dictionaries created by nesting; a JSON object decoded from a value is a leaf
+        and is replaced by a new dictionary when a later key nests below it.
 
         :param flat_dict: Flat dictionary to transform.
         :return: Nested dictionary.
         """
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         nested: dict[str, Any] = {}
+        # Keeps the nesting dictionaries alive so their ids cannot be reused by decoded JSON objects
+        nesting_dicts: dict[int, dict[str, Any]] = {id(nested): nested}
+
         for key, value in flat_dict.items():
-            keys = key.lower().split("__")
+            parts = key.lower().split("__")
             current_level = nested
-            for part in keys[:-1]:
-                if part not in current_level or not isinstance(current_level[part], dict):
-                    current_level[part] = {}
-                current_level = current_level[part]
-            current_level[keys[-1]] = value
-            self.logger.debug(f"Nesting key: {key}")
-        self.logger.info("Successfully nested environment variables.")
+            for part in parts[:-1]:
+                child = current_level.get(part)
+                if child is None or id(child) not in nesting_dicts:
+                    child = current_level[part] = {}
+                    nesting_dicts[id(child)] = child
+                current_level = child
+
+            current_level[parts[-1]] = self._parse_json_value(key, value, debug_enabled)
+
         return nested
+
+    def _parse_json_value(self, key: str, value: Any, debug_enabled: bool) -> Any:
+        """
+        Decode a value as JSON when it can start a JSON document, otherwise return it unchanged.
+
+        :param key: Original key of the value, used for logging.
+        :param value: Raw value.
+        :param debug_enabled: Whether per-key debug messages should be emitted.
+        :return: The decoded value, or the raw value if it is not valid JSON.
+        """
+        if not isinstance(value, str) or not value:
+            return value
+
+        first_char = value[0]
+        if first_char.isspace():
+            first_char = value.lstrip()[:1]
+        if first_char not in _JSON_START_CHARS:
+            return value
+
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            if debug_enabled:
+                self.logger.debug("Skipping non-JSON field for key: %s", key)
+            return value
+
+        if debug_enabled:
+            self.logger.debug("Parsed JSON field for key: %s", key)
+        return parsed
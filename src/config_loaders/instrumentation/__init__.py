@@ -0,0 +1,13 @@
+from .config_instrumentation import ConfigInstrumentation
+from .instrumentation_sink import InstrumentationSink
+from .logging_instrumentation_sink import LoggingInstrumentationSink
+from .no_op_instrumentation_sink import NoOpInstrumentationSink
+from .open_telemetry_instrumentation_sink import OpenTelemetryInstrumentationSink
+
+__all__ = [
+    "ConfigInstrumentation",
+    "InstrumentationSink",
+    "LoggingInstrumentationSink",
+    "NoOpInstrumentationSink",
+    "OpenTelemetryInstrumentationSink",
+]
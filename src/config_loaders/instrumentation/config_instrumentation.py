@@ -0,0 +1,169 @@
+import logging
+import threading
+import time
+from typing import Any, ClassVar
+
+from ..config_providers.async_config_provider import AsyncConfigProvider
+from ..config_providers.config_provider import ConfigProvider
+from .instrumentation_sink import InstrumentationSink
+from .no_op_instrumentation_sink import NoOpInstrumentationSink
+
+
+class _NoOpSpan:
+    """
+    Span returned while instrumentation is disabled. A single shared instance does nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+class _Span:
+    """
+    Times one stage and reports it to a sink. Failures of the sink are logged and never reach the load.
+    """
+
+    __slots__ = ("sink", "name", "attributes", "handle", "started_at")
+
+    def __init__(self, sink: InstrumentationSink, name: str, attributes: dict[str, Any]):
+        self.sink = sink
+        self.name = name
+        self.attributes = attributes
+        self.handle: Any = None
+        self.started_at = 0.0
+
+    def __enter__(self) -> "_Span":
+        try:
+            self.handle = self.sink.start_span(self.name, self.attributes)
+        except Exception as e:
+            self.sink = NoOpInstrumentationSink()
+            logging.getLogger("ConfigInstrumentation").warning("Could not start the %s span: %r", self.name, e)
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, error: BaseException | None, traceback: Any) -> bool:
+        duration = time.perf_counter() - self.started_at
+        try:
+            self.sink.end_span(self.handle, self.name, self.attributes, duration, error)
+        except Exception as e:
+            logging.getLogger("ConfigInstrumentation").warning("Could not end the %s span: %r", self.name, e)
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class ConfigInstrumentation:
+    """
+    Process-wide instrumentation of configuration loads.
+
+    Loaders, providers and caches report their stages as spans to the installed `InstrumentationSink`:
+
+    - `config.load`: a whole `ConfigLoader.load` (attributes `loader`, `source`; `layers` instead of `source` for a
+      `LayeredConfigLoader`);
+    - `config.fetch`: a `ConfigProvider.get_config` call (`provider`, `source`, `chars`), made by the loaders, the
+      snapshot loader and `CachingConfigProvider` through `fetch`/`afetch`;
+    - `config.parse`: parsing through the `ParsedConfigCache` (`namespace`, `bytes`, `cache_hit`);
+    - `config.process`: turning a flat environment into nested configuration (`processor`, `keys`);
+    - `config.validate`: building the settings model (`settings`, `mode`);
+
+    and the lookups of the payload cache of a `CachingConfigProvider` as `config.payload_cache` events (`source`,
+    `result`). `source` is the provider's `cache_key`.
+
+    The default sink is a no-op: call sites then get a shared do-nothing span and build no attributes, which keeps
+    the cost of disabled instrumentation to a few attribute lookups per load.
+
+    Usage:
+        ConfigInstrumentation.set_sink(LoggingInstrumentationSink(level=logging.INFO))
+    """
+
+    _sink: ClassVar[InstrumentationSink] = NoOpInstrumentationSink()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    enabled: ClassVar[bool] = False
+
+    @classmethod
+    def get_sink(cls) -> InstrumentationSink:
+        return cls._sink
+
+    @classmethod
+    def set_sink(cls, sink: InstrumentationSink | None) -> InstrumentationSink:
+        """
+        Install the sink receiving the spans and events. None restores the no-op sink.
+
+        :return: The previously installed sink.
+        """
+        with cls._lock:
+            previous = cls._sink
+            cls._sink = sink or NoOpInstrumentationSink()
+            cls.enabled = cls._sink.enabled
+            return previous
+
+    @classmethod
+    def span(cls, name: str, **attributes: Any) -> _Span | _NoOpSpan:
+        """
+        Return a context manager timing a stage. `set` adds attributes known only while the stage runs.
+        """
+        if not cls.enabled:
+            return _NO_OP_SPAN
+        return _Span(cls._sink, name, attributes)
+
+    @classmethod
+    def load_span(cls, loader: Any, provider: ConfigProvider) -> _Span | _NoOpSpan:
+        """
+        Return the `config.load` span of `loader` loading from `provider`.
+        """
+        if not cls.enabled:
+            return _NO_OP_SPAN
+        return _Span(cls._sink, "config.load", {"loader": loader.__class__.__name__, "source": provider.cache_key})
+
+    @classmethod
+    def event(cls, name: str, **attributes: Any) -> None:
+        if cls.enabled:
+            try:
+                cls._sink.event(name, attributes)
+            except Exception as e:
+                logging.getLogger(cls.__name__).warning("Could not record the %s event: %r", name, e)
+
+    @classmethod
+    def fetch(cls, provider: ConfigProvider) -> str | None:
+        """
+        Fetch the payload of `provider` in a `config.fetch` span.
+        """
+        if not cls.enabled:
+            return provider.get_config()
+        with cls._fetch_span(provider) as span:
+            payload = provider.get_config()
+            span.set("chars", _payload_length(payload))
+            return payload
+
+    @classmethod
+    async def afetch(cls, provider: AsyncConfigProvider) -> str | None:
+        """
+        Fetch the payload of `provider` without blocking the event loop, in a `config.fetch` span.
+        """
+        if not cls.enabled:
+            return await provider.aget_config()
+        with cls._fetch_span(provider) as span:
+            payload = await provider.aget_config()
+            span.set("chars", _payload_length(payload))
+            return payload
+
+    @classmethod
+    def _fetch_span(cls, provider: Any) -> _Span:
+        return _Span(cls._sink, "config.fetch", {"provider": provider.__class__.__name__, "source": provider.cache_key})
+
+
+def _payload_length(payload: str | None) -> int:
+    # Characters rather than bytes: encoding the payload only to measure it would copy it on every fetch
+    return 0 if payload is None else len(payload)
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class InstrumentationSink(ABC):
+    """
+    Receives the spans and events emitted while configuration is loaded.
+
+    A span covers one stage of a load (`config.load`, `config.fetch`, `config.parse`, `config.process`,
+    `config.validate`); its attributes identify the source and carry measurements such as `chars` and `cache_hit`.
+    Spans of the stages of one load are nested and are started and ended on the same thread or task.
+    """
+
+    # Whether instrumentation is active while this sink is installed. Disabled sinks are never called.
+    enabled: bool = True
+
+    @abstractmethod
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        """
+        Called when a stage starts.
+
+        :param name: Name of the stage.
+        :param attributes: Attributes known when the stage starts.
+        :return: Handle passed back to `end_span`.
+        """
+        pass
+
+    @abstractmethod
+    def end_span(
+        self, handle: Any, name: str, attributes: dict[str, Any], duration_seconds: float, error: BaseException | None
+    ) -> None:
+        """
+        Called when a stage ends.
+
+        :param handle: Value returned by `start_span`.
+        :param name: Name of the stage.
+        :param attributes: Every attribute of the span, including those added while the stage ran.
+        :param duration_seconds: Wall-clock duration of the stage.
+        :param error: Exception that ended the stage, or None if it succeeded.
+        """
+        pass
+
+    @abstractmethod
+    def event(self, name: str, attributes: dict[str, Any]) -> None:
+        """
+        Called for a point-in-time event, e.g. a hit of the payload cache.
+        """
+        pass
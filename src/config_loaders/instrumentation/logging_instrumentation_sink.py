@@ -0,0 +1,47 @@
+import logging
+from typing import Any
+
+from .instrumentation_sink import InstrumentationSink
+
+
+class LoggingInstrumentationSink(InstrumentationSink):
+    """
+    Writes spans and events to a stdlib logger.
+
+    The attributes, the duration and the error of a span are also passed as `json_fields` in `extra`, so a
+    `JsonLogFormatter` turns them into structured log fields.
+    """
+
+    def __init__(self, logger: logging.Logger | str | None = None, level: int = logging.DEBUG):
+        """
+        Initialize the sink.
+        :param logger: Logger, or name of the logger, to write to. Defaults to the "ConfigInstrumentation" logger.
+        :param level: Level of the records. Failed stages are logged at WARNING or above.
+        """
+        self.logger = logger if isinstance(logger, logging.Logger) else logging.getLogger(logger or "ConfigInstrumentation")
+        self.level = level
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s started %s", name, attributes, extra={"json_fields": {"span": name, **attributes}})
+        return None
+
+    def end_span(
+        self, handle: Any, name: str, attributes: dict[str, Any], duration_seconds: float, error: BaseException | None
+    ) -> None:
+        level = self.level if error is None else max(self.level, logging.WARNING)
+        if not self.logger.isEnabledFor(level):
+            return
+        duration_ms = duration_seconds * 1000
+        json_fields = {"span": name, "duration_ms": duration_ms, **attributes}
+        if error is None:
+            self.logger.log(level, "%s finished in %.3f ms %s", name, duration_ms, attributes, extra={"json_fields": json_fields})
+        else:
+            json_fields["error"] = repr(error)
+            self.logger.log(
+                level, "%s failed in %.3f ms %s: %r", name, duration_ms, attributes, error, extra={"json_fields": json_fields}
+            )
+
+    def event(self, name: str, attributes: dict[str, Any]) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s", name, attributes, extra={"json_fields": {"event": name, **attributes}})
@@ -0,0 +1,22 @@
+from typing import Any
+
+from .instrumentation_sink import InstrumentationSink
+
+
+class NoOpInstrumentationSink(InstrumentationSink):
+    """
+    Default sink. It disables instrumentation, so loads do not build spans at all.
+    """
+
+    enabled = False
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        return None
+
+    def end_span(
+        self, handle: Any, name: str, attributes: dict[str, Any], duration_seconds: float, error: BaseException | None
+    ) -> None:
+        pass
+
+    def event(self, name: str, attributes: dict[str, Any]) -> None:
+        pass
@@ -0,0 +1,62 @@
+from typing import Any
+
+from .instrumentation_sink import InstrumentationSink
+
+try:
+    from opentelemetry import context, trace
+except ImportError:  # pragma: no cover - optional dependency
+    context = trace = None  # type: ignore[assignment]
+
+_ATTRIBUTE_TYPES = (str, bool, int, float)
+
+
+class OpenTelemetryInstrumentationSink(InstrumentationSink):
+    """
+    Turns spans into OpenTelemetry spans and events into span events, when `opentelemetry-api` is installed.
+
+    Each span is made current while its stage runs, so the spans of one load are nested under `config.load` and
+    under whatever span is current in the caller, e.g. the span of an HTTP request. Attribute values that are not
+    strings, booleans or numbers (e.g. the tuples of `ConfigProvider.cache_key`) are recorded as strings.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Initialize the sink.
+        :param tracer: Tracer creating the spans. Defaults to the "config_loaders" tracer of the global provider.
+        :raises ImportError: If `opentelemetry-api` is not installed.
+        """
+        if not self.is_available():
+            raise ImportError("OpenTelemetryInstrumentationSink requires the 'opentelemetry-api' package.")
+        self.tracer = tracer or trace.get_tracer("config_loaders")
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return trace is not None
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        span = self.tracer.start_span(name, attributes=_to_otel_attributes(attributes))
+        return span, context.attach(trace.set_span_in_context(span))
+
+    def end_span(
+        self, handle: Any, name: str, attributes: dict[str, Any], duration_seconds: float, error: BaseException | None
+    ) -> None:
+        span, token = handle
+        try:
+            span.set_attributes(_to_otel_attributes(attributes))
+            if error is not None:
+                span.record_exception(error)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+            span.end()
+        finally:
+            context.detach(token)
+
+    def event(self, name: str, attributes: dict[str, Any]) -> None:
+        trace.get_current_span().add_event(name, _to_otel_attributes(attributes))
+
+
+def _to_otel_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    return {
+        f"config.{key}": value if isinstance(value, _ATTRIBUTE_TYPES) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
@@ -4,6 +4,9 @@ from typing import Any
 
 from .config_loader import ConfigLoader
 from .config_providers import ConfigProvider
+from .instrumentation import ConfigInstrumentation
+from .parsed_config_cache import ConfigLoaderMetrics, ParsedConfigCache
+from .parser_backends import ParserBackend, ParserBackendRegistry
 
 
 class JsonConfigLoader(ConfigLoader):
@@ -11,37 +14,72 @@ class JsonConfigLoader(ConfigLoader):
     Loads configuration from a JSON source provided by a ConfigProvider.
     """
 
-    def __init__(self, config_provider: ConfigProvider):
+    def __init__(
+        self,
+        config_provider: ConfigProvider,
+        parsed_config_cache: ParsedConfigCache | None = None,
+        parser_backend: ParserBackend | str | None = None,
+    ):
         """
         Initialize the JSON loader with a configuration provider.
         :param config_provider: Instance of ConfigProvider to fetch configuration content.
+        :param parsed_config_cache: Cache of parsed payloads. Defaults to the process-wide cache.
+        :param parser_backend: JSON parser backend, or the name of a registered one (e.g. "msgspec").
+                               Defaults to the backend selected globally in `ParserBackendRegistry`.
         """
         self.config_provider = config_provider
+        self.parsed_config_cache = parsed_config_cache or ParsedConfigCache.default()
+        self.parser_backend = (
+            ParserBackendRegistry.get("json", parser_backend) if isinstance(parser_backend, str) else parser_backend
+        )
+        self.metrics = ConfigLoaderMetrics()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def load(self) -> dict[str, Any]:
         """
         Load and parse the JSON configuration.
 
+        :return: Parsed configuration as a dictionary.
+        :raises json.JSONDecodeError: If the JSON content is invalid.
+        :raises ValueError: If the configuration content is empty.
+        :raises Exception: For any unexpected errors.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider):
+            return self.load_content(ConfigInstrumentation.fetch(self.config_provider))
+
+    def load_content(self, config_content: str | None) -> dict[str, Any]:
+        """
+        Parse JSON content that was already fetched from the provider.
+
+        :param config_content: Raw JSON content as returned by the provider.
         :return: Parsed configuration as a dictionary.
         :raises json.JSONDecodeError: If the JSON content is invalid.
         :raises ValueError: If the configuration content is empty.
         :raises Exception: For any unexpected errors.
         """
         try:
-            config_content = self.config_provider.get_config()
             if config_content is None or not config_content.strip():
                 raise ValueError("Configuration content is empty or invalid.")
 
-            parsed_content = json.loads(config_content)  # Safely parse JSON content
-            self.logger.info("Successfully parsed JSON configuration.")
+            parsed_content = self.parse_content(config_content)
+            self.logger.debug("Successfully parsed JSON configuration.")
             return parsed_content
         except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON content: {e}")
+            self.logger.error("Failed to parse JSON content: %s", e)
             raise
         except ValueError as e:
-            self.logger.error(f"Error: {e}")
+            self.logger.error("Error: %s", e)
             raise
         except Exception as e:
-            self.logger.exception(f"Unexpected error while loading JSON configuration: {e}")
+            self.logger.exception("Unexpected error while loading JSON configuration: %s", e)
             raise
+
+    def parse_content(self, config_content: str) -> dict[str, Any]:
+        """
+        Parse JSON content, reusing the cached result for a payload that was already parsed.
+
+        :param config_content: Raw JSON content.
+        :return: A private copy of the parsed configuration.
+        """
+        parser_backend = self.parser_backend or ParserBackendRegistry.get("json")
+        return self.parsed_config_cache.get_or_parse("json", config_content, parser_backend.parse, self.metrics)
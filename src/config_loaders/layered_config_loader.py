@@ -0,0 +1,74 @@
+import logging
+from typing import Any, Callable, Sequence
+
+from .concurrent_config_loading import load_concurrently
+from .config_loader import ConfigLoader
+from .config_loader_args import ConfigLoaderArgs
+from .config_merger import ConfigPath, MergedConfig, deep_merge
+from .instrumentation import ConfigInstrumentation
+
+
+class LayeredConfigLoader(ConfigLoader):
+    """
+    Loads several configuration sources concurrently and deep-merges them into a single configuration.
+    Later layers override earlier ones, e.g. `config.yaml` < `config.local.yaml` < `.env.local`.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[ConfigLoaderArgs],
+        get_loader: Callable[[ConfigLoaderArgs], ConfigLoader],
+        max_workers: int = 8,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize the layered loader.
+        :param layers: Sources to merge, from lowest to highest precedence.
+        :param get_loader: Callable creating a loader for each layer (e.g. `ConfigLoaderFactory.get_loader`).
+        :param max_workers: Maximum number of layers fetched at the same time.
+        :param timeout: Maximum number of seconds a single layer may take once started.
+        """
+        self.layers = tuple(layers)
+        self.get_loader = get_loader
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.provenance: dict[ConfigPath, int] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def load(self) -> dict[str, Any]:
+        """
+        Load and merge every layer.
+
+        :return: Merged configuration as a dictionary.
+        :raises Exception: The error of the first layer that failed to load.
+        """
+        return self.load_with_provenance().config
+
+    def load_with_provenance(self) -> MergedConfig:
+        """
+        Load and merge every layer, recording which layer supplied each leaf.
+
+        :return: The merged configuration with per-leaf provenance (leaf path -> layer index).
+        :raises Exception: The error of the first layer that failed to load.
+        """
+        with ConfigInstrumentation.span("config.load", loader=self.__class__.__name__, layers=len(self.layers)):
+            results = load_concurrently(self.get_loader, self.layers, max_workers=self.max_workers, timeout=self.timeout)
+            for result in results:
+                if not result.ok:
+                    self.logger.error("Failed to load configuration layer %s: %s", result.config_loader_args, result.error)
+                    raise result.error  # type: ignore[misc]
+
+            merged = deep_merge([result.config or {} for result in results])
+        self.provenance = merged.provenance
+        self.logger.debug("Successfully merged %s configuration layers.", len(self.layers))
+        return merged
+
+    def source_of(self, path: ConfigPath) -> ConfigLoaderArgs | None:
+        """
+        Return the layer that supplied the leaf at `path` in the last loaded configuration.
+
+        :param path: Path of the leaf, e.g. `("feature_flags", "circuit_breaker_duration")`.
+        :return: The arguments of the supplying layer, or None if the path is not a leaf.
+        """
+        layer_index = self.provenance.get(path)
+        return self.layers[layer_index] if layer_index is not None else None
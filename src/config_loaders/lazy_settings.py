@@ -0,0 +1,105 @@
+import functools
+from typing import Annotated, Any, Generic, Type, TypeVar, get_args
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError
+from pydantic_core.core_schema import ErrorType
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+_ERROR_TYPES = frozenset(get_args(ErrorType))
+
+
+@functools.cache
+def _section_adapter(model_type: Type[BaseModel], name: str) -> TypeAdapter:
+    """
+    Return a validator for a single field of `model_type`, including its constraints. Built once per field.
+    """
+    field = model_type.model_fields[name]
+    annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+    return TypeAdapter(annotation)
+
+
+class LazySettings(Generic[TModel]):
+    """
+    Read-only view of a settings model whose top-level sections are validated on first access.
+
+    The raw configuration is kept as loaded; reading `settings.feature_flags` validates only that section (with the
+    same rules as the model field) and caches the result, so a handler touching one section never pays for the
+    others. `validate_all()` validates the whole model at once, e.g. as a startup check.
+    """
+
+    __slots__ = ("_model_type", "_config", "_sections")
+
+    def __init__(self, model_type: Type[TModel], config: dict[str, Any]):
+        """
+        Initialize the view.
+        :param model_type: Settings model describing the sections.
+        :param config: Raw configuration.
+        """
+        object.__setattr__(self, "_model_type", model_type)
+        object.__setattr__(self, "_config", config)
+        object.__setattr__(self, "_sections", {})
+
+    @property
+    def model_type(self) -> Type[TModel]:
+        return self._model_type
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots, i.e. the sections
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+
+        field = self._model_type.model_fields.get(name)
+        if field is None:
+            raise AttributeError(f"'{self._model_type.__name__}' settings have no section '{name}'")
+
+        if name in self._config:
+            try:
+                value = _section_adapter(self._model_type, name).validate_python(self._config[name])
+            except ValidationError as e:
+                # Report the errors under the section, as `model_validate` does
+                raise ValidationError.from_exception_data(
+                    self._model_type.__name__, [_error_in_section(name, error) for error in e.errors()]
+                ) from None
+        elif not field.is_required():
+            value = field.get_default(call_default_factory=True)
+        else:
+            raise ValidationError.from_exception_data(
+                self._model_type.__name__, [{"type": "missing", "loc": (name,), "input": self._config}]
+            )
+
+        self._sections[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{self._model_type.__name__}' settings are read-only")
+
+    def validate_all(self) -> TModel:
+        """
+        Validate every section at once.
+
+        :return: The fully validated settings model.
+        :raises pydantic.ValidationError: If any section is invalid.
+        """
+        model = self._model_type.model_validate(self._config)
+        for name in self._model_type.model_fields:
+            self._sections[name] = getattr(model, name)
+        return model
+
+    def __repr__(self) -> str:
+        validated = ", ".join(self._sections) or "none"
+        return f"LazySettings[{self._model_type.__name__}](validated sections: {validated})"
+
+
+def _error_in_section(name: str, error: Any) -> InitErrorDetails:
+    """
+    Return the details of a validation error of a section, located under the section name.
+    """
+    error_type = error["type"] if error["type"] in _ERROR_TYPES else PydanticCustomError(error["type"], error["msg"])
+    details: InitErrorDetails = {"type": error_type, "loc": (name, *error["loc"]), "input": error["input"]}
+    if "ctx" in error and error["type"] in _ERROR_TYPES:
+        details["ctx"] = error["ctx"]
+    return details
@@ -0,0 +1,111 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from .instrumentation import ConfigInstrumentation
+
+
+@dataclass
+class ConfigLoaderMetrics:
+    """
+    Counters kept by each configuration loader, updated under the lock of the loader's ParsedConfigCache.
+    """
+
+    loads: int = 0
+    cache_hits: int = 0
+    bytes_parsed: int = 0
+    parse_seconds: float = 0.0
+
+
+def copy_config(value: Any) -> Any:
+    """
+    Copy the containers of a parsed configuration tree. Leaves (str, int, float, bool, None, dates) are
+    immutable and shared, which makes this much cheaper than `copy.deepcopy`.
+
+    :param value: Parsed configuration value.
+    :return: A copy whose dicts and lists can be mutated without affecting `value`.
+    """
+    if isinstance(value, dict):
+        return {key: copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_config(item) for item in value]
+    return value
+
+
+class ParsedConfigCache:
+    """
+    A thread-safe LRU cache of parsed configurations keyed by a content hash of the raw payload.
+
+    Identical payloads are parsed once per process. Every caller receives its own copy of the cached tree,
+    so mutating a loaded configuration can never corrupt the shared cache.
+    """
+
+    _default_instance: "ParsedConfigCache | None" = None
+
+    def __init__(self, max_entries: int = 64):
+        """
+        Initialize an empty cache.
+        :param max_entries: Maximum number of parsed configurations kept.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "ParsedConfigCache":
+        """
+        Retrieve the process-wide cache instance, creating it if necessary.
+        """
+        if cls._default_instance is None:
+            cls._default_instance = cls()
+        return cls._default_instance
+
+    def get_or_parse(self, namespace: Hashable, payload: str, parse: Callable[[str], Any], metrics: ConfigLoaderMetrics) -> Any:
+        """
+        Return a copy of the parsed payload, parsing it only if it is not cached yet.
+
+        :param namespace: Distinguishes parsers (e.g. JSON vs YAML) that may receive the same payload.
+        :param payload: Raw configuration payload.
+        :param parse: Callable turning the payload into a configuration tree.
+        :param metrics: Metrics of the calling loader, updated in place.
+        :return: A private copy of the parsed configuration.
+        """
+        raw = payload.encode("utf-8")
+        key = (namespace, hashlib.blake2b(raw, digest_size=16).digest())
+        with ConfigInstrumentation.span("config.parse", namespace=namespace, bytes=len(raw)) as span:
+            with self._lock:
+                metrics.loads += 1
+                parsed = self._entries.get(key)
+                if parsed is not None:
+                    metrics.cache_hits += 1
+                    self._entries.move_to_end(key)
+
+            span.set("cache_hit", parsed is not None)
+            if parsed is not None:
+                return copy_config(parsed)
+
+            started_at = time.perf_counter()
+            parsed = parse(payload)
+            parse_seconds = time.perf_counter() - started_at
+
+        with self._lock:
+            metrics.parse_seconds += parse_seconds
+            metrics.bytes_parsed += len(raw)
+            self._entries[key] = parsed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return copy_config(parsed)
+
+    def clear(self) -> None:
+        """
+        Drop every cached configuration.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,17 @@
+from .libyaml_parser_backend import LibYamlParserBackend
+from .msgspec_json_parser_backend import MsgspecJsonParserBackend
+from .orjson_parser_backend import OrjsonParserBackend
+from .parser_backend import ParserBackend
+from .parser_backend_registry import ParserBackendRegistry
+from .pyyaml_parser_backend import PyYamlParserBackend
+from .stdlib_json_parser_backend import StdlibJsonParserBackend
+
+__all__ = [
+    "LibYamlParserBackend",
+    "MsgspecJsonParserBackend",
+    "OrjsonParserBackend",
+    "ParserBackend",
+    "ParserBackendRegistry",
+    "PyYamlParserBackend",
+    "StdlibJsonParserBackend",
+]
@@ -0,0 +1,23 @@
+from typing import Any
+
+import yaml
+
+from .parser_backend import ParserBackend
+
+
+class LibYamlParserBackend(ParserBackend):
+    """
+    Parses YAML with `yaml.CSafeLoader`, available when PyYAML was built against libyaml.
+
+    It uses the same safe constructor as `yaml.SafeLoader`, only scanning and parsing are done in C.
+    """
+
+    name = "libyaml"
+    format = "yaml"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return getattr(yaml, "__with_libyaml__", False)
+
+    def parse(self, content: str) -> Any:
+        return yaml.load(content, Loader=yaml.CSafeLoader)
@@ -0,0 +1,34 @@
+import json
+from typing import Any
+
+from .parser_backend import ParserBackend
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+class MsgspecJsonParserBackend(ParserBackend):
+    """
+    Parses JSON with msgspec, when it is installed.
+
+    Documents msgspec rejects (`NaN`, `Infinity`, invalid JSON) are handed to `json.loads`, which parses them or
+    raises the usual `JSONDecodeError`.
+    """
+
+    name = "msgspec"
+    format = "json"
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder() if msgspec is not None else None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return msgspec is not None
+
+    def parse(self, content: str) -> Any:
+        try:
+            return self._decoder.decode(content)  # type: ignore[union-attr]
+        except msgspec.DecodeError:
+            return json.loads(content)
@@ -0,0 +1,49 @@
+import json
+from typing import Any
+
+from .parser_backend import ParserBackend
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+class OrjsonParserBackend(ParserBackend):
+    """
+    Parses JSON with orjson, when it is installed.
+
+    Documents orjson rejects (`NaN`, `Infinity`, invalid JSON) are handed to `json.loads`, which parses them or
+    raises the usual `JSONDecodeError`. orjson also silently turns integers outside the 64-bit range into floats:
+    a result holding such a float is parsed again with `json.loads`.
+    """
+
+    name = "orjson"
+    format = "json"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return orjson is not None
+
+    def parse(self, content: str) -> Any:
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content)
+        return json.loads(content) if _has_wide_integral_float(parsed) else parsed
+
+
+def _has_wide_integral_float(value: Any) -> bool:
+    """
+    Whether the tree contains an integral float too large for a 64-bit integer.
+    """
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float) and abs(value) >= 2**63 and value.is_integer():
+            return True
+    return False
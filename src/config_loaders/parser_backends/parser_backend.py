@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ParserBackend(ABC):
+    """
+    Abstract base class for the parsers turning raw configuration payloads into configuration trees.
+
+    Every backend of a format must produce exactly the same result as the reference backend of that format
+    (`json.loads`, `yaml.safe_load`) and raise the same exception types, so backends can be swapped freely.
+    """
+
+    name: str
+    format: str
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Whether the libraries this backend relies on are installed.
+        """
+        return True
+
+    @abstractmethod
+    def parse(self, content: str) -> Any:
+        """
+        Parse a raw payload.
+
+        :param content: Raw configuration content.
+        :return: The parsed configuration tree.
+        """
+        pass
@@ -0,0 +1,96 @@
+import logging
+import threading
+from typing import Dict, Type
+
+from .libyaml_parser_backend import LibYamlParserBackend
+from .msgspec_json_parser_backend import MsgspecJsonParserBackend
+from .orjson_parser_backend import OrjsonParserBackend
+from .parser_backend import ParserBackend
+from .pyyaml_parser_backend import PyYamlParserBackend
+from .stdlib_json_parser_backend import StdlibJsonParserBackend
+
+logger = logging.getLogger(__name__)
+
+
+class ParserBackendRegistry:
+    """
+    Registry of the parser backends of each format.
+
+    Backends are tried in registration order when no backend is selected, so the fastest available one is used:
+    msgspec, then orjson, then the standard library for JSON; libyaml, then pure-Python PyYAML for YAML.
+    """
+
+    _backends: Dict[str, Dict[str, Type[ParserBackend]]] = {}
+    _defaults: Dict[str, str] = {}
+    _instances: Dict[tuple[str, str], ParserBackend] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, backend_type: Type[ParserBackend]) -> None:
+        """
+        Register a backend for its format. Backends registered later are preferred less.
+        """
+        with cls._lock:
+            cls._backends.setdefault(backend_type.format, {})[backend_type.name] = backend_type
+            cls._instances.pop((backend_type.format, backend_type.name), None)
+
+    @classmethod
+    def set_default(cls, format: str, name: str | None) -> None:
+        """
+        Select the backend used for `format` when a loader does not select one; None restores automatic selection.
+
+        :raises ValueError: If the backend is unknown or not available.
+        """
+        if name is None:
+            cls._defaults.pop(format, None)
+            return
+        cls._get_backend_type(format, name)
+        cls._defaults[format] = name
+
+    @classmethod
+    def available(cls, format: str) -> list[str]:
+        """
+        Return the names of the installed backends of `format`, from most to least preferred.
+        """
+        return [name for name, backend_type in cls._backends.get(format, {}).items() if backend_type.is_available()]
+
+    @classmethod
+    def get(cls, format: str, name: str | None = None) -> ParserBackend:
+        """
+        Return the backend `name` of `format`, or the default backend when `name` is None.
+
+        :raises ValueError: If the backend is unknown or not available.
+        """
+        name = name or cls._defaults.get(format)
+        if name is None:
+            available = cls.available(format)
+            if not available:
+                raise ValueError(f"No parser backend available for format '{format}'.")
+            name = available[0]
+
+        instance = cls._instances.get((format, name))
+        if instance is None:
+            backend_type = cls._get_backend_type(format, name)
+            with cls._lock:
+                instance = cls._instances.setdefault((format, name), backend_type())
+            logger.debug("Using the '%s' parser backend for %s.", name, format)
+        return instance
+
+    @classmethod
+    def _get_backend_type(cls, format: str, name: str) -> Type[ParserBackend]:
+        backend_type = cls._backends.get(format, {}).get(name)
+        if backend_type is None:
+            raise ValueError(f"Unknown {format} parser backend '{name}'. Registered: {list(cls._backends.get(format, {}))}")
+        if not backend_type.is_available():
+            raise ValueError(f"The {format} parser backend '{name}' is not installed.")
+        return backend_type
+
+
+for _backend_type in (
+    MsgspecJsonParserBackend,
+    OrjsonParserBackend,
+    StdlibJsonParserBackend,
+    LibYamlParserBackend,
+    PyYamlParserBackend,
+):
+    ParserBackendRegistry.register(_backend_type)
@@ -0,0 +1,17 @@
+from typing import Any
+
+import yaml
+
+from .parser_backend import ParserBackend
+
+
+class PyYamlParserBackend(ParserBackend):
+    """
+    Parses YAML with the pure-Python `yaml.SafeLoader`. This is the reference YAML backend.
+    """
+
+    name = "pyyaml"
+    format = "yaml"
+
+    def parse(self, content: str) -> Any:
+        return yaml.load(content, Loader=yaml.SafeLoader)
@@ -0,0 +1,16 @@
+import json
+from typing import Any
+
+from .parser_backend import ParserBackend
+
+
+class StdlibJsonParserBackend(ParserBackend):
+    """
+    Parses JSON with the standard library. This is the reference JSON backend.
+    """
+
+    name = "stdlib"
+    format = "json"
+
+    def parse(self, content: str) -> Any:
+        return json.loads(content)
@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from typing import Any, Hashable
+
+from .config_loader import ConfigLoader
+from .config_snapshot_store import ConfigSnapshot, ConfigSnapshotStore
+from .instrumentation import ConfigInstrumentation
+from .parsed_config_cache import copy_config
+
+
+class SnapshotConfigLoader(ConfigLoader):
+    """
+    Serves configuration from a last known good snapshot on disk and revalidates it against the source in the
+    background.
+
+    Only the first `load()` is served from disk: on a cold start with a snapshot, it returns the snapshot without
+    any remote request or parsing and a background thread then compares the source's version marker with the
+    snapshot's; the payload is only fetched, parsed and saved again when it changed. Without a snapshot, it fetches
+    and parses synchronously and saves the result. Every later `load()` (a reload) compares the version marker
+    synchronously, so it returns the source's current configuration. Calls made while the source is unreachable keep
+    serving the snapshot.
+    """
+
+    def __init__(self, config_loader: ConfigLoader, snapshot_store: ConfigSnapshotStore):
+        """
+        Initialize the loader.
+        :param config_loader: Loader of the source. It must expose `config_provider` and `load_content`, as the
+                              JSON, YAML and env loaders do.
+        :param snapshot_store: Store the snapshots are kept in.
+        """
+        self.config_loader = config_loader
+        self.config_provider = config_loader.config_provider  # type: ignore[attr-defined]
+        self.snapshot_store = snapshot_store
+        self.snapshot_key: Hashable = (type(config_loader).__qualname__, self.config_provider.cache_key)
+        self.snapshot: ConfigSnapshot | None = None
+        self._revalidation: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def load(self) -> dict[str, Any]:
+        """
+        Return the configuration: from the snapshot on disk on the first call, scheduling its revalidation, and from
+        the source, revalidated synchronously, on later calls.
+
+        :return: A private copy of the configuration.
+        :raises Exception: The error of the underlying loader when there is no snapshot to fall back on.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider) as span:
+            if self.snapshot is not None:
+                # The revalidation scheduled by the cold start is waited for, so both do not fetch the same change
+                self.wait_for_revalidation()
+                span.set("cache_hit", not self.revalidate())
+                return copy_config(self.snapshot.config)  # type: ignore[union-attr]
+
+            snapshot = self.snapshot_store.load(self.snapshot_key)
+            span.set("cache_hit", snapshot is not None)
+            if snapshot is None:
+                snapshot = self._refresh(None)
+            else:
+                self.snapshot = snapshot
+                self._schedule_revalidation()
+            return copy_config(snapshot.config)
+
+    def revalidate(self) -> bool:
+        """
+        Compare the snapshot with the source and refresh it if the source changed.
+
+        :return: True if the payload of the source changed.
+        """
+        current = self.snapshot
+        try:
+            version = self.config_provider.get_version()
+            if current is not None and version is not None and version == current.version:
+                return False
+            return self._refresh(current, version).payload != current.payload  # type: ignore[union-attr]
+        except Exception as e:
+            self.logger.warning("Revalidating the configuration snapshot of %s failed, keeping it: %s", self.snapshot_key, e)
+            return False
+
+    def _refresh(self, current: ConfigSnapshot | None, version: Hashable | None = None) -> ConfigSnapshot:
+        """
+        Fetch the source and save it as the new snapshot. An unchanged payload is not parsed again, only its new
+        version marker is recorded.
+        """
+        if current is None:
+            # The version is read before the payload, so a change in between is caught by the next revalidation
+            version = self.config_provider.get_version()
+        payload = ConfigInstrumentation.fetch(self.config_provider)
+        if current is not None and payload == current.payload:
+            if version is None or version == current.version:
+                return current
+            config = current.config
+        else:
+            config = self.config_loader.load_content(payload)  # type: ignore[attr-defined]
+
+        try:
+            self.snapshot = self.snapshot_store.save(self.snapshot_key, payload, version, config)
+            self.logger.info("Saved configuration snapshot of %s.", self.snapshot_key)
+        except OSError as e:
+            # The configuration is still served, from memory only
+            self.snapshot = ConfigSnapshot(payload=payload, version=version, config=config, saved_at=time.time())
+            self.logger.warning("Could not save the configuration snapshot of %s: %s", self.snapshot_key, e)
+        return self.snapshot
+
+    def _schedule_revalidation(self) -> None:
+        with self._lock:
+            if self._revalidation is not None and self._revalidation.is_alive():
+                return
+            self._revalidation = threading.Thread(target=self.revalidate, name="config-snapshot-revalidation", daemon=True)
+            self._revalidation.start()
+
+    def wait_for_revalidation(self, timeout: float | None = None) -> None:
+        """
+        Block until the revalidation running in the background, if any, finished.
+        """
+        revalidation = self._revalidation
+        if revalidation is not None:
+            revalidation.join(timeout)
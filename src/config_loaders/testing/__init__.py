@@ -0,0 +1,4 @@
+from .fake_gcp_server import FakeGcpServer
+from .fault_injection import FaultInjection
+
+__all__ = ["FakeGcpServer", "FaultInjection"]
@@ -0,0 +1,323 @@
+import base64
+import datetime
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import google_crc32c
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.secretmanager import SecretManagerServiceClient
+from google.cloud.secretmanager_v1.services.secret_manager_service.transports.rest import SecretManagerServiceRestTransport
+from google.cloud.storage import Client as StorageClient
+
+from ..config_providers import ClientPool, GcpSecretConfigProvider, GcpStorageConfigProvider
+from .fault_injection import FaultInjection
+
+_STATUS_NAMES = {
+    400: "INVALID_ARGUMENT",
+    403: "PERMISSION_DENIED",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+_ROUTES = [
+    ("storage.download", re.compile(r"^/download/storage/v1/b/(?P<bucket>[^/]+)/o/(?P<object>.+)$")),
+    ("storage.list", re.compile(r"^/storage/v1/b/(?P<bucket>[^/]+)/o$")),
+    ("storage.get", re.compile(r"^/storage/v1/b/(?P<bucket>[^/]+)/o/(?P<object>.+)$")),
+    (
+        "secrets.access",
+        re.compile(r"^/v1/projects/(?P<project>[^/]+)/secrets/(?P<secret>[^/]+)/versions/(?P<version>[^/:]+):access$"),
+    ),
+    ("secrets.get", re.compile(r"^/v1/projects/(?P<project>[^/]+)/secrets/(?P<secret>[^/]+)/versions/(?P<version>[^/:]+)$")),
+]
+
+
+@dataclass(frozen=True)
+class _StoredObject:
+    data: bytes
+    generation: int
+    updated: str
+
+
+class FakeGcpServer:
+    """
+    Local HTTP stand-in of the Cloud Storage JSON API and the Secret Manager REST API, for tests and benchmarks
+    without network access.
+
+    It implements what the configuration providers use: object metadata, media download and listing with
+    generations and etags, and secret version lookup and access. The real `google-cloud-storage` and
+    `google-cloud-secret-manager` clients talk to it through endpoint overrides (see `storage_client` and
+    `secret_manager_client`), so their request building, retries and connection pooling are exercised as in
+    production. Every request goes through `faults`, which adds latency, errors and throttling, and is counted
+    per operation in `request_counts`.
+
+    Usage:
+        with FakeGcpServer(FaultInjection(latency_ms=20, latency_p99_ms=250)) as server:
+            server.put_object("configs", "app.yaml", "feature_flags: {}")
+            provider = server.storage_provider("configs", "app.yaml")
+            provider.get_config()
+    """
+
+    def __init__(self, faults: FaultInjection | None = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize a stopped server.
+        :param faults: Latency, error and throttling behaviour. No faults by default.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, a free one by default.
+        """
+        self.faults = faults or FaultInjection()
+        self.request_counts: Counter[str] = Counter()
+        self._objects: dict[tuple[str, str], _StoredObject] = {}
+        self._secrets: dict[tuple[str, str], list[bytes]] = {}
+        self._generation = int(time.time() * 1_000_000)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _FakeGcpRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake_gcp_server = self  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGcpServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-gcp-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeGcpServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def put_object(self, bucket: str, name: str, data: str | bytes) -> int:
+        """
+        Create or replace an object.
+
+        :return: The generation of the new object.
+        """
+        with self._lock:
+            self._generation += 1
+            updated = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+            self._objects[(bucket, name)] = _StoredObject(_as_bytes(data), self._generation, updated)
+            return self._generation
+
+    def delete_object(self, bucket: str, name: str) -> None:
+        with self._lock:
+            self._objects.pop((bucket, name), None)
+
+    def add_secret_version(self, project_id: str, secret: str, data: str | bytes) -> int:
+        """
+        Add a version to a secret, creating the secret if necessary.
+
+        :return: The number of the new version.
+        """
+        with self._lock:
+            versions = self._secrets.setdefault((project_id, secret), [])
+            versions.append(_as_bytes(data))
+            return len(versions)
+
+    def storage_client(self, project_id: str = "test-project") -> StorageClient:
+        """
+        Return a real Storage client sending its requests to this server.
+        """
+        return StorageClient(
+            project=project_id, credentials=AnonymousCredentials(), client_options={"api_endpoint": self.endpoint}
+        )
+
+    def secret_manager_client(self) -> SecretManagerServiceClient:
+        """
+        Return a real Secret Manager client sending its requests to this server over REST.
+        """
+        host = self.endpoint.removeprefix("http://")
+        transport = SecretManagerServiceRestTransport(host=host, credentials=AnonymousCredentials(), url_scheme="http")
+        return SecretManagerServiceClient(transport=transport)
+
+    def storage_provider(self, bucket: str, blob_name: str, project_id: str = "test-project") -> GcpStorageConfigProvider:
+        """
+        Return a provider of the object `blob_name`, with client and bucket pools of its own bound to this server.
+        """
+        client_pool = ClientPool("fake-gcp-storage-clients")
+        client_pool.get((project_id, None), lambda: self.storage_client(project_id))
+        return GcpStorageConfigProvider(
+            bucket, blob_name, project_id, client_pool=client_pool, bucket_pool=ClientPool("fake-gcp-storage-buckets")
+        )
+
+    def secret_provider(self, secret: str, project_id: str = "test-project") -> GcpSecretConfigProvider:
+        """
+        Return a provider of the latest version of `secret`, with a client pool of its own bound to this server.
+        """
+        client_pool = ClientPool("fake-gcp-secret-clients")
+        client_pool.get((project_id, None), self.secret_manager_client)
+        return GcpSecretConfigProvider(secret, project_id, client_pool=client_pool)
+
+    def handle(self, path: str, query: dict[str, list[str]]) -> tuple[int, dict[str, str], bytes]:
+        """
+        Serve one GET request after applying the injected faults.
+
+        :return: Status, headers and body of the response.
+        """
+        latency = self.faults.sample_latency()
+        if latency:
+            time.sleep(latency)
+
+        for operation, pattern in _ROUTES:
+            match = pattern.match(path)
+            if match is not None:
+                break
+        else:
+            return _error(404, f"Unknown path {path}")
+
+        params = {name: unquote(value) for name, value in match.groupdict().items()}
+        if not self.faults.acquire():
+            self._count("throttled")
+            return _error(429, "Rate limit exceeded.")
+        if self.faults.should_fail():
+            self._count("failed")
+            return _error(self.faults.error_status, "Injected failure.")
+
+        self._count(operation)
+        if operation.startswith("storage."):
+            return self._handle_storage(operation, params, query)
+        return self._handle_secret(operation, params)
+
+    def _count(self, outcome: str) -> None:
+        # Requests are served on concurrent threads, and `Counter` updates are not atomic
+        with self._lock:
+            self.request_counts[outcome] += 1
+
+    def _handle_storage(
+        self, operation: str, params: dict[str, str], query: dict[str, list[str]]
+    ) -> tuple[int, dict[str, str], bytes]:
+        bucket = params["bucket"]
+        if operation == "storage.list":
+            return self._list_objects(bucket, query.get("prefix", [""])[0], query.get("delimiter", [""])[0])
+
+        stored = self._objects.get((bucket, params["object"]))
+        if stored is None:
+            return _error(404, f"No such object: {bucket}/{params['object']}")
+        if operation == "storage.get" and query.get("alt") != ["media"]:
+            return _json(200, _object_resource(bucket, params["object"], stored))
+
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "x-goog-generation": str(stored.generation),
+            "x-goog-hash": f"crc32c={_crc32c(stored.data)},md5={_md5(stored.data)}",
+        }
+        return 200, headers, stored.data
+
+    def _list_objects(self, bucket: str, prefix: str, delimiter: str) -> tuple[int, dict[str, str], bytes]:
+        items = []
+        prefixes = set()
+        for (object_bucket, name), stored in sorted(self._objects.items()):
+            if object_bucket != bucket or not name.startswith(prefix):
+                continue
+            rest = name[len(prefix) :]
+            if delimiter and delimiter in rest:
+                prefixes.add(prefix + rest.split(delimiter, 1)[0] + delimiter)
+            else:
+                items.append(_object_resource(bucket, name, stored))
+        return _json(200, {"kind": "storage#objects", "items": items, "prefixes": sorted(prefixes)})
+
+    def _handle_secret(self, operation: str, params: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        versions = self._secrets.get((params["project"], params["secret"]))
+        number = (
+            len(versions)
+            if versions and params["version"] == "latest"
+            else int(params["version"]) if params["version"].isdigit() else 0
+        )
+        if not versions or not 1 <= number <= len(versions):
+            return _error(404, f"Secret [{params['secret']}] version [{params['version']}] not found.")
+
+        name = f"projects/{params['project']}/secrets/{params['secret']}/versions/{number}"
+        if operation == "secrets.get":
+            return _json(200, {"name": name, "state": "ENABLED"})
+        data = versions[number - 1]
+        return _json(
+            200,
+            {
+                "name": name,
+                "payload": {"data": base64.b64encode(data).decode("ascii"), "dataCrc32c": str(google_crc32c.value(data))},
+            },
+        )
+
+
+class _FakeGcpRequestHandler(BaseHTTPRequestHandler):
+    """
+    Hands the GET requests received by the HTTP server to its FakeGcpServer.
+    """
+
+    # Keep-alive, so the clients' connection pooling behaves as against the real APIs
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        status, headers, body = self.server.fake_gcp_server.handle(url.path, parse_qs(url.query))  # type: ignore[attr-defined]
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _as_bytes(data: str | bytes) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def _crc32c(data: bytes) -> str:
+    return base64.b64encode(google_crc32c.value(data).to_bytes(4, "big")).decode("ascii")
+
+
+def _md5(data: bytes) -> str:
+    return base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+
+
+def _object_resource(bucket: str, name: str, stored: _StoredObject) -> dict[str, Any]:
+    return {
+        "kind": "storage#object",
+        "id": f"{bucket}/{name}/{stored.generation}",
+        "name": name,
+        "bucket": bucket,
+        "generation": str(stored.generation),
+        "metageneration": "1",
+        "contentType": "application/octet-stream",
+        "size": str(len(stored.data)),
+        "md5Hash": _md5(stored.data),
+        "crc32c": _crc32c(stored.data),
+        "etag": f"{stored.generation}-{_md5(stored.data)[:8]}",
+        "timeCreated": stored.updated,
+        "updated": stored.updated,
+    }
+
+
+def _json(status: int, body: dict[str, Any]) -> tuple[int, dict[str, str], bytes]:
+    return status, {"Content-Type": "application/json; charset=UTF-8"}, json.dumps(body).encode("utf-8")
+
+
+def _error(status: int, message: str) -> tuple[int, dict[str, str], bytes]:
+    return _json(status, {"error": {"code": status, "message": message, "status": _STATUS_NAMES.get(status, "UNKNOWN")}})
@@ -0,0 +1,78 @@
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FaultInjection:
+    """
+    Latency, error and throttling behaviour of a `FakeGcpServer`.
+
+    Latencies follow a log-normal distribution with the given median and 99th percentile, which reproduces the long
+    tail of real API calls; without a 99th percentile every request takes the median. Throttling is a token bucket
+    refilled at `max_requests_per_second` that holds up to one second of requests; requests finding it empty are
+    rejected with 429.
+    """
+
+    latency_ms: float = 0.0
+    latency_p99_ms: float | None = None
+    error_rate: float = 0.0
+    error_status: int = 503
+    max_requests_per_second: float | None = None
+    seed: int | None = None
+    _random: random.Random = field(init=False, repr=False)
+    _tokens: float = field(init=False, repr=False)
+    _refilled_at: float = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self):
+        if self.latency_p99_ms is not None and self.latency_p99_ms < self.latency_ms:
+            raise ValueError("latency_p99_ms must not be lower than latency_ms.")
+        if not 0 <= self.error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self._random = random.Random(self.seed)
+        self._tokens = self.max_requests_per_second or 0.0
+        self._refilled_at = time.monotonic()
+
+    def sample_latency(self) -> float:
+        """
+        Return the latency of a request, in seconds.
+        """
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.latency_p99_ms is None:
+            return self.latency_ms / 1000
+        # The 99th percentile of a standard normal distribution is 2.326 standard deviations above the median
+        sigma = math.log(self.latency_p99_ms / self.latency_ms) / 2.326
+        with self._lock:
+            return self._random.lognormvariate(math.log(self.latency_ms), sigma) / 1000
+
+    def should_fail(self) -> bool:
+        """
+        Return whether a request fails with `error_status`.
+        """
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def acquire(self) -> bool:
+        """
+        Take a token from the throttling bucket.
+
+        :return: False if the request is throttled.
+        """
+        if self.max_requests_per_second is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_requests_per_second, self._tokens + (now - self._refilled_at) * self.max_requests_per_second
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -0,0 +1,50 @@
+import threading
+from typing import Dict, Generic, Optional, Type, TypeVar
+
+V = TypeVar("V")
+
+
+class TypeDispatchTable(Generic[V]):
+    """
+    Maps types to values, resolving subclasses through their MRO.
+
+    The resolution of each concrete type is cached, so after the first lookup dispatching a type costs a
+    single dict access instead of an `isinstance` chain.
+    """
+
+    def __init__(self):
+        self._entries: Dict[type, V] = {}
+        self._resolved: Dict[type, Optional[V]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, registered_type: Type, value: V) -> None:
+        """
+        Register a value for a type and its subclasses.
+        """
+        with self._lock:
+            self._entries[registered_type] = value
+            # Registrations may change how subclasses resolve
+            self._resolved = {}
+
+    def __contains__(self, registered_type: type) -> bool:
+        return registered_type in self._entries
+
+    def resolve(self, lookup_type: type) -> Optional[V]:
+        """
+        Return the value registered for `lookup_type` or its closest registered base class.
+
+        :return: The registered value, or None if neither the type nor any of its bases is registered.
+        """
+        try:
+            return self._resolved[lookup_type]
+        except KeyError:
+            pass
+
+        value = None
+        for base in lookup_type.__mro__:
+            if base in self._entries:
+                value = self._entries[base]
+                break
+
+        self._resolved[lookup_type] = value
+        return value
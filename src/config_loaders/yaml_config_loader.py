@@ -5,6 +5,9 @@ import yaml
 
 from .config_loader import ConfigLoader
 from .config_providers import ConfigProvider
+from .instrumentation import ConfigInstrumentation
+from .parsed_config_cache import ConfigLoaderMetrics, ParsedConfigCache
+from .parser_backends import ParserBackend, ParserBackendRegistry
 
 
 class YamlConfigLoader(ConfigLoader):
@@ -12,37 +15,72 @@ class YamlConfigLoader(ConfigLoader):
     Loads configuration from a YAML source provided by a ConfigProvider.
     """
 
-    def __init__(self, config_provider: ConfigProvider):
+    def __init__(
+        self,
+        config_provider: ConfigProvider,
+        parsed_config_cache: ParsedConfigCache | None = None,
+        parser_backend: ParserBackend | str | None = None,
+    ):
         """
         Initialize the YAML loader with a configuration provider.
         :param config_provider: Instance of ConfigProvider to fetch configuration content.
+        :param parsed_config_cache: Cache of parsed payloads. Defaults to the process-wide cache.
+        :param parser_backend: YAML parser backend, or the name of a registered one (e.g. "libyaml").
+                               Defaults to the backend selected globally in `ParserBackendRegistry`.
         """
         self.config_provider = config_provider
+        self.parsed_config_cache = parsed_config_cache or ParsedConfigCache.default()
+        self.parser_backend = (
+            ParserBackendRegistry.get("yaml", parser_backend) if isinstance(parser_backend, str) else parser_backend
+        )
+        self.metrics = ConfigLoaderMetrics()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def load(self) -> dict[str, Any]:
         """
         Load and parse the YAML configuration.
 
+        :return: Parsed configuration as a dictionary.
+        :raises yaml.YAMLError: If the YAML content is invalid.
+        :raises ValueError: If the configuration content is empty.
+        :raises Exception: For any unexpected errors.
+        """
+        with ConfigInstrumentation.load_span(self, self.config_provider):
+            return self.load_content(ConfigInstrumentation.fetch(self.config_provider))
+
+    def load_content(self, config_content: str | None) -> dict[str, Any]:
+        """
+        Parse YAML content that was already fetched from the provider.
+
+        :param config_content: Raw YAML content as returned by the provider.
         :return: Parsed configuration as a dictionary.
         :raises yaml.YAMLError: If the YAML content is invalid.
         :raises ValueError: If the configuration content is empty.
         :raises Exception: For any unexpected errors.
         """
         try:
-            config_content = self.config_provider.get_config()
             if config_content is None or not config_content.strip():
                 raise ValueError("Configuration content is empty or invalid.")
 
-            parsed_content = yaml.safe_load(config_content)  # Safely parse YAML content
-            self.logger.info("Successfully parsed YAML configuration.")
+            parsed_content = self.parse_content(config_content)
+            self.logger.debug("Successfully parsed YAML configuration.")
             return parsed_content
         except yaml.YAMLError as e:
-            self.logger.error(f"Failed to parse YAML content: {e}")
+            self.logger.error("Failed to parse YAML content: %s", e)
             raise
         except ValueError as e:
-            self.logger.error(f"Error: {e}")
+            self.logger.error("Error: %s", e)
             raise
         except Exception as e:
-            self.logger.exception(f"Unexpected error while loading YAML configuration: {e}")
+            self.logger.exception("Unexpected error while loading YAML configuration: %s", e)
             raise
+
+    def parse_content(self, config_content: str) -> dict[str, Any]:
+        """
+        Parse YAML content, reusing the cached result for a payload that was already parsed.
+
+        :param config_content: Raw YAML content.
+        :return: A private copy of the parsed configuration.
+        """
+        parser_backend = self.parser_backend or ParserBackendRegistry.get("yaml")
+        return self.parsed_config_cache.get_or_parse("yaml", config_content, parser_backend.parse, self.metrics)
@@ -1,4 +1,15 @@
+from .bounded_queue_handler import BoundedQueueHandler
 from .inject_logger import inject_logger
 from .inject_typed_request import inject_typed_request
+from .json_log_formatter import JsonLogFormatter
+from .queue_logging_pipeline import QueueLoggingPipeline
+from .request_binder import RequestBinder
 
-__all__ = ["inject_typed_request", "inject_logger"]
+__all__ = [
+    "inject_typed_request",
+    "inject_logger",
+    "BoundedQueueHandler",
+    "JsonLogFormatter",
+    "QueueLoggingPipeline",
+    "RequestBinder",
+]
@@ -0,0 +1,40 @@
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the logging thread: when the queue is full the record is dropped and counted.
+
+    Only the message is resolved on the logging thread (so mutable arguments are captured as they were), along with
+    the traceback text of exceptions; the full formatting is left to the handlers behind the queue listener.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
+        :param log_queue: Bounded queue the records are put in.
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
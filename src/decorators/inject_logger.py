@@ -34,6 +34,11 @@ def inject_logger(logger_name: str | None = None):
     If 'logger' is not provided in kwargs, it creates one using either:
       - the provided 'logger_name', or
       - the function's module name (e.g., 'my_package.my_module') if logger_name is None.
+    The logger is resolved once, when the function is decorated.
+
+    The logging pipeline is a process-wide choice made at startup, not per decorator: call
+    `QueueLoggingPipeline.install(...)` before the first decorated call to write records as Cloud Logging JSON
+    from a background thread. The `basicConfig` of the first call then leaves the installed handler in place.
 
     Usage:
         @inject_logger()
@@ -47,15 +52,17 @@ def inject_logger(logger_name: str | None = None):
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        logger = logging.getLogger(logger_name or func.__module__)  # e.g. 'my_package.my_module'
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # 1) Configure logging globally only once
-            _configure_logging_globally()
+            if not _global_logger_configured:
+                _configure_logging_globally()
 
             # 2) Inject a logger if not provided
             if "logger" not in kwargs:
-                name = logger_name or func.__module__  # e.g. 'my_package.my_module'
-                kwargs["logger"] = logging.getLogger(name)
+                kwargs["logger"] = logger
 
             return func(*args, **kwargs)
 
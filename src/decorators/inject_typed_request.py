@@ -1,11 +1,12 @@
 import functools
-import inspect
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from flask import Request
 
+from .request_binder import RequestBinder
 
-def inject_typed_request():
+
+def inject_typed_request(headers: Iterable[str] | None = None, raw_body: bool = False):
     """
     A custom decorator that:
       1) Expects the first argument at runtime to be a Flask `Request`.
@@ -26,7 +27,7 @@ def inject_typed_request():
                 # The typed decorator will call this to parse incoming JSON
                 return cls.model_validate(data)
 
-        @inject_typed_request
+        @inject_typed_request()
         def say_hello(req: GreetingRequest):
             # 'req' is now a strongly typed GreetingRequest,
             # populated from the HTTP request JSON.
@@ -43,82 +44,41 @@ def inject_typed_request():
         (e.g., Pydantic’s `.parse_obj(...)`), adjust the code accordingly.
       - If the returned object has a `.to_dict()` method, the decorator converts
         it to a dict so Flask can automatically handle the JSON response.
+      - Query parameters override body fields. Headers listed in `headers` override both, as fields
+        named in lowercase with underscores (e.g. "X-Custom-Token" -> `x_custom_token`); by default,
+        the headers matching the model's `x_*` fields are injected.
+      - For JSON-only endpoints, `raw_body=True` validates the body bytes straight with the
+        pydantic model's `model_validate_json`, skipping `get_json`, `from_dict` and the merged dict.
+        Only query parameters the model declares are merged. Unlike the default mode, the content
+        type is not checked and a malformed body is a validation error instead of an empty body.
+      - The signature is inspected once, when the function is decorated, so a missing or unusable
+        annotation is reported at import time rather than on the first request.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # All reflection is done once, here, instead of on every request
+        binder = RequestBinder(func, headers=headers, raw_body=raw_body)
+        to_dict_of_type: dict[type, Callable[[Any], Any] | None] = {}
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-
-            # 1. Reflect on the original function's signature
-            sig = inspect.signature(func)
-            parameters = list(sig.parameters.values())
-            if not parameters:
-                raise TypeError(f"Function {func.__name__} has no parameters. " "Cannot infer typed request parameter.")
-
-            # 2. The first parameter must have a type annotation, e.g. GreetingRequest
-            first_param = parameters[0]
-            annotated_type = first_param.annotation
-            if annotated_type is inspect._empty:
-                raise TypeError(
-                    f"Function {func.__name__}'s first parameter '{first_param.name}' "
-                    "is not annotated with a type. Please provide a type annotation."
-                )
-
-            # 3. We expect the first *runtime* argument to be a Flask Request
+            # 1. We expect the first *runtime* argument to be a Flask Request
             if not args:
                 raise ValueError("No arguments provided at runtime (expected a Flask Request).")
-
-            maybe_request = args[0]
-            if not isinstance(maybe_request, Request):
-                raise TypeError(f"Expected the first argument to be a Flask Request, but got {type(maybe_request)}")
-
-            flask_request: Request = maybe_request
-
-            # 4. Deserialize JSON body from the Flask Request
-            json_data = flask_request.get_json(silent=True) or {}
-
-            # 4.1. Query params as a dict
-            query_data = dict(flask_request.args)  # e.g. {"foo":"123","bar":"xyz"}
-
-            # 4.2. Headers (convert keys to a consistent pattern, e.g. lowercase + underscores)
-            #    or keep them as-is if you prefer.
-            header_data = {}
-            # TODO: We can enable below code block if it is needed.
-            # for k, v in flask_request.headers.items():
-            #     # Example: "X-Custom-Token" -> "x_custom_token"
-            #     # Convert header name to lowercase and underscores:
-            #     # e.g. "X-Custom-Token" -> "x_custom_token"
-            #     normalized_key = k.lower().replace("-", "_")
-
-            #     # Only add headers that start with "x-" (or whatever logic you need)
-            #     if normalized_key.startswith("x_"):
-            #         header_data[normalized_key] = v
-
-            # 4.3. Merge them (order can matter if you want body to override query, etc.)
-            # For example, if query_data should override JSON, do: {**json_data, **query_data}
-            merged_data = {**json_data, **query_data, **header_data}
-
-            # 5. We assume the annotated_type has a `from_dict(...)` or similar constructor
-            #    Adjust this to match your typed model's constructor pattern (Pydantic, etc.)
-            if not hasattr(annotated_type, "from_dict"):
-                raise AttributeError(f"Type '{annotated_type.__name__}' does not have a 'from_dict' method.")
-
-            # 6. Convert the JSON to a strongly typed model
-            #    Using Pydantic's parse_obj or constructor
-            typed_obj = annotated_type.from_dict(merged_data)
-
-            # 7. Replace the first argument with the typed object
-            new_args = (typed_obj,) + args[1:]
-
-            # 8. Call your original function with typed_obj
-            result = func(*new_args, **kwargs)
-
-            # 9. If the result has a `.to_dict()`, convert to dict so Flask can return JSON
-            #    (Optional step, depending on your return-type needs.)
-            if hasattr(result, "to_dict") and callable(result.to_dict):
-                return result.to_dict()
-
-            return result
+            if not isinstance(args[0], Request):
+                raise TypeError(f"Expected the first argument to be a Flask Request, but got {type(args[0])}")
+
+            # 2. Replace it with the typed object and call the original function
+            result = func(binder.bind(args[0]), *args[1:], **kwargs)
+
+            # 3. If the result has a `.to_dict()`, convert to dict so Flask can return JSON
+            result_type = type(result)
+            try:
+                to_dict = to_dict_of_type[result_type]
+            except KeyError:
+                to_dict = getattr(result_type, "to_dict", None)
+                to_dict = to_dict_of_type[result_type] = to_dict if callable(to_dict) else None
+            return to_dict(result) if to_dict is not None else result
 
         return wrapper
 
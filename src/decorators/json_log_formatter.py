@@ -0,0 +1,35 @@
+import datetime
+import json
+import logging
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    Formats records as one-line JSON entries that Cloud Logging parses as structured logs: `severity`, `message`,
+    `time`, the source location and the logger name, plus the fields of a `json_fields` dict passed in `extra`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+
+        entry = {
+            "severity": record.levelname,
+            "message": message,
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "logging.googleapis.com/sourceLocation": {
+                "file": record.pathname,
+                "line": record.lineno,
+                "function": record.funcName,
+            },
+            "logger": record.name,
+        }
+        json_fields = getattr(record, "json_fields", None)
+        if isinstance(json_fields, dict):
+            entry.update(json_fields)
+        return json.dumps(entry, ensure_ascii=False, default=str)
@@ -0,0 +1,105 @@
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+from typing import ClassVar, Sequence
+
+from .bounded_queue_handler import BoundedQueueHandler
+from .json_log_formatter import JsonLogFormatter
+
+
+class _QueueListener(QueueListener):
+    """
+    Queue listener whose stop waits for room in a full queue instead of failing to enqueue its sentinel.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class QueueLoggingPipeline:
+    """
+    Moves log I/O off the calling threads: loggers only put records in a bounded in-memory queue and a background
+    listener thread formats and writes them.
+
+    Records logged while the queue is full are dropped rather than blocking the caller; they are counted in
+    `dropped` and reported when the pipeline stops. Stopping drains the queue, and an installed pipeline is
+    stopped automatically when the interpreter exits.
+    """
+
+    _installed: ClassVar["QueueLoggingPipeline | None"] = None
+    _install_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, handlers: Sequence[logging.Handler] | None = None, max_queue_size: int = 10_000):
+        """
+        Initialize a stopped pipeline.
+        :param handlers: Handlers writing the records, a JSON stream handler on stderr by default.
+        :param max_queue_size: Number of records the queue holds before dropping new ones.
+        """
+        if handlers is None:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(JsonLogFormatter())
+            handlers = [stream_handler]
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.queue_handler = BoundedQueueHandler(self.queue)
+        self.listener = _QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._running = False
+
+    @classmethod
+    def install(
+        cls, level: int = logging.INFO, handlers: Sequence[logging.Handler] | None = None, max_queue_size: int = 10_000
+    ) -> "QueueLoggingPipeline":
+        """
+        Start the process-wide pipeline and make it the only handler of the root logger. Later calls return the
+        installed pipeline.
+
+        :param level: Level of the root logger.
+        :param handlers: Handlers writing the records, a JSON stream handler on stderr by default.
+        :param max_queue_size: Number of records the queue holds before dropping new ones.
+        :return: The installed pipeline.
+        """
+        with cls._install_lock:
+            if cls._installed is None:
+                pipeline = cls(handlers, max_queue_size)
+                pipeline.start()
+                root = logging.getLogger()
+                for handler in list(root.handlers):
+                    root.removeHandler(handler)
+                root.addHandler(pipeline.queue_handler)
+                root.setLevel(level)
+                atexit.register(pipeline.stop)
+                cls._installed = pipeline
+            return cls._installed
+
+    @property
+    def dropped(self) -> int:
+        return self.queue_handler.dropped
+
+    def start(self) -> None:
+        """
+        Start the listener thread.
+        """
+        if not self._running:
+            self.listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """
+        Write every queued record, then stop the listener thread.
+        """
+        if not self._running:
+            return
+        self.listener.stop()
+        self._running = False
+        if self.dropped:
+            record = logging.LogRecord(
+                self.__class__.__name__,
+                logging.WARNING,
+                __file__,
+                0,
+                "%d log records were dropped because the logging queue was full.",
+                (self.dropped,),
+                None,
+            )
+            self.listener.handle(record)
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 
 from config_loaders.config_loader_args import (
@@ -86,23 +87,23 @@ def main():
 
     logger = logging.getLogger(__name__)
 
-    test_settings_from_env_file(logger)
-
-    test_settings_from_json_file(logger)
-
-    test_settings_from_yaml_file(logger)
-
-    test_settings_from_gcp_secret_env(logger)
-
-    test_settings_from_gcp_secret_json(logger)
-
-    test_settings_from_gcp_secret_yaml(logger)
-
-    test_settings_from_gcp_storage_env(logger)
-
-    test_settings_from_gcp_storage_json(logger)
-
-    test_settings_from_gcp_storage_yaml(logger)
+    settings_functions = [
+        test_settings_from_env_file,
+        test_settings_from_json_file,
+        test_settings_from_yaml_file,
+        test_settings_from_gcp_secret_env,
+        test_settings_from_gcp_secret_json,
+        test_settings_from_gcp_secret_yaml,
+        test_settings_from_gcp_storage_env,
+        test_settings_from_gcp_storage_json,
+        test_settings_from_gcp_storage_yaml,
+    ]
+
+    # Each function loads its settings on its first call: calling them concurrently fetches the nine sources at
+    # the same time, so startup takes roughly as long as the slowest one.
+    with ThreadPoolExecutor(max_workers=len(settings_functions), thread_name_prefix="settings") as executor:
+        for future in [executor.submit(settings_function, logger) for settings_function in settings_functions]:
+            future.result()
 
 
 if __name__ == "__main__":
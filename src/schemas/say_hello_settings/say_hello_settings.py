@@ -1,17 +1,10 @@
-from pydantic import BaseModel
-
-from config_loaders import ConfigLoader
+from config_loaders import ConfigSettings
 
 from .greeting_language import GreetingLanguage
 from .greeting_type import GreetingType
 
 
-class SayHelloSettings(BaseModel):
+class SayHelloSettings(ConfigSettings):
     default_name: str
     greeting_type: GreetingType
     greeting_language: GreetingLanguage
-
-    @classmethod
-    def load(cls, config_loader: ConfigLoader) -> "SayHelloSettings":
-        config = config_loader.load()
-        return cls(**config)
@@ -1,6 +1,4 @@
-from pydantic import BaseModel
-
-from config_loaders import ConfigLoader
+from config_loaders import ConfigSettings
 from schemas.settings import (
     AirflowCoreSettings,
     AirflowInitSettings,
@@ -12,7 +10,7 @@ from schemas.settings import (
 )
 
 
-class Settings(BaseModel):
+class Settings(ConfigSettings):
     project_env: Environment
 
     feature_flags: FeatureFlagsSettings
@@ -21,8 +19,3 @@ class Settings(BaseModel):
     airflow_init: AirflowInitSettings
     airflow_core: AirflowCoreSettings
     cdt_to_nexum: CdtToNexumSettings
-
-    @classmethod
-    def load(cls, config_loader: ConfigLoader) -> "Settings":
-        config = config_loader.load()
-        return cls(**config)
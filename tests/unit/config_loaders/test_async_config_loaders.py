@@ -0,0 +1,37 @@
+import asyncio
+
+from config_loaders import (
+    AsyncEnvConfigLoader,
+    AsyncJsonConfigLoader,
+    AsyncYamlConfigLoader,
+    ConfigLoaderFactory,
+    EnvConfigLoaderArgs,
+    JsonConfigLoaderArgs,
+    YamlConfigLoaderArgs,
+    inject_settings_from_loader_args,
+)
+from schemas import SayHelloSettings, Settings
+
+
+class TestAsyncConfigLoaders:
+
+    def test_async_loaders_match_sync_loaders(self):
+        for config_loader_args, loader_type in [
+            (EnvConfigLoaderArgs(file_path=".env"), AsyncEnvConfigLoader),
+            (JsonConfigLoaderArgs(file_path="config.json"), AsyncJsonConfigLoader),
+            (YamlConfigLoaderArgs(file_path="config.yaml"), AsyncYamlConfigLoader),
+        ]:
+            async_loader = ConfigLoaderFactory.get_async_loader(config_loader_args)
+            assert isinstance(async_loader, loader_type)
+
+            async_settings = asyncio.run(Settings.aload(async_loader))
+            sync_settings = Settings.load(ConfigLoaderFactory.get_loader(config_loader_args))
+
+            assert async_settings == sync_settings
+
+    def test_inject_settings_on_async_handler(self):
+        @inject_settings_from_loader_args(EnvConfigLoaderArgs(file_path=".env.say_hello"))
+        async def say_hello(name: str, settings: SayHelloSettings):
+            return f"{settings.greeting_type.value}:{name or settings.default_name}"
+
+        assert asyncio.run(say_hello("")) == "timebased:World"
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from config_loaders import (
+    ConfigLoader,
+    ConfigLoaderFactory,
+    EnvConfigLoaderArgs,
+    JsonConfigLoaderArgs,
+    YamlConfigLoaderArgs,
+    load_concurrently,
+)
+
+
+class SleepingConfigLoader(ConfigLoader):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def load(self):
+        time.sleep(self.seconds)
+        return {"slept": self.seconds}
+
+
+class TestConcurrentConfigLoading:
+
+    def test_results_keep_input_order_and_capture_errors(self):
+        results = ConfigLoaderFactory.load_many(
+            [
+                YamlConfigLoaderArgs(file_path="config.yaml"),
+                JsonConfigLoaderArgs(file_path="missing.json"),
+                EnvConfigLoaderArgs(file_path=".env.local"),
+            ]
+        )
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[0].unwrap()["airflow_core"]["airflow_uid"] == 55
+        assert isinstance(results[1].error, FileNotFoundError)
+        assert results[2].unwrap()["airflow_core"]["airflow_uid"] == 1000
+        with pytest.raises(FileNotFoundError):
+            results[1].unwrap()
+
+    def test_sources_are_loaded_concurrently_within_the_worker_cap(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class TrackingConfigLoader(ConfigLoader):
+            def load(self):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+                return {}
+
+        started_at = time.monotonic()
+        results = load_concurrently(lambda args: TrackingConfigLoader(), [object()] * 6, max_workers=3)  # type: ignore[list-item]
+
+        assert all(result.ok for result in results)
+        assert peak == 3
+        assert time.monotonic() - started_at < 6 * 0.05
+
+    def test_slow_source_times_out(self):
+        results = load_concurrently(
+            lambda seconds: SleepingConfigLoader(seconds), [0.0, 2.0], timeout=0.2  # type: ignore[arg-type, list-item]
+        )
+
+        assert results[0].ok
+        assert isinstance(results[1].error, TimeoutError)
+        assert results[1].elapsed_seconds < 1.0
+
+    def test_timed_out_source_keeps_its_slot_until_it_returns(self):
+        release = threading.Event()
+
+        class HangingConfigLoader(ConfigLoader):
+            def load(self):
+                release.wait()
+                return {}
+
+        class CheckingConfigLoader(ConfigLoader):
+            def load(self):
+                return {"hung_source_returned": release.is_set()}
+
+        loaders = [HangingConfigLoader(), CheckingConfigLoader()]
+        threading.Timer(0.5, release.set).start()
+        results = load_concurrently(
+            lambda index: loaders[index], [0, 1], max_workers=1, timeout=0.2, deadline=5.0  # type: ignore[arg-type, list-item]
+        )
+
+        assert isinstance(results[0].error, TimeoutError)
+        assert results[0].elapsed_seconds < 0.5
+        assert results[1].unwrap() == {"hung_source_returned": True}
+
+    def test_queued_sources_time_out_at_the_deadline(self):
+        results = load_concurrently(
+            lambda seconds: SleepingConfigLoader(seconds), [2.0, 0.0], max_workers=1, deadline=0.2  # type: ignore[arg-type, list-item]
+        )
+
+        assert isinstance(results[0].error, TimeoutError)
+        assert isinstance(results[1].error, TimeoutError)
+        assert "did not start" in str(results[1].error)
+
+    def test_load_threads_are_daemons(self):
+        daemon = []
+
+        class DaemonCheckingConfigLoader(ConfigLoader):
+            def load(self):
+                daemon.append(threading.current_thread().daemon)
+                return {}
+
+        load_concurrently(lambda args: DaemonCheckingConfigLoader(), [object()])  # type: ignore[list-item]
+
+        assert daemon == [True]
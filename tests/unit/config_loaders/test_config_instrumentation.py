@@ -0,0 +1,161 @@
+import logging
+
+import pytest
+
+from config_loaders import (
+    CachingConfigProvider,
+    ConfigInstrumentation,
+    ConfigLoaderFactory,
+    ConfigPayloadCache,
+    DefaultEnvConfigProcessor,
+    EnvConfigLoader,
+    FileConfigProvider,
+    InstrumentationSink,
+    JsonConfigLoader,
+    JsonConfigLoaderArgs,
+    LayeredConfigLoader,
+    LoggingInstrumentationSink,
+    OpenTelemetryInstrumentationSink,
+    ParsedConfigCache,
+    YamlConfigLoaderArgs,
+)
+from schemas import Settings
+
+
+class RecordingSink(InstrumentationSink):
+    def __init__(self):
+        self.started = []
+        self.spans = []
+        self.events = []
+
+    def start_span(self, name, attributes):
+        self.started.append(name)
+        return name
+
+    def end_span(self, handle, name, attributes, duration_seconds, error):
+        self.spans.append((name, dict(attributes), error))
+
+    def event(self, name, attributes):
+        self.events.append((name, dict(attributes)))
+
+    def span(self, name):
+        return next(attributes for span_name, attributes, _ in self.spans if span_name == name)
+
+
+class FailingSink(RecordingSink):
+    def start_span(self, name, attributes):
+        raise RuntimeError("sink is down")
+
+
+@pytest.fixture
+def install_sink():
+    def install(sink):
+        ConfigInstrumentation.set_sink(sink)
+        return sink
+
+    yield install
+    ConfigInstrumentation.set_sink(None)
+
+
+class TestConfigInstrumentation:
+
+    def test_disabled_by_default(self):
+        assert ConfigInstrumentation.enabled is False
+        assert ConfigInstrumentation.span("config.parse") is ConfigInstrumentation.span("config.load")
+
+    def test_load_reports_nested_stages(self, tmp_path, install_sink):
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        sink = install_sink(RecordingSink())
+        loader = JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=ParsedConfigCache())
+
+        loader.load()
+        loader.load()
+
+        assert sink.started[:3] == ["config.load", "config.fetch", "config.parse"]
+        assert [name for name, _, _ in sink.spans[:3]] == ["config.fetch", "config.parse", "config.load"]
+        assert sink.span("config.load") == {"loader": "JsonConfigLoader", "source": ("file", str(path))}
+        assert sink.span("config.fetch") == {"provider": "FileConfigProvider", "source": ("file", str(path)), "chars": 8}
+        assert [attributes["cache_hit"] for name, attributes, _ in sink.spans if name == "config.parse"] == [False, True]
+
+    def test_env_processing_and_validation_are_reported(self, tmp_path, install_sink):
+        path = tmp_path / ".env"
+        path.write_text("A__B=1\nC=2\n")
+        sink = install_sink(RecordingSink())
+
+        EnvConfigLoader(FileConfigProvider(str(path)), DefaultEnvConfigProcessor(), ParsedConfigCache()).load()
+        Settings.load(JsonConfigLoader(FileConfigProvider("config.json")))
+
+        assert sink.span("config.process") == {"processor": "DefaultEnvConfigProcessor", "keys": 2}
+        assert sink.span("config.validate") == {"settings": "Settings", "mode": "json"}
+
+    def test_failed_stage_is_reported_with_its_error(self, tmp_path, install_sink):
+        path = tmp_path / "config.json"
+        path.write_text("{invalid")
+        sink = install_sink(RecordingSink())
+
+        with pytest.raises(ValueError):
+            JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=ParsedConfigCache()).load()
+
+        assert all(isinstance(error, ValueError) for name, _, error in sink.spans if name != "config.fetch")
+
+    def test_layered_load_is_reported_around_its_layers(self, install_sink):
+        sink = install_sink(RecordingSink())
+        layers = [YamlConfigLoaderArgs(file_path="config.yaml"), JsonConfigLoaderArgs(file_path="config.json")]
+
+        LayeredConfigLoader(layers, ConfigLoaderFactory.get_loader).load()
+
+        assert sink.started[0] == "config.load"
+        assert sink.spans[-1] == ("config.load", {"loader": "LayeredConfigLoader", "layers": 2}, None)
+        assert [name for name, _, _ in sink.spans].count("config.fetch") == 2
+
+    def test_payload_cache_lookups_are_events(self, tmp_path, install_sink):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        sink = install_sink(RecordingSink())
+        provider = CachingConfigProvider(FileConfigProvider(str(path)), ConfigPayloadCache(ttl_seconds=60))
+
+        provider.get_config()
+        provider.get_config()
+
+        assert [attributes["result"] for _, attributes in sink.events] == ["miss", "hit"]
+
+    def test_sink_failures_do_not_break_loads(self, tmp_path, install_sink):
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        install_sink(FailingSink())
+
+        assert JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=ParsedConfigCache()).load() == {"a": 1}
+
+    def test_logging_sink(self, tmp_path, install_sink, caplog):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        install_sink(LoggingInstrumentationSink(level=logging.INFO))
+
+        with caplog.at_level(logging.INFO, logger="ConfigInstrumentation"):
+            JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=ParsedConfigCache()).load()
+
+        finished = [record for record in caplog.records if "finished" in record.getMessage()]
+        assert [record.json_fields["span"] for record in finished] == ["config.fetch", "config.parse", "config.load"]
+        assert finished[0].json_fields["chars"] == 2
+
+    def test_open_telemetry_sink(self, tmp_path, install_sink):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        install_sink(OpenTelemetryInstrumentationSink(tracer_provider.get_tracer("test")))
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+
+        JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=ParsedConfigCache()).load()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["config.fetch"].parent.span_id == spans["config.load"].context.span_id
+        assert spans["config.parse"].parent.span_id == spans["config.load"].context.span_id
+        assert spans["config.fetch"].attributes["config.source"] == str(("file", str(path)))
+        assert spans["config.parse"].attributes["config.cache_hit"] is False
@@ -0,0 +1,46 @@
+import dataclasses
+
+import pytest
+
+from config_loaders import (
+    ConfigLoaderFactory,
+    GcpSecretJsonConfigLoaderArgs,
+    GcpSecretYamlConfigLoaderArgs,
+    GcpStorageEnvConfigLoaderArgs,
+    JsonConfigLoaderArgs,
+    LayeredConfigLoaderArgs,
+    YamlConfigLoaderArgs,
+)
+
+
+class TestConfigLoaderArgs:
+
+    def test_equal_arguments_hash_equally(self):
+        first = GcpStorageEnvConfigLoaderArgs(bucket_name="bucket", blob_name=".env", project_id="project")
+        second = GcpStorageEnvConfigLoaderArgs("bucket", ".env", "project")
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_same_fields_of_different_types_are_not_equal(self):
+        assert GcpSecretJsonConfigLoaderArgs("secret", "project") != GcpSecretYamlConfigLoaderArgs("secret", "project")
+
+    def test_arguments_are_immutable_and_slotted(self):
+        config_loader_args = JsonConfigLoaderArgs(file_path="config.json")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config_loader_args.file_path = "other.json"  # type: ignore[misc]
+        assert not hasattr(config_loader_args, "__dict__")
+        assert repr(config_loader_args) == "JsonConfigLoaderArgs(file_path='config.json', parser_backend=None)"
+
+    def test_layered_arguments_are_hashable(self):
+        layers = [YamlConfigLoaderArgs(file_path="config.yaml"), YamlConfigLoaderArgs(file_path="config.local.yaml")]
+
+        assert hash(LayeredConfigLoaderArgs(layers=layers)) == hash(LayeredConfigLoaderArgs(layers=tuple(layers)))
+
+    def test_equal_arguments_share_a_cached_loader(self):
+        first = ConfigLoaderFactory.get_loader(YamlConfigLoaderArgs(file_path="config.dev.yaml"), cached=True)
+        second = ConfigLoaderFactory.get_loader(YamlConfigLoaderArgs(file_path="config.dev.yaml"), cached=True)
+
+        assert first is second
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import pytest
+
+from config_loaders import (
+    AsyncCachingConfigProvider,
+    CachingConfigProvider,
+    ConfigLoaderArgs,
+    ConfigLoaderFactory,
+    ConfigLoaderFactoryRegistry,
+    ConfigPayloadCache,
+    FileConfigProvider,
+    GcpStorageJsonConfigLoaderArgs,
+    JsonConfigLoader,
+    JsonConfigLoaderArgs,
+    YamlConfigLoader,
+    YamlConfigLoaderArgs,
+)
+from config_loaders.config_providers.config_payload_cache import CachedPayload
+
+
+class LocalYamlConfigLoaderArgs(YamlConfigLoaderArgs):
+    pass
+
+
+class UnknownConfigLoaderArgs(ConfigLoaderArgs):
+    pass
+
+
+class TestConfigLoaderFactory:
+
+    def test_subclassed_arguments_resolve_through_mro(self):
+        loader = ConfigLoaderFactory.get_loader(LocalYamlConfigLoaderArgs(file_path="config.local.yaml"))
+
+        assert isinstance(loader, YamlConfigLoader)
+        assert loader.load()["airflow_core"]["airflow_uid"] == 1000
+
+    def test_unsupported_arguments_are_rejected(self):
+        with pytest.raises(ValueError):
+            ConfigLoaderFactory.get_loader(UnknownConfigLoaderArgs())
+
+    def test_cached_loaders_are_reused(self):
+        config_loader_args = JsonConfigLoaderArgs(file_path="config.json")
+
+        first = ConfigLoaderFactory.get_loader(config_loader_args, cached=True)
+        second = ConfigLoaderFactory.get_loader(config_loader_args, cached=True)
+        uncached = ConfigLoaderFactory.get_loader(config_loader_args)
+
+        assert first is second
+        assert uncached is not first
+
+    def test_payload_cache_serves_gcp_sources_without_a_request(self):
+        cache = ConfigPayloadCache(ttl_seconds=60)
+        config_loader_args = GcpStorageJsonConfigLoaderArgs(bucket_name="configs", blob_name="app.json", project_id="p")
+        ConfigLoaderFactory.set_payload_cache(cache)
+        try:
+            loader = ConfigLoaderFactory.get_loader(config_loader_args)
+            async_loader = ConfigLoaderFactory.get_async_loader(config_loader_args)
+            file_loader = ConfigLoaderFactory.get_loader(JsonConfigLoaderArgs(file_path="config.json"))
+        finally:
+            ConfigLoaderFactory.set_payload_cache(None)
+        cache.put(loader.config_provider.cache_key, CachedPayload(payload='{"a": 1}', version=1, checked_at=time.monotonic()))
+
+        assert isinstance(loader.config_provider, CachingConfigProvider)
+        assert isinstance(async_loader.config_provider, AsyncCachingConfigProvider)
+        assert isinstance(file_loader.config_provider, FileConfigProvider)
+        assert loader.load() == {"a": 1}
+        assert asyncio.run(async_loader.aload()) == {"a": 1}
+        assert cache.stats().hits == 2
+        assert not isinstance(ConfigLoaderFactory.get_loader(config_loader_args).config_provider, CachingConfigProvider)
+
+
+class TestConfigLoaderFactoryRegistry:
+
+    def test_registered_constructor_serves_subclasses(self):
+        registry = ConfigLoaderFactoryRegistry()
+        registry.register(YamlConfigLoaderArgs, lambda args: YamlConfigLoader(FileConfigProvider(args.file_path)))
+
+        loader = registry.get_loader(LocalYamlConfigLoaderArgs(file_path="config.yaml"))
+
+        assert isinstance(loader, YamlConfigLoader)
+
+    def test_registering_a_subclass_overrides_the_base_constructor(self):
+        registry = ConfigLoaderFactoryRegistry()
+        registry.register(YamlConfigLoaderArgs, lambda args: YamlConfigLoader(FileConfigProvider(args.file_path)))
+        config_loader_args = LocalYamlConfigLoaderArgs(file_path="config.yaml")
+        registry.get_loader(config_loader_args, cached=True)
+
+        registry.register(LocalYamlConfigLoaderArgs, lambda args: JsonConfigLoader(FileConfigProvider(args.file_path)))
+
+        assert isinstance(registry.get_loader(config_loader_args), JsonConfigLoader)
+        assert isinstance(registry.get_loader(config_loader_args, cached=True), JsonConfigLoader)
+
+    def test_unregistered_arguments_are_rejected(self):
+        with pytest.raises(ValueError):
+            ConfigLoaderFactoryRegistry().get_loader(UnknownConfigLoaderArgs())
@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from config_loaders import (
+    AsyncFileConfigProvider,
+    AsyncJsonConfigLoader,
+    FileConfigProvider,
+    JsonConfigLoader,
+)
+from schemas import Settings
+
+
+class TestConfigSettings:
+
+    @pytest.fixture
+    def expected(self):
+        return Settings.model_validate(JsonConfigLoader(FileConfigProvider("config.json")).load())
+
+    def test_raw_json_path_matches_dict_validation(self, expected):
+        assert Settings.load(JsonConfigLoader(FileConfigProvider("config.json"))) == expected
+        assert asyncio.run(Settings.aload(AsyncJsonConfigLoader(AsyncFileConfigProvider("config.json")))) == expected
+
+    def test_invalid_raw_json_is_rejected(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"project_env": "staging"}')
+
+        with pytest.raises(ValidationError):
+            Settings.load(JsonConfigLoader(FileConfigProvider(str(path))))
@@ -0,0 +1,50 @@
+import pytest
+
+from config_loaders import DefaultEnvConfigProcessor
+
+
+class TestDefaultEnvConfigProcessor:
+
+    @pytest.fixture
+    def processor(self):
+        return DefaultEnvConfigProcessor()
+
+    def test_nests_keys_and_decodes_json_values(self, processor):
+        flat_env = {
+            "PERSONAL_INFO__FIRST_NAME": "Ricardo",
+            "PERSONAL_INFO__AGE": "30",
+            "FEATURE_FLAGS__ENABLED": "true",
+            "FEATURE_FLAGS__SUBSETS": '["a", "b"]',
+            "DB__URL": "postgresql+psycopg2://airflow@postgres/airflow",
+            "OFFSET": " -3",
+            "EMPTY": "",
+            "NOT_A_STRING": 5,
+        }
+
+        assert processor.process(flat_env) == {
+            "personal_info": {"first_name": "Ricardo", "age": 30},
+            "feature_flags": {"enabled": True, "subsets": ["a", "b"]},
+            "db": {"url": "postgresql+psycopg2://airflow@postgres/airflow"},
+            "offset": -3,
+            "empty": "",
+            "not_a_string": 5,
+        }
+
+    def test_values_that_look_like_json_but_are_not_stay_strings(self, processor):
+        assert processor.process({"A": "{not json", "B": "1.2.3", "C": "nope"}) == {"a": "{not json", "b": "1.2.3", "c": "nope"}
+
+    def test_later_keys_override_leaves_and_decoded_objects(self, processor):
+        flat_env = {
+            "SECTION": '{"decoded": 1}',
+            "SECTION__NESTED": "2",
+            "LEAF": "x",
+            "LEAF__CHILD": "y",
+            "TREE__A": "1",
+            "TREE": "replaced",
+        }
+
+        assert processor.process(flat_env) == {
+            "section": {"nested": 2},
+            "leaf": {"child": "y"},
+            "tree": "replaced",
+        }
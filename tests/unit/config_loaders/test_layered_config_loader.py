@@ -0,0 +1,61 @@
+from config_loaders import (
+    ConfigLoaderFactory,
+    EnvConfigLoaderArgs,
+    JsonConfigLoaderArgs,
+    LayeredConfigLoader,
+    LayeredConfigLoaderArgs,
+    YamlConfigLoaderArgs,
+    deep_merge,
+)
+from schemas import Settings
+
+
+class TestDeepMerge:
+
+    def test_later_layers_override_leaves_and_keep_siblings(self):
+        merged = deep_merge(
+            [
+                {"a": {"b": 1, "c": 2}, "d": [1, 2]},
+                {"a": {"b": 10}, "d": [3]},
+                {"a": {"e": {"f": 5}}},
+            ]
+        )
+
+        assert merged.config == {"a": {"b": 10, "c": 2, "e": {"f": 5}}, "d": [3]}
+        assert merged.provenance == {
+            ("a", "b"): 1,
+            ("a", "c"): 0,
+            ("a", "e", "f"): 2,
+            ("d",): 1,
+        }
+
+    def test_unchanged_subtrees_are_not_copied(self):
+        untouched = {"x": 1}
+        added = {"y": 2}
+        merged = deep_merge([{"untouched": untouched}, {"added": added}])
+
+        assert merged.config["untouched"] is untouched
+        assert merged.config["added"] is added
+
+    def test_replaced_subtree_forgets_former_provenance(self):
+        merged = deep_merge([{"a": {"b": 1}}, {"a": {"b": 2}}, {"a": 3}, {"a": {"b": 4}}])
+
+        assert merged.config == {"a": {"b": 4}}
+        assert merged.provenance == {("a", "b"): 3}
+
+
+class TestLayeredConfigLoader:
+
+    def test_local_overrides_are_layered_on_top_of_defaults(self):
+        layers = [
+            YamlConfigLoaderArgs(file_path="config.yaml"),
+            JsonConfigLoaderArgs(file_path="config.dev.json"),
+            EnvConfigLoaderArgs(file_path=".env.local"),
+        ]
+        loader = ConfigLoaderFactory.get_loader(LayeredConfigLoaderArgs(layers=layers))
+        assert isinstance(loader, LayeredConfigLoader)
+
+        settings = Settings(**loader.load())
+
+        assert settings.airflow_core.airflow_uid == 1000
+        assert loader.source_of(("airflow_core", "airflow_uid")) is layers[2]
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from config_loaders import (
+    FileConfigProvider,
+    JsonConfigLoaderArgs,
+    LazySettings,
+    YamlConfigLoader,
+    inject_settings_from_json_file,
+    inject_settings_from_loader_args,
+)
+from schemas import Environment, FeatureFlagsSettings, Settings
+
+
+class TestLazySettings:
+
+    @pytest.fixture
+    def config_loader(self):
+        return YamlConfigLoader(FileConfigProvider("config.yaml"))
+
+    def test_sections_are_validated_on_first_access(self, config_loader):
+        expected = Settings.load(config_loader)
+        settings = Settings.load_lazy(config_loader)
+
+        assert isinstance(settings, LazySettings)
+        assert settings.feature_flags == expected.feature_flags
+        assert isinstance(settings.feature_flags, FeatureFlagsSettings)
+        assert settings.feature_flags is settings.feature_flags
+        assert settings.project_env is Environment(expected.project_env)
+        assert "feature_flags" in repr(settings) and "backend_db" not in repr(settings)
+        assert settings.validate_all() == expected
+
+    def test_invalid_section_only_fails_when_read(self, config_loader):
+        config = config_loader.load()
+        config["backend_db"]["load_default_connections"] = "not a boolean"
+        del config["airflow_core"]
+        settings = LazySettings(Settings, config)
+
+        assert settings.feature_flags.circuit_breaker_duration == config["feature_flags"]["circuit_breaker_duration"]
+        with pytest.raises(ValidationError):
+            settings.backend_db
+        with pytest.raises(ValidationError):
+            settings.airflow_core
+        with pytest.raises(ValidationError):
+            settings.validate_all()
+
+    def test_section_errors_are_located_like_model_validate(self, config_loader):
+        config = config_loader.load()
+        config["backend_db"]["load_default_connections"] = "not a boolean"
+
+        with pytest.raises(ValidationError) as lazy_error:
+            LazySettings(Settings, config).backend_db
+        with pytest.raises(ValidationError) as model_error:
+            Settings.model_validate(config)
+
+        assert lazy_error.value.errors(include_url=False) == model_error.value.errors(include_url=False)
+        assert lazy_error.value.title == "Settings"
+
+    def test_settings_are_read_only(self, config_loader):
+        settings = Settings.load_lazy(config_loader)
+
+        with pytest.raises(AttributeError):
+            settings.feature_flags = None
+        with pytest.raises(AttributeError):
+            settings.unknown_section
+
+    def test_injected_handler_only_validates_the_sections_it_reads(self, config_loader, tmp_path):
+        config = config_loader.load()
+        config["backend_db"]["load_default_connections"] = "not a boolean"
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(config))
+        injected = []
+
+        @inject_settings_from_json_file(file_path=str(path), lazy=True)
+        def handler(settings: LazySettings[Settings]) -> int:
+            injected.append(settings)
+            return settings.feature_flags.circuit_breaker_duration
+
+        @inject_settings_from_loader_args(JsonConfigLoaderArgs(file_path=str(path)), lazy=True)
+        async def async_handler(settings: Settings) -> int:
+            injected.append(settings)
+            return settings.feature_flags.circuit_breaker_duration
+
+        assert handler() == config["feature_flags"]["circuit_breaker_duration"]
+        assert asyncio.run(async_handler()) == config["feature_flags"]["circuit_breaker_duration"]
+        for settings in injected:
+            assert isinstance(settings, LazySettings)
+            assert "feature_flags" in repr(settings) and "backend_db" not in repr(settings)
+            with pytest.raises(ValidationError):
+                settings.backend_db
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+from config_loaders import (
+    DefaultEnvConfigProcessor,
+    EnvConfigLoader,
+    FileConfigProvider,
+    JsonConfigLoader,
+    ParsedConfigCache,
+    YamlConfigLoader,
+)
+
+
+class TestParsedConfigCache:
+
+    @pytest.fixture
+    def cache(self):
+        return ParsedConfigCache(max_entries=8)
+
+    def test_identical_payloads_are_parsed_once(self, tmp_path, cache):
+        path = tmp_path / "config.json"
+        path.write_text('{"feature_flags": {"circuit_breaker_duration": 11}}')
+        loader = JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=cache)
+
+        first = loader.load()
+        second = loader.load()
+
+        assert first == second == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert loader.metrics.loads == 2
+        assert loader.metrics.cache_hits == 1
+        assert loader.metrics.bytes_parsed == len(path.read_bytes())
+
+    def test_callers_cannot_corrupt_the_cache(self, tmp_path, cache):
+        path = tmp_path / "config.yaml"
+        path.write_text("feature_flags:\n  circuit_breaker_duration: 11\n  subsets: [a, b]\n")
+        loader = YamlConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=cache)
+
+        first = loader.load()
+        first["feature_flags"]["circuit_breaker_duration"] = -1
+        first["feature_flags"]["subsets"].append("c")
+
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11, "subsets": ["a", "b"]}}
+
+    def test_same_payload_is_cached_per_format(self, tmp_path, cache):
+        path = tmp_path / "config"
+        path.write_text('{"a": 1}')
+        provider = FileConfigProvider(str(path))
+
+        JsonConfigLoader(provider, parsed_config_cache=cache).load()
+        yaml_loader = YamlConfigLoader(provider, parsed_config_cache=cache)
+        yaml_loader.load()
+
+        assert yaml_loader.metrics.cache_hits == 0
+
+    def test_env_payload_is_processed_once(self, tmp_path, cache):
+        path = tmp_path / ".env"
+        path.write_text("FEATURE_FLAGS__CIRCUIT_BREAKER_DURATION=11\n")
+        loader = EnvConfigLoader(FileConfigProvider(str(path)), DefaultEnvConfigProcessor(), parsed_config_cache=cache)
+
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert loader.metrics.cache_hits == 1
+
+    def test_concurrent_loads_are_all_counted(self, tmp_path, cache):
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        loader = JsonConfigLoader(FileConfigProvider(str(path)), parsed_config_cache=cache)
+        loader.load()
+
+        def worker():
+            for _ in range(500):
+                loader.load()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loader.metrics.loads == 4_001
+        assert loader.metrics.cache_hits == 4_000
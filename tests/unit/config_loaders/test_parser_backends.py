@@ -0,0 +1,88 @@
+import glob
+import json
+
+import pytest
+import yaml
+
+from config_loaders import (
+    FileConfigProvider,
+    JsonConfigLoader,
+    ParserBackendRegistry,
+    PyYamlParserBackend,
+    StdlibJsonParserBackend,
+    YamlConfigLoader,
+)
+
+JSON_DOCUMENTS = [
+    '{"a": 1, "b": 1.0, "c": true, "d": null, "e": [], "f": {}}',
+    '{"big": 123456789012345678901234567890, "negative": -9223372036854775809}',
+    '{"nan": NaN, "inf": Infinity, "-inf": -Infinity}',
+    '{"float": 0.1, "exp": 1e400, "small": 5e-324, "precise": 1.7976931348623157e308}',
+    '{"unicode": "caf\\u00e9 \\ud83d\\ude00", "raw": "ğüşöç", "escapes": "\\n\\t\\"\\\\/"}',
+    '{"duplicate": 1, "duplicate": 2}',
+    '  [1, "two", [3, {"four": 4}]]  ',
+    '"just a string"',
+]
+INVALID_JSON_DOCUMENTS = ['{"a": 1,}', "{'a': 1}", '{"a": tru}', '{"a": "\\ud800"', ""]
+
+YAML_DOCUMENTS = [
+    "a: 1\nb: 1.0\nc: yes\nd: ~\ne: []\nf: {}\n",
+    "base: &base\n  host: localhost\n  port: 5432\nprod:\n  <<: *base\n  host: db\n",
+    "date: 2024-01-31\ntimestamp: 2024-01-31T10:00:00Z\noctal: 0o17\nhex: 0x1F\ninf: .inf\n",
+    "folded: >\n  one\n  two\nliteral: |\n  one\n  two\nquoted: 'it''s'\n",
+    "list:\n  - a\n  - {b: [1, 2]}\nunicode: café\n",
+]
+INVALID_YAML_DOCUMENTS = ["a: [1, 2", "a: b: c", "key: *undefined", "!!python/object:os.system {}"]
+
+CONFIG_FILES = sorted(glob.glob("config*.json") + glob.glob("config*.yaml"))
+
+
+def backends(format):
+    return [ParserBackendRegistry.get(format, name) for name in ParserBackendRegistry.available(format)]
+
+
+class TestParserBackendConformance:
+
+    @pytest.mark.parametrize("backend", backends("json"), ids=lambda backend: backend.name)
+    @pytest.mark.parametrize("document", JSON_DOCUMENTS + [open(path).read() for path in CONFIG_FILES if path.endswith(".json")])
+    def test_json_backends_match_the_standard_library(self, backend, document):
+        assert repr(backend.parse(document)) == repr(StdlibJsonParserBackend().parse(document))
+
+    @pytest.mark.parametrize("backend", backends("json"), ids=lambda backend: backend.name)
+    @pytest.mark.parametrize("document", INVALID_JSON_DOCUMENTS)
+    def test_json_backends_raise_json_decode_error(self, backend, document):
+        with pytest.raises(json.JSONDecodeError):
+            backend.parse(document)
+
+    @pytest.mark.parametrize("backend", backends("yaml"), ids=lambda backend: backend.name)
+    @pytest.mark.parametrize("document", YAML_DOCUMENTS + [open(path).read() for path in CONFIG_FILES if path.endswith(".yaml")])
+    def test_yaml_backends_match_the_safe_loader(self, backend, document):
+        assert repr(backend.parse(document)) == repr(PyYamlParserBackend().parse(document))
+
+    @pytest.mark.parametrize("backend", backends("yaml"), ids=lambda backend: backend.name)
+    @pytest.mark.parametrize("document", INVALID_YAML_DOCUMENTS)
+    def test_yaml_backends_raise_yaml_error(self, backend, document):
+        with pytest.raises(yaml.YAMLError):
+            backend.parse(document)
+
+
+class TestParserBackendSelection:
+
+    def test_loader_uses_the_selected_backend(self):
+        loader = JsonConfigLoader(FileConfigProvider("config.json"), parser_backend="stdlib")
+
+        assert isinstance(loader.parser_backend, StdlibJsonParserBackend)
+        assert loader.load() == json.loads(open("config.json").read())
+
+    def test_global_default_applies_to_loaders_without_a_selection(self):
+        loader = YamlConfigLoader(FileConfigProvider("config.yaml"))
+        ParserBackendRegistry.set_default("yaml", "pyyaml")
+        try:
+            assert ParserBackendRegistry.get("yaml").name == "pyyaml"
+            assert loader.load() == yaml.safe_load(open("config.yaml").read())
+        finally:
+            ParserBackendRegistry.set_default("yaml", None)
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            JsonConfigLoader(FileConfigProvider("config.json"), parser_backend="simdjson")
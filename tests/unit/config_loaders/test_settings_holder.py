@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config_loaders import SettingsHolder, inject_settings
+
+
+class SlowLoader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        with self.lock:
+            self.calls += 1
+            result = self.results.pop(0)
+        time.sleep(0.05)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def aload(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return self.results.pop(0)
+
+
+class TestSettingsHolder:
+
+    def test_concurrent_first_calls_share_one_load(self):
+        loader = SlowLoader("settings")
+
+        @inject_settings(loader_func=loader, source="a")
+        def handler(settings: str) -> str:
+            return settings
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: handler(), range(8)))
+
+        assert results == ["settings"] * 8
+        assert loader.calls == 1
+
+    def test_functions_with_the_same_loader_args_share_the_settings(self):
+        loader = SlowLoader("shared", "other")
+
+        @inject_settings(loader_func=loader, source="a")
+        def first(settings: str) -> str:
+            return settings
+
+        @inject_settings(loader_func=loader, source="a")
+        def second(settings: str) -> str:
+            return settings
+
+        @inject_settings(loader_func=loader, source="b")
+        def third(settings: str) -> str:
+            return settings
+
+        assert (first(), second(), third()) == ("shared", "shared", "other")
+        assert loader.calls == 2
+
+    def test_failed_load_is_retried_after_the_retry_delay(self):
+        loader = SlowLoader(ValueError("unreachable"), "settings")
+        holder = SettingsHolder(loader, retry_after=0.2)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(holder.get) for _ in range(4)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+        assert loader.calls == 1
+
+        time.sleep(0.2)
+        assert holder.get() == "settings"
+        assert loader.calls == 2
+
+    def test_concurrent_coroutines_share_one_load(self):
+        loader = SlowLoader("settings")
+        holder = SettingsHolder(loader)
+
+        async def main():
+            return await asyncio.gather(*(holder.aget(loader.aload) for _ in range(8)))
+
+        assert asyncio.run(main()) == ["settings"] * 8
+        assert loader.calls == 1
+
+    def test_threads_and_event_loops_share_one_load(self):
+        loader = SlowLoader("settings")
+        holder = SettingsHolder(loader)
+
+        async def aget():
+            return await holder.aget(loader.aload)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(asyncio.run, aget()), executor.submit(asyncio.run, aget())]
+            futures += [executor.submit(holder.get) for _ in range(2)]
+
+        assert [future.result() for future in futures] == ["settings"] * 4
+        assert loader.calls == 1
+
+    def test_blocking_get_on_the_loop_running_the_load_does_not_deadlock(self):
+        loader = SlowLoader("first", "second")
+        holder = SettingsHolder(loader)
+
+        async def main():
+            flight = asyncio.create_task(holder.aget(loader.aload))
+            await asyncio.sleep(0.01)
+            return holder.get(), await flight
+
+        from_get, from_aget = asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+        assert from_get == from_aget == holder.get()
+        assert loader.calls == 2
+
+    def test_expired_settings_are_served_while_refreshing_in_the_background(self):
+        loader = SlowLoader("first", ValueError("unreachable"), "second")
+        refreshes = []
+        holder = SettingsHolder(loader, retry_after=0.05, ttl=0.05, on_refresh=lambda duration, error: refreshes.append(error))
+
+        assert holder.get() == "first"
+        time.sleep(0.06)
+        assert [holder.get() for _ in range(5)] == ["first"] * 5
+        holder.wait_for_refresh()
+        assert holder.get() == "first"
+        assert isinstance(refreshes[0], ValueError)
+
+        time.sleep(0.06)
+        assert holder.get() == "first"
+        holder.wait_for_refresh()
+        assert holder.get() == "second"
+        assert refreshes[1] is None
+        assert loader.calls == 3
+
+    def test_slow_refresh_does_not_overwrite_a_later_reload(self):
+        results = iter([("first", 0.0), ("refreshed before the change", 0.3), ("reloaded after the change", 0.0)])
+
+        def load():
+            value, delay = next(results)
+            time.sleep(delay)
+            return value
+
+        holder = SettingsHolder(load, ttl=0.05, ttl_jitter=0)
+        assert holder.get() == "first"
+        time.sleep(0.06)
+        assert holder.get() == "first"
+        time.sleep(0.05)
+
+        assert holder.reload() is True
+        holder.wait_for_refresh()
+        assert holder.get() == "reloaded after the change"
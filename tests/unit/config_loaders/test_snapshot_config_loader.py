@@ -0,0 +1,142 @@
+import os
+
+import pytest
+
+from config_loaders import (
+    ConfigLoaderFactory,
+    ConfigSnapshotStore,
+    FileConfigProvider,
+    GcpStorageJsonConfigLoaderArgs,
+    JsonConfigLoader,
+    JsonConfigLoaderArgs,
+    ParsedConfigCache,
+    SnapshotConfigLoader,
+)
+
+
+class CountingFileConfigProvider(FileConfigProvider):
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.fetches = 0
+        self.available = True
+
+    def get_config(self) -> str:
+        if not self.available:
+            raise ConnectionError("source unreachable")
+        self.fetches += 1
+        return super().get_config()
+
+
+def touch(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSnapshotConfigLoader:
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"feature_flags": {"circuit_breaker_duration": 11}}')
+        return path
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ConfigSnapshotStore(str(tmp_path / "snapshots"))
+
+    def cold_start(self, config_file, store):
+        provider = CountingFileConfigProvider(str(config_file))
+        loader = SnapshotConfigLoader(JsonConfigLoader(provider, parsed_config_cache=ParsedConfigCache()), store)
+        return provider, loader
+
+    def test_cold_start_is_served_from_the_snapshot(self, config_file, store):
+        _, first_loader = self.cold_start(config_file, store)
+        assert first_loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+
+        provider, loader = self.cold_start(config_file, store)
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        loader.wait_for_revalidation()
+
+        assert provider.fetches == 0
+
+    def test_changed_source_refreshes_the_snapshot_in_the_background(self, config_file, store):
+        self.cold_start(config_file, store)[1].load()
+        touch(config_file, '{"feature_flags": {"circuit_breaker_duration": 42}}')
+
+        provider, loader = self.cold_start(config_file, store)
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        loader.wait_for_revalidation()
+
+        assert provider.fetches == 1
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 42}}
+        assert store.load(loader.snapshot_key).config == {"feature_flags": {"circuit_breaker_duration": 42}}
+
+    def test_reload_after_a_change_returns_the_new_configuration(self, config_file, store):
+        provider, loader = self.cold_start(config_file, store)
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert provider.fetches == 1
+
+        touch(config_file, '{"feature_flags": {"circuit_breaker_duration": 42}}')
+
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 42}}
+        assert provider.fetches == 2
+        assert store.load(loader.snapshot_key).config == {"feature_flags": {"circuit_breaker_duration": 42}}
+
+    def test_unreachable_source_keeps_the_snapshot(self, config_file, store):
+        self.cold_start(config_file, store)[1].load()
+        touch(config_file, '{"feature_flags": {"circuit_breaker_duration": 42}}')
+
+        provider, loader = self.cold_start(config_file, store)
+        provider.available = False
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert loader.revalidate() is False
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+
+    def test_corrupted_snapshot_is_discarded(self, config_file, store):
+        loader = self.cold_start(config_file, store)[1]
+        loader.load()
+        path = store.path_for(loader.snapshot_key)
+        data = bytearray(open(path, "rb").read())
+        data[-1] ^= 0xFF
+        open(path, "wb").write(bytes(data))
+
+        assert store.load(loader.snapshot_key) is None
+        assert not os.path.exists(path)
+
+        provider, loader = self.cold_start(config_file, store)
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert provider.fetches == 1
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires POSIX permissions")
+    def test_directory_accessible_to_others_is_refused(self, config_file, tmp_path):
+        directory = tmp_path / "shared"
+        directory.mkdir(mode=0o777)
+        directory.chmod(0o777)
+        store = ConfigSnapshotStore(str(directory))
+
+        provider, loader = self.cold_start(config_file, store)
+        assert loader.load() == {"feature_flags": {"circuit_breaker_duration": 11}}
+        assert os.listdir(directory) == []
+        with pytest.raises(PermissionError):
+            store.save("key", "{}", None, {})
+
+    def test_snapshot_signed_with_another_key_is_discarded(self, config_file, tmp_path):
+        directory = str(tmp_path / "snapshots")
+        loader = self.cold_start(config_file, ConfigSnapshotStore(directory, secret_key="deployment-key"))[1]
+        loader.load()
+
+        assert ConfigSnapshotStore(directory, secret_key="deployment-key").load(loader.snapshot_key) is not None
+        assert ConfigSnapshotStore(directory, secret_key="attacker-key").load(loader.snapshot_key) is None
+
+    def test_factory_wraps_remote_sources_once_enabled(self, store):
+        ConfigLoaderFactory.set_snapshot_store(store)
+        try:
+            remote_loader = ConfigLoaderFactory.get_loader(GcpStorageJsonConfigLoaderArgs("bucket", "config.json", "project"))
+            local_loader = ConfigLoaderFactory.get_loader(JsonConfigLoaderArgs("config.json"))
+        finally:
+            ConfigLoaderFactory.set_snapshot_store(None)
+
+        assert isinstance(remote_loader, SnapshotConfigLoader)
+        assert isinstance(local_loader, JsonConfigLoader)
@@ -0,0 +1,95 @@
+import os
+import threading
+
+import pytest
+
+from config_loaders import CachingConfigProvider, ConfigPayloadCache, FileConfigProvider
+
+
+class CountingFileConfigProvider(FileConfigProvider):
+    def __init__(self, file_path: str):
+        super().__init__(file_path=file_path)
+        self.fetches = 0
+
+    def get_config(self) -> str:
+        self.fetches += 1
+        return super().get_config()
+
+
+class TestCachingConfigProvider:
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("project_env: dev\n")
+        return path
+
+    def test_fresh_entry_is_served_without_fetching(self, config_file):
+        provider = CountingFileConfigProvider(str(config_file))
+        caching_provider = CachingConfigProvider(provider, cache=ConfigPayloadCache(ttl_seconds=60))
+
+        assert caching_provider.get_config() == "project_env: dev\n"
+        assert caching_provider.get_config() == "project_env: dev\n"
+        assert provider.fetches == 1
+        assert caching_provider.cache.stats().hits == 1
+
+    def test_expired_entry_is_revalidated_when_unchanged(self, config_file):
+        provider = CountingFileConfigProvider(str(config_file))
+        caching_provider = CachingConfigProvider(provider, cache=ConfigPayloadCache(ttl_seconds=0))
+
+        caching_provider.get_config()
+        caching_provider.get_config()
+
+        assert provider.fetches == 1
+        assert caching_provider.cache.stats().revalidations == 1
+
+    def test_expired_entry_is_refetched_when_changed(self, config_file):
+        provider = CountingFileConfigProvider(str(config_file))
+        caching_provider = CachingConfigProvider(provider, cache=ConfigPayloadCache(ttl_seconds=0))
+
+        caching_provider.get_config()
+        config_file.write_text("project_env: uat\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert caching_provider.get_config() == "project_env: uat\n"
+        assert provider.fetches == 2
+
+    def test_shared_cache_is_keyed_by_source(self, config_file):
+        cache = ConfigPayloadCache(ttl_seconds=60)
+        first = CountingFileConfigProvider(str(config_file))
+        second = CountingFileConfigProvider(str(config_file))
+
+        CachingConfigProvider(first, cache=cache).get_config()
+        CachingConfigProvider(second, cache=cache).get_config()
+
+        assert first.fetches == 1
+        assert second.fetches == 0
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        cache = ConfigPayloadCache(ttl_seconds=60, max_entries=2)
+        for name in ("a.json", "b.json", "c.json"):
+            path = tmp_path / name
+            path.write_text("{}")
+            CachingConfigProvider(FileConfigProvider(str(path)), cache=cache).get_config()
+
+        stats = cache.stats()
+        assert stats.size == 2
+        assert stats.evictions == 1
+        assert cache.get(("file", str(tmp_path / "a.json"))) is None
+
+    def test_concurrent_hits_are_all_counted(self, config_file):
+        caching_provider = CachingConfigProvider(FileConfigProvider(str(config_file)), cache=ConfigPayloadCache(ttl_seconds=60))
+        caching_provider.get_config()
+
+        def worker():
+            for _ in range(2_000):
+                caching_provider.get_config()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert caching_provider.cache.stats().hits == 16_000
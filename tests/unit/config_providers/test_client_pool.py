@@ -0,0 +1,94 @@
+import os
+import threading
+
+import pytest
+
+from config_loaders import ClientPool
+
+
+class TestClientPool:
+
+    def test_client_is_created_once_per_key(self):
+        pool = ClientPool("test")
+        created = []
+
+        def factory():
+            created.append(object())
+            return created[-1]
+
+        first = pool.get("project-a", factory)
+        second = pool.get("project-a", factory)
+        other = pool.get("project-b", factory)
+
+        assert first is second
+        assert other is not first
+        assert len(created) == 2
+
+        stats = pool.stats()
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.size == 2
+
+    def test_concurrent_first_calls_share_one_client(self):
+        pool = ClientPool("test")
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(pool.get("key", object))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(client) for client in results}) == 1
+        assert pool.stats().misses == 1
+        assert pool.stats().hits == 7
+
+    def test_concurrent_hits_are_all_counted(self):
+        pool = ClientPool("test")
+        pool.get("key", object)
+
+        def worker():
+            for _ in range(5_000):
+                pool.get("key", object)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pool.stats().hits == 40_000
+
+    def test_failed_creation_is_not_cached(self):
+        pool = ClientPool("test")
+
+        def failing_factory():
+            raise RuntimeError("no credentials")
+
+        with pytest.raises(RuntimeError):
+            pool.get("key", failing_factory)
+
+        assert pool.get("key", lambda: "client") == "client"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_clients_are_recreated_after_fork(self):
+        pool = ClientPool("test")
+        parent_client = pool.get("key", object)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            child_client = pool.get("key", object)
+            os.write(write_fd, b"1" if child_client is not parent_client else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        assert os.read(read_fd, 1) == b"1"
+        os.close(read_fd)
@@ -0,0 +1,82 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config_loaders import JsonConfigLoader, ParsedConfigCache, RemoteChangePoller
+from config_loaders.testing import FakeGcpServer, FaultInjection
+
+
+@pytest.fixture
+def server():
+    with FakeGcpServer() as server:
+        yield server
+
+
+class TestFakeGcpServer:
+    def test_storage_provider_reads_objects_and_versions(self, server):
+        generation = server.put_object("configs", "app.json", '{"name": "app"}')
+        provider = server.storage_provider("configs", "app.json")
+
+        assert provider.get_config() == '{"name": "app"}'
+        assert provider.get_version()[0] == generation
+
+        server.put_object("configs", "app.json", '{"name": "app", "debug": true}')
+        assert provider.get_version()[0] == generation + 1
+        assert server.storage_provider("configs", "missing.json").get_config() is None
+
+    def test_loader_reads_secret_versions(self, server):
+        server.add_secret_version("test-project", "app-config", '{"name": "first"}')
+        server.add_secret_version("test-project", "app-config", '{"name": "second"}')
+        provider = server.secret_provider("app-config")
+
+        assert JsonConfigLoader(provider, ParsedConfigCache()).load() == {"name": "second"}
+        assert provider.get_version() == "projects/test-project/secrets/app-config/versions/2"
+
+    def test_poller_lists_a_folder_with_the_real_client(self, server):
+        server.put_object("configs", "dev/a.json", "{}")
+        server.put_object("configs", "dev/b.json", "{}")
+        server.put_object("configs", "dev/nested/c.json", "{}")
+        providers = [server.storage_provider("configs", f"dev/{name}.json") for name in ("a", "b")]
+
+        versions = RemoteChangePoller(60).fetch_versions(providers)
+
+        assert [provider.cache_key in versions for provider in providers] == [True, True]
+        assert server.request_counts["storage.list"] == 1
+        assert server.request_counts["storage.get"] == 0
+
+    def test_injects_latency(self):
+        with FakeGcpServer(FaultInjection(latency_ms=50)) as server:
+            server.put_object("configs", "app.json", "{}")
+            provider = server.storage_provider("configs", "app.json")
+            provider.get_config()
+
+            start = time.perf_counter()
+            provider.get_config()
+            assert time.perf_counter() - start >= 0.05
+
+    def test_injected_errors_are_reported_as_missing_config(self):
+        with FakeGcpServer(FaultInjection(error_rate=1.0, error_status=403)) as server:
+            server.put_object("configs", "app.json", "{}")
+
+            assert server.storage_provider("configs", "app.json").get_config() is None
+            assert server.request_counts["failed"] == 1
+
+    def test_throttled_requests_are_retried_by_the_client(self):
+        with FakeGcpServer(FaultInjection(max_requests_per_second=2)) as server:
+            server.put_object("configs", "app.json", "{}")
+            provider = server.storage_provider("configs", "app.json")
+
+            versions = [provider.get_version() for _ in range(4)]
+
+            assert None not in versions
+            assert server.request_counts["throttled"] >= 1
+
+    def test_concurrent_requests_are_all_counted(self, server):
+        server.put_object("configs", "app.json", "{}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(2000):
+                executor.submit(server.handle, "/storage/v1/b/configs/o/app.json", {})
+
+        assert server.request_counts["storage.get"] == 2000
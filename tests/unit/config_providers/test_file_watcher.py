@@ -0,0 +1,135 @@
+import shutil
+import time
+
+import pytest
+
+from config_loaders import ConfigLoader, FileWatcher, SettingsHolder, inject_settings_from_json_file
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class FeatureFlags:
+    def __init__(self, circuit_breaker_duration: int):
+        self.circuit_breaker_duration = circuit_breaker_duration
+
+    @classmethod
+    def load(cls, config_loader: ConfigLoader) -> "FeatureFlags":
+        return cls(**config_loader.load())
+
+
+class TestFileWatcher:
+
+    @pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+    def watcher(self, request):
+        watcher = FileWatcher(debounce_seconds=0.1, poll_interval=0.05, use_inotify=request.param)
+        yield watcher
+        watcher.stop()
+
+    def test_burst_of_writes_is_reported_once(self, tmp_path, watcher):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        changes = []
+        watcher.watch(str(path), changes.append)
+
+        for index in range(5):
+            path.write_text(f'{{"version": {index}}}')
+            time.sleep(0.01)
+
+        assert wait_for(lambda: changes)
+        time.sleep(0.3)
+        assert changes == [str(path)]
+
+    def test_atomic_replace_and_directory_patterns(self, tmp_path, watcher):
+        (tmp_path / "config.yaml").write_text("a: 1")
+        changes = []
+        watcher.watch(str(tmp_path), changes.append)
+
+        replacement = tmp_path / "config.yaml.tmp"
+        replacement.write_text("a: 2")
+        replacement.replace(tmp_path / "config.yaml")
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        assert wait_for(lambda: str(tmp_path / "config.yaml") in changes)
+        time.sleep(0.3)
+        assert str(tmp_path / "notes.txt") not in changes
+
+    def test_changes_lost_in_a_queue_overflow_are_found_by_polling(self, tmp_path, monkeypatch):
+        watcher = FileWatcher(debounce_seconds=0.05, poll_interval=0.05, use_inotify=True)
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        changes = []
+        watcher.watch(str(path), changes.append)
+        if not watcher.uses_inotify:
+            watcher.stop()
+            pytest.skip("inotify is unavailable")
+        inotify = watcher._inotify
+        read_changes = inotify.read_changes
+        # Drop the events, as the kernel does when its queue overflows
+        monkeypatch.setattr(inotify, "read_changes", lambda timeout: (set(), bool(read_changes(timeout)[0])))
+
+        try:
+            path.write_text('{"version": 2}')
+            assert wait_for(lambda: changes == [str(path)])
+        finally:
+            watcher.stop()
+
+    def test_watched_directory_removed_and_recreated(self, tmp_path, watcher):
+        directory = tmp_path / "configs"
+        directory.mkdir()
+        path = directory / "config.json"
+        path.write_text("{}")
+        changes = []
+        watcher.watch(str(path), changes.append)
+
+        shutil.rmtree(directory)
+        assert wait_for(lambda: changes == [str(path)])
+        directory.mkdir()
+        path.write_text('{"version": 2}')
+
+        assert wait_for(lambda: changes == [str(path), str(path)])
+        if watcher.uses_inotify:
+            assert wait_for(lambda: str(directory) in watcher._inotify.directories)
+
+
+class TestSettingsReload:
+
+    def test_failed_reload_keeps_previous_settings(self):
+        values = iter([1, ValueError("invalid"), 3])
+
+        def load():
+            value = next(values)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        holder = SettingsHolder(load)
+        assert holder.reload() is False
+        assert holder.get() == 1
+        assert holder.reload() is False
+        assert holder.get() == 1
+        assert holder.reload() is True
+        assert holder.get() == 3
+
+    def test_injected_settings_are_swapped_when_the_file_changes(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        path.write_text('{"circuit_breaker_duration": 11}')
+        watcher = FileWatcher(debounce_seconds=0.05, poll_interval=0.05)
+        monkeypatch.setattr(FileWatcher, "_default_instance", watcher)
+
+        @inject_settings_from_json_file(file_path=str(path), watch=True)
+        def handler(settings: FeatureFlags) -> int:
+            return settings.circuit_breaker_duration
+
+        try:
+            assert handler() == 11
+            path.write_text('{"circuit_breaker_duration": 42}')
+            assert wait_for(lambda: handler() == 42)
+        finally:
+            watcher.stop()
@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from config_loaders import (
+    ClientPool,
+    ConfigLoader,
+    GcpStorageConfigProvider,
+    JsonConfigLoaderArgs,
+    RemoteChangePoller,
+    inject_settings_from_loader_args,
+)
+
+
+class FakeBucket:
+    def __init__(self, generations: dict[str, int]):
+        self.generations = generations
+        self.list_calls = []
+
+    def list_blobs(self, **kwargs):
+        self.list_calls.append(kwargs)
+        prefix = kwargs["prefix"]
+        return [
+            SimpleNamespace(name=name, generation=generation, etag=f"etag-{generation}")
+            for name, generation in self.generations.items()
+            if name.startswith(prefix) and "/" not in name[len(prefix) :]
+        ]
+
+
+def storage_provider(bucket: FakeBucket, blob_name: str) -> GcpStorageConfigProvider:
+    bucket_pool = ClientPool("test-buckets")
+    bucket_pool.get(("project", None, "configs-bucket"), lambda: bucket)
+    return GcpStorageConfigProvider("configs-bucket", blob_name, "project", bucket_pool=bucket_pool)
+
+
+class FeatureFlags:
+    def __init__(self, circuit_breaker_duration: int):
+        self.circuit_breaker_duration = circuit_breaker_duration
+
+    @classmethod
+    def load(cls, config_loader: ConfigLoader) -> "FeatureFlags":
+        return cls(**config_loader.load())
+
+
+class TestRemoteChangePoller:
+
+    def test_blobs_under_one_prefix_are_checked_with_a_single_listing(self):
+        bucket = FakeBucket({"app/config.yaml": 1, "app/config.json": 1, "app/.env": 1, "app/other/config.yaml": 1})
+        poller = RemoteChangePoller()
+        changes = []
+        for blob_name in ("app/config.yaml", "app/config.json", "app/.env"):
+            poller.watch(storage_provider(bucket, blob_name), changes.append)
+        poller.stop()
+
+        assert poller.check_now() == []
+        listings = len(bucket.list_calls)
+        bucket.generations["app/config.json"] = 2
+        changed = poller.check_now()
+
+        assert [provider.blob_name for provider in changed] == ["app/config.json"]
+        assert changes == changed
+        assert len(bucket.list_calls) == listings + 1
+        assert bucket.list_calls[-1]["prefix"] == "app/"
+
+    def test_unreachable_source_does_not_trigger_a_reload(self):
+        bucket = FakeBucket({"app/config.yaml": 1, "app/config.json": 1})
+        poller = RemoteChangePoller()
+        changes = []
+        poller.watch(storage_provider(bucket, "app/config.yaml"), changes.append)
+        poller.watch(storage_provider(bucket, "app/config.json"), changes.append)
+        poller.stop()
+        poller.check_now()
+
+        bucket.list_blobs = lambda **kwargs: (_ for _ in ()).throw(ConnectionError("unreachable"))
+        assert poller.check_now() == []
+        assert changes == []
+
+    def test_injected_settings_are_reloaded_when_the_source_changes(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        path.write_text('{"circuit_breaker_duration": 11}')
+        poller = RemoteChangePoller(interval_seconds=0.05)
+        monkeypatch.setattr(RemoteChangePoller, "_default_instance", poller)
+
+        @inject_settings_from_loader_args(JsonConfigLoaderArgs(file_path=str(path)), watch=True)
+        def handler(settings: FeatureFlags) -> int:
+            return settings.circuit_breaker_duration
+
+        try:
+            assert handler() == 11
+            assert poller.wait_until_tracked(5)
+            path.write_text('{"circuit_breaker_duration": 42}')
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            deadline = time.monotonic() + 5
+            while handler() != 42 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert handler() == 42
+        finally:
+            poller.stop()
+
+    def test_watch_makes_no_request(self):
+        bucket = FakeBucket({"app/config.yaml": 1})
+        provider = storage_provider(bucket, "app/config.yaml")
+        fetched = []
+        provider.get_version = lambda: fetched.append(threading.current_thread().name) or (1, "etag-1")
+        poller = RemoteChangePoller(interval_seconds=60)
+
+        try:
+            poller.watch(provider, lambda changed: None)
+            assert fetched in ([], ["config-change-poller"])
+            assert poller.wait_until_tracked(5)
+        finally:
+            poller.stop()
+
+        assert fetched == ["config-change-poller"]
@@ -0,0 +1,77 @@
+import pytest
+from flask import Flask, request
+from pydantic import BaseModel, ValidationError
+
+from decorators import inject_typed_request
+from schemas import GreetingRequest, GreetingResponse
+
+app = Flask(__name__)
+
+
+class TokenRequest(BaseModel):
+    name: str
+    x_custom_token: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TokenRequest":
+        return cls.model_validate(data)
+
+
+class TestInjectTypedRequest:
+
+    def test_request_is_bound_to_the_annotated_model(self):
+        @inject_typed_request()
+        def say_hello(req: GreetingRequest) -> GreetingResponse:
+            return GreetingResponse(message=f"Hello, {req.first_name} {req.last_name}")
+
+        with app.test_request_context(json={"first_name": "Ada", "last_name": "Byron"}, query_string={"last_name": "Lovelace"}):
+            assert say_hello(request) == {"message": "Hello, Ada Lovelace"}
+
+    def test_only_allowed_headers_are_injected(self):
+        @inject_typed_request()
+        def handler(req: TokenRequest) -> TokenRequest:
+            return req
+
+        headers = {"X-Custom-Token": "secret", "X-Other": "ignored"}
+        with app.test_request_context(json={"name": "a"}, headers=headers):
+            assert handler(request) == TokenRequest(name="a", x_custom_token="secret")
+
+    def test_unusable_signatures_are_rejected_when_decorating(self):
+        with pytest.raises(TypeError):
+
+            @inject_typed_request()
+            def unannotated(req): ...
+
+        with pytest.raises(AttributeError):
+
+            @inject_typed_request()
+            def without_from_dict(req: int): ...
+
+    def test_raw_body_is_validated_directly_and_merges_declared_query_params(self):
+        @inject_typed_request(raw_body=True)
+        def handler(req: GreetingRequest) -> GreetingRequest:
+            return req
+
+        body = '{"first_name": "Ada", "last_name": "Byron", "unused": [1, 2, 3]}'
+        with app.test_request_context(data=body, query_string={"unknown": "x"}):
+            assert handler(request) == GreetingRequest(first_name="Ada", last_name="Byron")
+        with app.test_request_context(data=body, query_string={"last_name": "Lovelace"}):
+            assert handler(request) == GreetingRequest(first_name="Ada", last_name="Lovelace")
+        with app.test_request_context(data="{not json"):
+            with pytest.raises(ValidationError):
+                handler(request)
+
+    @pytest.mark.parametrize("body", ["{not json", "[1, 2]", '"Ada"', "null"])
+    def test_raw_body_that_is_not_an_object_raises_the_same_validation_error_with_or_without_merged_values(self, body):
+        @inject_typed_request(raw_body=True)
+        def handler(req: TokenRequest) -> TokenRequest:
+            return req
+
+        errors = []
+        for query_string, headers in [({}, {}), ({"name": "Ada"}, {}), ({}, {"X-Custom-Token": "secret"})]:
+            with app.test_request_context(data=body, query_string=query_string, headers=headers):
+                with pytest.raises(ValidationError) as error:
+                    handler(request)
+            errors.append([(e["type"], e["loc"]) for e in error.value.errors()])
+
+        assert errors[0] == errors[1] == errors[2]
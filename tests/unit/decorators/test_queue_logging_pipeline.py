@@ -0,0 +1,75 @@
+import io
+import json
+import logging
+import sys
+
+from decorators import JsonLogFormatter, QueueLoggingPipeline, inject_logger
+
+
+def make_pipeline(max_queue_size: int = 100) -> tuple[QueueLoggingPipeline, io.StringIO, logging.Logger]:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonLogFormatter())
+    pipeline = QueueLoggingPipeline(handlers=[handler], max_queue_size=max_queue_size)
+    logger = logging.getLogger(f"test_queue_logging_pipeline.{id(pipeline)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(pipeline.queue_handler)
+    return pipeline, stream, logger
+
+
+class TestQueueLoggingPipeline:
+
+    def test_records_are_written_as_structured_json_in_the_background(self):
+        pipeline, stream, logger = make_pipeline()
+        pipeline.start()
+        values = {"attempt": 1}
+        logger.info("Loaded %s", values, extra={"json_fields": {"source": "config.yaml"}})
+        values["attempt"] = 2
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed")
+        pipeline.stop()
+
+        loaded, failed = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert loaded["severity"] == "INFO"
+        assert loaded["message"] == "Loaded {'attempt': 1}"
+        assert loaded["source"] == "config.yaml"
+        assert (
+            loaded["logging.googleapis.com/sourceLocation"]["function"]
+            == "test_records_are_written_as_structured_json_in_the_background"
+        )
+        assert failed["severity"] == "ERROR"
+        assert "ValueError: boom" in failed["message"]
+
+    def test_records_beyond_the_queue_size_are_dropped_and_reported(self):
+        pipeline, stream, logger = make_pipeline(max_queue_size=2)
+        for i in range(5):
+            logger.info("record %d", i)
+        assert pipeline.dropped == 3
+
+        pipeline.start()
+        pipeline.stop()
+        messages = [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+        assert messages == ["record 0", "record 1", "3 log records were dropped because the logging queue was full."]
+
+    def test_injected_logger_is_resolved_once(self):
+        @inject_logger(logger_name="test_queue_logging_pipeline.injected")
+        def handler(logger: logging.Logger) -> logging.Logger:
+            return logger
+
+        assert handler() is handler() is logging.getLogger("test_queue_logging_pipeline.injected")
+
+    def test_injected_logger_keeps_the_pipeline_installed_at_startup(self, monkeypatch):
+        pipeline, _, _ = make_pipeline()
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [pipeline.queue_handler])
+        monkeypatch.setattr(sys.modules["decorators.inject_logger"], "_global_logger_configured", False)
+
+        @inject_logger()
+        def handler(logger: logging.Logger) -> None:
+            pass
+
+        handler()
+        assert root.handlers == [pipeline.queue_handler]
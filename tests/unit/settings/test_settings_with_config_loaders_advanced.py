@@ -46,35 +46,31 @@ class TestSettingsWithConfigLoadersAdvanced:
         bucket_name = "app-config-boilerplate"
         project_id = "nexum-dev-364711"
 
-        settings_from_env_file = Settings.load(ConfigLoaderFactory.get_loader(EnvConfigLoaderArgs(file_path=env_file)))
-        settings_from_json_file = Settings.load(ConfigLoaderFactory.get_loader(JsonConfigLoaderArgs(file_path=json_file)))
-        settings_from_yaml_file = Settings.load(ConfigLoaderFactory.get_loader(YamlConfigLoaderArgs(file_path=yaml_file)))
-
-        settings_from_env_gcp_secret = Settings.load(
-            ConfigLoaderFactory.get_loader(GcpSecretEnvConfigLoaderArgs(secret_name=env_gcp_secret_name, project_id=project_id))
-        )
-        settings_from_json_gcp_secret = Settings.load(
-            ConfigLoaderFactory.get_loader(GcpSecretJsonConfigLoaderArgs(secret_name=json_gcp_secret_name, project_id=project_id))
-        )
-        settings_from_yaml_gcp_secret = Settings.load(
-            ConfigLoaderFactory.get_loader(GcpSecretYamlConfigLoaderArgs(secret_name=yaml_gcp_secret_name, project_id=project_id))
-        )
-
-        settings_from_env_gcp_storage = Settings.load(
-            ConfigLoaderFactory.get_loader(
-                GcpStorageEnvConfigLoaderArgs(bucket_name=bucket_name, blob_name=env_file, project_id=project_id)
-            )
-        )
-        settings_from_json_gcp_storage = Settings.load(
-            ConfigLoaderFactory.get_loader(
-                GcpStorageJsonConfigLoaderArgs(bucket_name=bucket_name, blob_name=json_file, project_id=project_id)
-            )
-        )
-        settings_from_yaml_gcp_storage = Settings.load(
-            ConfigLoaderFactory.get_loader(
-                GcpStorageYamlConfigLoaderArgs(bucket_name=bucket_name, blob_name=yaml_file, project_id=project_id)
-            )
+        # The nine sources are fetched concurrently instead of one after another
+        results = ConfigLoaderFactory.load_many(
+            [
+                EnvConfigLoaderArgs(file_path=env_file),
+                JsonConfigLoaderArgs(file_path=json_file),
+                YamlConfigLoaderArgs(file_path=yaml_file),
+                GcpSecretEnvConfigLoaderArgs(secret_name=env_gcp_secret_name, project_id=project_id),
+                GcpSecretJsonConfigLoaderArgs(secret_name=json_gcp_secret_name, project_id=project_id),
+                GcpSecretYamlConfigLoaderArgs(secret_name=yaml_gcp_secret_name, project_id=project_id),
+                GcpStorageEnvConfigLoaderArgs(bucket_name=bucket_name, blob_name=env_file, project_id=project_id),
+                GcpStorageJsonConfigLoaderArgs(bucket_name=bucket_name, blob_name=json_file, project_id=project_id),
+                GcpStorageYamlConfigLoaderArgs(bucket_name=bucket_name, blob_name=yaml_file, project_id=project_id),
+            ]
         )
+        (
+            settings_from_env_file,
+            settings_from_json_file,
+            settings_from_yaml_file,
+            settings_from_env_gcp_secret,
+            settings_from_json_gcp_secret,
+            settings_from_yaml_gcp_secret,
+            settings_from_env_gcp_storage,
+            settings_from_json_gcp_storage,
+            settings_from_yaml_gcp_storage,
+        ) = [Settings(**result.unwrap()) for result in results]
 
         unified_settings.settings_from_env_file = settings_from_env_file
         unified_settings.settings_from_json_file = settings_from_json_file